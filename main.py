@@ -1,26 +1,106 @@
+import argparse
+import json
 import time
 
-from src.fishbot.core.fishing_bot import FishingBot
-from src.fishbot.core.game.hotkeys import Hotkeys
-from src.fishbot.utils.logger import log
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="BPSR Fishing Bot (headless runner)")
+    parser.add_argument("--fps", type=int, default=None, help="Target loop FPS (0 = unlimited)")
+    parser.add_argument("--capture", choices=("live", "replay"), default="live", help="Frame source")
+    parser.add_argument("--replay", metavar="PATH", help="Directory of frames or video file for --capture replay")
+    parser.add_argument("--replay-once", action="store_true", help="Stop when the replay runs out instead of looping")
+    parser.add_argument("--input", choices=("live", "mock"), default="live", help="Input backend")
+    parser.add_argument("--duration", type=float, default=0, help="Stop after N seconds (0 = unlimited)")
+    parser.add_argument("--metrics-out", metavar="PATH", help="Write perf metrics and stats as JSON on exit")
+    parser.add_argument("--no-hotkeys", action="store_true", help="Run immediately without keyboard hooks")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
-def main():
-    bot = FishingBot()
-    hotkeys = Hotkeys(bot)
+    args = parser.parse_args(argv)
+    if args.capture == "replay" and not args.replay:
+        parser.error("--capture replay requires --replay PATH")
+    return args
+
+
+def write_metrics(bot, path: str, elapsed: float):
+    report = {
+        'elapsed_seconds': round(elapsed, 3),
+        'ticks': bot.tick_count,
+        'loop_fps': round(bot.tick_count / elapsed, 2) if elapsed > 0 else 0.0,
+        'stats': bot.stats.get_extended_stats(),
+        'metrics': bot.metrics.snapshot()
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from src.fishbot.utils.startup import get_startup_profile
+    from src.fishbot.core.preload import start_preload
+    start_preload()
+
+    with get_startup_profile().step("import:bot"):
+        from src.fishbot.core.fishing_bot import FishingBot
+        from src.fishbot.utils.logger import log, flush_logs
+
+    capture_source = None
+    bot_kwargs = {}
+    if args.capture == "replay":
+        from src.fishbot.utils.replay_capture import ReplayCapture
+        capture_source = ReplayCapture(args.replay, loop=not args.replay_once)
+        width, height = capture_source.frame_size
+        bot_kwargs = {'window_mode': 'Windowed', 'custom_width': width, 'custom_height': height}
+
+    bot = FishingBot(capture_source=capture_source, input_backend=args.input, **bot_kwargs)
+
+    if args.debug:
+        bot.debug_mode = bot.config.bot.debug_mode = True
+        bot.controller.set_debug(True)
+    if args.fps is not None:
+        bot.config.bot.target_fps = args.fps
+        bot.target_delay = 1.0 / args.fps if args.fps > 0 else 0
+
+    if capture_source is not None:
+        bot.geometry.refresh_interval = 0
+
+    hotkeys = None
+    if not args.no_hotkeys and args.capture == "live" and args.input == "live":
+        from src.fishbot.core.game.hotkeys import Hotkeys
+        hotkeys = Hotkeys(bot)
 
     bot.start()
 
-    log("[INFO] Press '7' to start the bot.")
+    if hotkeys:
+        log("[INFO] Press '7' to start the bot.")
+
+    started_at = time.perf_counter()
+    try:
+        while not bot.is_stopped():
+            if args.duration > 0 and time.perf_counter() - started_at >= args.duration:
+                log(f"[INFO] Duration limit reached ({args.duration:.0f}s)")
+                break
+            if capture_source is not None and not capture_source.is_running():
+                break
+
+            if hotkeys and hotkeys.paused:
+                time.sleep(0.05)
+                continue
 
-    while not bot.is_stopped():
-        if not hotkeys.paused:
             bot.update()
+    except KeyboardInterrupt:
+        log("[INFO] Interrupted.")
+    finally:
+        elapsed = time.perf_counter() - started_at
+        bot.stop()
 
-        time.sleep(0.1)
+        if args.metrics_out:
+            write_metrics(bot, args.metrics_out, elapsed)
+            log(f"[INFO] Metrics written to {args.metrics_out}")
 
     log("[INFO] Bot finished.")
+    flush_logs()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
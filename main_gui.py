@@ -29,54 +29,50 @@ def main():
         print("Mouse/keyboard control may not work properly.")
         print("Please run as Administrator for full functionality.\n")
     
-    from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtCore import QTimer
+    from src.fishbot.utils.startup import get_startup_profile
+    startup = get_startup_profile()
     
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')
+    with startup.step("gui:qt_app"):
+        from PyQt6.QtWidgets import QApplication
+        
+        app = QApplication(sys.argv)
+        app.setStyle('Fusion')
     
-    from src.fishbot.ui.splash_screen import SplashScreen
-    splash = SplashScreen()
-    splash.show()
-    app.processEvents()
+    with startup.step("gui:splash"):
+        from src.fishbot.ui.splash_screen import SplashScreen
+        splash = SplashScreen()
+        splash.show()
+        app.processEvents()
     
     splash.set_status("Initializing application...", 5)
-    app.processEvents()
+    from src.fishbot.core.preload import start_preload
+    preload = start_preload()
     
     splash.set_status("Loading styles...", 15)
-    from src.fishbot.ui.styles import MAIN_STYLESHEET
-    app.processEvents()
+    with startup.step("import:styles"):
+        from src.fishbot.ui.styles import MAIN_STYLESHEET
     
-    splash.set_status("Loading numerical libraries...", 25)
-    import numpy
-    app.processEvents()
+    splash.set_status("Loading input controllers...", 30)
+    with startup.step("import:input"):
+        import pyautogui
+        import keyboard
     
-    splash.set_status("Loading image processing (OpenCV)...", 40)
-    import cv2
-    app.processEvents()
+    splash.set_status("Preparing main window...", 50)
+    with startup.step("import:main_window"):
+        from src.fishbot.ui.main_window import MainWindow
     
-    splash.set_status("Loading screen capture module...", 55)
-    import mss
-    app.processEvents()
-    
-    splash.set_status("Loading input controllers...", 70)
-    import pyautogui
-    import keyboard
-    app.processEvents()
-    
-    splash.set_status("Preparing main window...", 85)
-    from src.fishbot.ui.main_window import MainWindow
-    app.processEvents()
+    with startup.step("gui:wait_preload"):
+        while not preload.wait(0.02):
+            progress = 50 + 40 * preload.completed() // preload.total()
+            splash.set_status(f"Preparing detection ({preload.completed()}/{preload.total()})...", progress)
     
     splash.set_status("Starting application...", 100)
-    window = MainWindow()
-    app.processEvents()
-    
-    import time
-    time.sleep(0.15)
+    with startup.step("gui:main_window"):
+        window = MainWindow()
     
     splash.finish(window)
     window.show()
+    startup.report("GUI startup")
     
     sys.exit(app.exec())
 
@@ -25,18 +25,31 @@ class BotConfig:
         self.quick_finish_enabled = False
         self.debug_mode = False
         self.file_logging_enabled = False
+        self.event_log_enabled = False
 
         self.target_fps = 60
 
         self.default_delay = 0.3
         self.finish_wait_delay = 0.3
         self.casting_delay = 0.3
+        self.switch_delay = 0.5
         
         self.session_time_limit = 0
         
         self.async_capture_enabled = True
         
+        self.perf_metrics_enabled = True
+        
+        self.trace_enabled = False
+        self.trace_buffer_size = 100000
+        self.trace_slow_tick_ms = 250
+        
         self.retry_max_attempts = 3
         self.retry_base_delay = 0.5
         
         self.selected_monitor = 0
+        
+        self.geometry_refresh_interval = 2.0
+        
+        self.config_poll_interval = 1.0
+        self.config_reload_debounce = 0.3
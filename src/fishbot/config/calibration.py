@@ -0,0 +1,55 @@
+import json
+import os
+import threading
+
+from .paths import get_calibration_path
+from src.fishbot.utils.logger import log
+
+_lock = threading.Lock()
+
+
+def write_json_atomic(path, data, sort_keys: bool = False):
+    parent_dir = os.path.dirname(path)
+    if parent_dir:
+        os.makedirs(parent_dir, exist_ok=True)
+
+    # Readers such as the config watcher only ever see the old or the new file, never a partial one;
+    # the temp name is per writer so concurrent processes can't interleave in it
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, sort_keys=sort_keys)
+    os.replace(temp_path, path)
+
+
+def load_calibration(width: int, height: int) -> dict:
+    path = get_calibration_path(width, height)
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception as e:
+        log(f"[CALIBRATION] Failed to load {path}: {e}")
+        return {}
+
+
+def load_calibration_section(width: int, height: int, section: str) -> dict:
+    data = load_calibration(width, height).get(section, {})
+    return data if isinstance(data, dict) else {}
+
+
+def save_calibration_section(width: int, height: int, section: str, values: dict) -> bool:
+    path = get_calibration_path(width, height)
+
+    with _lock:
+        data = load_calibration(width, height)
+        data[section] = values
+
+        try:
+            write_json_atomic(path, data, sort_keys=True)
+            return True
+        except Exception as e:
+            log(f"[CALIBRATION] Failed to save {path}: {e}")
+            return False
@@ -1,55 +1,131 @@
 from .paths import TEMPLATES_PATH, get_user_rois_path, USER_ROIS_PATH
+from .calibration import load_calibration_section, save_calibration_section, write_json_atomic
+from src.fishbot.utils.logger import log, debug
 from collections import deque
 from typing import Dict, Optional
 
 
+class _ThresholdWindow:
+    __slots__ = ('history', 'success_sum', 'success_count', 'failure_sum', 'failure_count')
+
+    def __init__(self, history_size: int):
+        self.history = deque(maxlen=history_size)
+        self.success_sum = 0.0
+        self.success_count = 0
+        self.failure_sum = 0.0
+        self.failure_count = 0
+
+    def add(self, success: bool, confidence: float):
+        history = self.history
+        if len(history) == history.maxlen:
+            old_success, old_confidence = history[0]
+            if old_success:
+                self.success_sum -= old_confidence
+                self.success_count -= 1
+            else:
+                self.failure_sum -= old_confidence
+                self.failure_count -= 1
+
+        history.append((success, confidence))
+        if success:
+            self.success_sum += confidence
+            self.success_count += 1
+        else:
+            self.failure_sum += confidence
+            self.failure_count += 1
+
+
 class AdaptiveThreshold:
     def __init__(self, base_precision: float = 0.65, history_size: int = 20, min_precision: float = 0.50, max_precision: float = 0.85):
         self.base_precision = base_precision
         self.history_size = history_size
         self.min_precision = min_precision
         self.max_precision = max_precision
-        self._history: Dict[str, deque] = {}
+        self.dirty = False
+        self._history: Dict[str, _ThresholdWindow] = {}
         self._current_precision: Dict[str, float] = {}
+        self._base_precisions: Dict[str, float] = {}
+
+    def set_base_precisions(self, precisions: Dict[str, float]):
+        self._base_precisions = dict(precisions)
+
+    def get_base_precision(self, template_name: str) -> float:
+        return self._base_precisions.get(template_name, self.base_precision)
 
     def record_result(self, template_name: str, success: bool, confidence: float):
-        if template_name not in self._history:
-            self._history[template_name] = deque(maxlen=self.history_size)
-            self._current_precision[template_name] = self.base_precision
+        window = self._history.get(template_name)
+        if window is None:
+            window = self._history[template_name] = _ThresholdWindow(self.history_size)
+            self._current_precision.setdefault(template_name, self.get_base_precision(template_name))
         
-        self._history[template_name].append((success, confidence))
+        window.add(success, confidence)
         
-        if len(self._history[template_name]) >= 5:
-            self._adjust_threshold(template_name)
+        if len(window.history) >= 5:
+            self._adjust_threshold(template_name, window)
 
-    def _adjust_threshold(self, template_name: str):
-        history = self._history[template_name]
-        if not history:
+    def _adjust_threshold(self, template_name: str, window: _ThresholdWindow):
+        if not window.success_count:
             return
         
-        successes = [conf for success, conf in history if success]
-        failures = [conf for success, conf in history if not success]
+        avg_success_conf = window.success_sum / window.success_count
         
-        if not successes:
-            return
-        
-        avg_success_conf = sum(successes) / len(successes)
-        
-        if failures:
-            avg_failure_conf = sum(failures) / len(failures)
+        if window.failure_count:
+            avg_failure_conf = window.failure_sum / window.failure_count
             new_precision = (avg_success_conf + avg_failure_conf) / 2 - 0.05
         else:
             new_precision = avg_success_conf - 0.10
         
-        new_precision = max(self.min_precision, min(self.max_precision, new_precision))
+        # A calibrated base outside the default bounds widens them instead of being clamped away
+        base = self.get_base_precision(template_name)
+        new_precision = max(min(self.min_precision, base), min(max(self.max_precision, base), new_precision))
         self._current_precision[template_name] = new_precision
+        self.dirty = True
 
     def get_precision(self, template_name: str) -> float:
-        return self._current_precision.get(template_name, self.base_precision)
+        precision = self._current_precision.get(template_name)
+        if precision is None:
+            return self._base_precisions.get(template_name, self.base_precision)
+        return precision
+
+    def get_state(self) -> Dict[str, float]:
+        return {name: round(precision, 4) for name, precision in self._current_precision.items()}
+
+    def load_state(self, thresholds: Dict[str, float]):
+        for name, precision in thresholds.items():
+            try:
+                precision = float(precision)
+            except (TypeError, ValueError):
+                continue
+            base = self.get_base_precision(name)
+            self._current_precision[name] = max(min(self.min_precision, base), min(max(self.max_precision, base), precision))
+        self.dirty = False
 
     def reset(self):
         self._history.clear()
         self._current_precision.clear()
+        self.dirty = False
+
+
+DEFAULT_TEMPLATES = {
+    "fishing_spot_btn": "fishing_spot_btn.png",
+    "broken_rod": "broken_rod.png",
+    "new_rod": "new_rod.png",
+    "reg_rod": "reg_pole.png",
+    "sturdy_rod": "sturdy_pole.png",
+    "flex_rod": "flex_pole.png",
+    "exclamation": "exclamation.png",
+    "left_arrow": "left_arrow.png",
+    "right_arrow": "right_arrow.png",
+    "failure": "fish_escaped.png",
+    "success": "success.png",
+    "continue": "continue.png",
+    "level_check": "level_check.png",
+    "connect_server": "connect.png"
+}
+
+TEMPLATE_GROUPS = {
+    "rod": ("flex_rod", "sturdy_rod", "reg_rod"),
+}
 
 
 class DetectionConfig:
@@ -59,33 +135,41 @@ class DetectionConfig:
     def __init__(self):
         self.precision = 0.65
         self.adaptive_threshold = AdaptiveThreshold(base_precision=self.precision)
+        self.calibrated_thresholds = {}
         self.use_adaptive_threshold = True
+        self.persist_adaptive_threshold = True
+        self.persist_calibration = True
+
+        self.roi_autotune_enabled = True
+        self.roi_autotune_apply = False
+        self.roi_autotune_min_samples = 50
+        self.roi_autotune_margin = 8
+
+        self.matcher_autoselect = False
+        self.matchers = {}
+
+        self.early_reject_enabled = True
+        self.early_reject_threshold = 0.7
+        self.rejectors = {}
+
+        self.bite_colour_detection = False
+        self.colour_gate_templates = ["exclamation"]
+        self.colour_gate_min_fraction = 0.5
+
+        self.roi_discovery_enabled = True
+        self.ui_scale = None
+        self.discovery_pending = False
 
         self.templates_path = str(TEMPLATES_PATH)
 
-        self.templates = {
-            "fishing_spot_btn": "fishing_spot_btn.png",
-            "broken_rod": "broken_rod.png",
-            "new_rod": "new_rod.png",
-            "reg_rod": "reg_pole.png",
-            "sturdy_rod": "sturdy_pole.png",
-            "flex_rod": "flex_pole.png",
-            "exclamation": "exclamation.png",
-            "left_arrow": "left_arrow.png",
-            "right_arrow": "right_arrow.png",
-            "failure": "fish_escaped.png",
-            "success": "success.png",
-            "continue": "continue.png",
-            "level_check": "level_check.png",
-            "connect_server": "connect.png"
-        }
+        self.templates = dict(DEFAULT_TEMPLATES)
+        self.template_groups = {group: list(variants) for group, variants in TEMPLATE_GROUPS.items()}
+        self._add_group_variants()
 
         self._base_rois = {
             "fishing_spot_btn": (1400, 540, 121, 55),
             "broken_rod": (1635, 982, 250, 63),
-            "reg_rod": (1638, 985, 210, 33),
-            "sturdy_rod": (1637, 984, 194, 37),
-            "flex_rod": (1637, 984, 204, 36),
+            "rod": (1637, 984, 211, 37),
             "new_rod": (1624, 563, 185, 65),
             "exclamation": (929, 438, 52, 142),
             "left_arrow": (740, 490, 220, 100),
@@ -98,6 +182,8 @@ class DetectionConfig:
         }
         
         self.rois = self._base_rois.copy()
+        self.search_radii = {}
+        self.version = 0
         
         self._current_width = self.BASE_WIDTH
         self._current_height = self.BASE_HEIGHT
@@ -105,9 +191,31 @@ class DetectionConfig:
         self._ensure_default_rois_file()
         self.user_rois = self.load_user_rois()
         self._apply_user_rois()
+        self.load_calibrated_thresholds()
+        self.load_thresholds()
+        self.load_search_radii()
+        self.load_matchers()
+        self.load_rejectors()
+        self.load_ui_layout()
         
         self._on_reload_callback = None
 
+    def _add_group_variants(self):
+        import os
+        
+        if not os.path.isdir(self.templates_path):
+            return
+        
+        for filename in sorted(os.listdir(self.templates_path)):
+            name, ext = os.path.splitext(filename)
+            if ext.lower() != '.png' or name in self.templates:
+                continue
+            for group, variants in self.template_groups.items():
+                if name.startswith(f"{group}_"):
+                    self.templates[name] = filename
+                    variants.append(name)
+                    debug("[DETECTION] Added '%s' to template group '%s'", name, group)
+
     def set_reload_callback(self, callback):
         self._on_reload_callback = callback
 
@@ -125,40 +233,121 @@ class DetectionConfig:
     def get_precision_for_template(self, template_name: str) -> float:
         if self.use_adaptive_threshold:
             return self.adaptive_threshold.get_precision(template_name)
-        return self.precision
+        return self.calibrated_thresholds.get(template_name, self.precision)
 
     def record_detection_result(self, template_name: str, success: bool, confidence: float):
         if self.use_adaptive_threshold:
             self.adaptive_threshold.record_result(template_name, success, confidence)
+
+    def load_calibrated_thresholds(self):
+        thresholds = load_calibration_section(self._current_width, self._current_height, "calibrated_thresholds")
+        self.calibrated_thresholds = {name: float(value) for name, value in thresholds.items()
+                                      if isinstance(value, (int, float)) and 0 < value < 1}
+        self.adaptive_threshold.set_base_precisions(self.calibrated_thresholds)
+        if self.calibrated_thresholds:
+            log("[DETECTION] Using %d calibrated thresholds for %dx%d", "INFO",
+                (len(self.calibrated_thresholds), self._current_width, self._current_height))
+
+    def load_thresholds(self):
+        if not self.persist_adaptive_threshold:
+            return
+        
+        thresholds = load_calibration_section(self._current_width, self._current_height, "thresholds")
+        if thresholds:
+            self.adaptive_threshold.load_state(thresholds)
+            log("[DETECTION] Warm start: %d learned thresholds for %dx%d", "INFO",
+                (len(thresholds), self._current_width, self._current_height))
+
+    def load_search_radii(self):
+        radii = load_calibration_section(self._current_width, self._current_height, "radii")
+        self.search_radii = {name: int(radius) for name, radius in radii.items()
+                             if isinstance(radius, (int, float)) and radius >= 0}
+        if self.search_radii:
+            log("[DETECTION] Using %d calibrated search radii for %dx%d", "INFO",
+                (len(self.search_radii), self._current_width, self._current_height))
+
+    def load_matchers(self):
+        matchers = load_calibration_section(self._current_width, self._current_height, "matchers")
+        self.matchers = {name: matcher for name, matcher in matchers.items() if isinstance(matcher, str)}
+
+    def load_rejectors(self):
+        rejectors = load_calibration_section(self._current_width, self._current_height, "rejectors")
+        self.rejectors = {name: entry for name, entry in rejectors.items() if isinstance(entry, dict)}
+
+    def is_rejector_enabled(self, name: str) -> bool:
+        return self.rejectors.get(name, {}).get('enabled', True)
+
+    def disable_rejector(self, name: str, reason: str, false_rejects: int = 1):
+        self.rejectors[name] = {'enabled': False, 'reason': reason, 'false_rejects': false_rejects}
+        self._save_section("rejectors", dict(self.rejectors))
+
+    def load_ui_layout(self):
+        layout = load_calibration_section(self._current_width, self._current_height, "ui")
+        scale = layout.get('scale')
+        self.ui_scale = float(scale) if isinstance(scale, (int, float)) and scale > 0 else None
+
+    def get_template_scale(self) -> float:
+        if self.ui_scale:
+            return self.ui_scale
+        return min(self._current_width / self.BASE_WIDTH, self._current_height / self.BASE_HEIGHT)
+
+    def get_default_rois(self) -> dict:
+        return dict(self._base_rois)
+
+    def apply_discovery(self, scale: float, offset: tuple, rois: dict, found: dict):
+        layout = {'scale': round(scale, 4), 'offset': list(offset), 'found': found}
+        self.ui_scale = layout['scale']
+        self.discovery_pending = False
+        user_rois = {**self.user_rois, **{name: list(roi) for name, roi in rois.items()}}
+        if self._save_section("ui", layout):
+            self.save_user_rois(user_rois)
+        else:
+            self.user_rois = user_rois
+            self._apply_user_rois()
+
+    def _save_section(self, section: str, values: dict) -> bool:
+        if not self.persist_calibration:
+            return False
+        return save_calibration_section(self._current_width, self._current_height, section, values)
+
+    def save_thresholds(self):
+        if not self.persist_adaptive_threshold or not self.adaptive_threshold.dirty:
+            return
+        
+        thresholds = self.adaptive_threshold.get_state()
+        if save_calibration_section(self._current_width, self._current_height, "thresholds", thresholds):
+            self.adaptive_threshold.dirty = False
+            log("[DETECTION] Saved %d learned thresholds for %dx%d", "INFO",
+                (len(thresholds), self._current_width, self._current_height))
     
+    def _scaled_default_rois(self) -> dict:
+        scale_x = self._current_width / self.BASE_WIDTH
+        scale_y = self._current_height / self.BASE_HEIGHT
+        
+        default_rois = {}
+        for name, roi in self._base_rois.items():
+            if roi is not None:
+                x, y, w, h = roi
+                default_rois[name] = [
+                    int(x * scale_x),
+                    int(y * scale_y),
+                    int(w * scale_x),
+                    int(h * scale_y)
+                ]
+        return default_rois
+
+    def _has_default_rois(self) -> bool:
+        default_rois = self._scaled_default_rois()
+        return all(list(roi) == default_rois[name] for name, roi in self.user_rois.items() if name in default_rois)
+
     def _ensure_default_rois_file(self):
-        import json
         import os
         
         rois_path = get_user_rois_path(self._current_width, self._current_height)
         
         if not os.path.exists(rois_path):
-            scale_x = self._current_width / self.BASE_WIDTH
-            scale_y = self._current_height / self.BASE_HEIGHT
-            
-            default_rois = {}
-            for name, roi in self._base_rois.items():
-                if roi is not None:
-                    x, y, w, h = roi
-                    default_rois[name] = [
-                        int(x * scale_x),
-                        int(y * scale_y),
-                        int(w * scale_x),
-                        int(h * scale_y)
-                    ]
-            
             try:
-                parent_dir = os.path.dirname(rois_path)
-                if parent_dir:
-                    os.makedirs(parent_dir, exist_ok=True)
-                
-                with open(rois_path, 'w') as f:
-                    json.dump(default_rois, f, indent=4)
+                write_json_atomic(rois_path, self._scaled_default_rois())
                 print(f"[DETECTION] Created ROIs file for {self._current_width}x{self._current_height}: {rois_path}")
             except Exception as e:
                 print(f"[DETECTION] Failed to create ROIs file: {e}")
@@ -166,6 +355,9 @@ class DetectionConfig:
     def update_resolution(self, width: int, height: int):
         resolution_changed = (width != self._current_width or height != self._current_height)
         
+        if resolution_changed:
+            self.save_thresholds()
+        
         self._current_width = width
         self._current_height = height
         
@@ -193,6 +385,17 @@ class DetectionConfig:
         if resolution_changed:
             self._ensure_default_rois_file()
             self.user_rois = self.load_user_rois()
+            self.adaptive_threshold.reset()
+            self.load_calibrated_thresholds()
+            self.load_thresholds()
+            self.load_search_radii()
+            self.load_matchers()
+            self.load_rejectors()
+            self.load_ui_layout()
+            # Hand-edited or calibrated ROIs are kept; only untouched scaled defaults need the UI located
+            self.discovery_pending = (self.ui_scale is None and self.roi_discovery_enabled
+                                      and (width, height) != (self.BASE_WIDTH, self.BASE_HEIGHT)
+                                      and self._has_default_rois())
             
         self._apply_user_rois()
         
@@ -235,18 +438,10 @@ class DetectionConfig:
         return {}
             
     def save_user_rois(self, rois: dict):
-        import json
-        import os
-        
         rois_path = get_user_rois_path(self._current_width, self._current_height)
         
         try:
-            parent_dir = os.path.dirname(rois_path)
-            if parent_dir:
-                os.makedirs(parent_dir, exist_ok=True)
-            
-            with open(rois_path, 'w') as f:
-                json.dump(rois, f, indent=4)
+            write_json_atomic(rois_path, rois)
             print(f"[DETECTION] Custom ROIs saved for {self._current_width}x{self._current_height}")
             
             self.user_rois = rois
@@ -256,10 +451,15 @@ class DetectionConfig:
             print(f"[DETECTION] Failed to save user ROIs: {e}")
 
     def _apply_user_rois(self):
+        self.version += 1
         if not self.user_rois:
             return
-            
+        
+        applied = 0
         for name, roi in self.user_rois.items():
             if name in self.rois:
                 self.rois[name] = tuple(roi)
-                print(f"[DETECTION] Applied custom ROI for '{name}': {roi}")
\ No newline at end of file
+                debug("[DETECTION] Applied custom ROI for '%s': %s", name, roi)
+                applied += 1
+        
+        log("[DETECTION] Applied %d custom ROIs for %dx%d", "INFO", (applied, self._current_width, self._current_height))
@@ -18,5 +18,10 @@ TEMPLATES_PATH = ASSETS_DIR / "templates"
 
 USER_ROIS_PATH = EXTERNAL_BASE / "user_rois.json"
 
+BOT_SETTINGS_PATH = EXTERNAL_BASE / "bot_settings.json"
+
 def get_user_rois_path(width: int, height: int) -> Path:
-    return EXTERNAL_BASE / f"user_rois_{width}x{height}.json"
\ No newline at end of file
+    return EXTERNAL_BASE / f"user_rois_{width}x{height}.json"
+
+def get_calibration_path(width: int, height: int) -> Path:
+    return EXTERNAL_BASE / f"calibration_{width}x{height}.json"
\ No newline at end of file
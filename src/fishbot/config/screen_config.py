@@ -1,5 +1,5 @@
-import pywinctl as pwc
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Tuple
 
 try:
     import mss
@@ -7,7 +7,23 @@ except ImportError:
     mss = None
 
 
-def get_available_monitors() -> List[Dict]:
+_monitor_cache: Optional[List[Dict]] = None
+_monitor_lock = threading.Lock()
+_monitor_warning_shown = False
+
+
+def get_available_monitors(refresh: bool = True) -> List[Dict]:
+    global _monitor_cache
+
+    with _monitor_lock:
+        if _monitor_cache is None or refresh:
+            _monitor_cache = _enumerate_monitors()
+        return list(_monitor_cache)
+
+
+def _enumerate_monitors() -> List[Dict]:
+    global _monitor_warning_shown
+
     monitors = []
     
     if mss:
@@ -25,7 +41,9 @@ def get_available_monitors() -> List[Dict]:
                         'height': mon['height']
                     })
         except Exception as e:
-            print(f"[SCREEN] Failed to enumerate monitors: {e}")
+            if not _monitor_warning_shown:
+                _monitor_warning_shown = True
+                print(f"[SCREEN] Failed to enumerate monitors: {e}")
     
     if not monitors:
         monitors.append({
@@ -40,6 +58,22 @@ def get_available_monitors() -> List[Dict]:
     return monitors
 
 
+_window_warning_shown = False
+
+
+def get_all_windows() -> list:
+    global _window_warning_shown
+
+    try:
+        import pywinctl as pwc
+        return pwc.getAllWindows()
+    except Exception as e:
+        if not _window_warning_shown:
+            _window_warning_shown = True
+            print(f"[SCREEN] Window enumeration unavailable: {e}")
+        return []
+
+
 class ScreenConfig:
     def __init__(self, detection_config=None, window_mode: str = 'Auto Detect', 
                  custom_width: int = 1920, custom_height: int = 1080,
@@ -55,7 +89,7 @@ class ScreenConfig:
         self._custom_height = custom_height
         self._selected_monitor = selected_monitor
         
-        self._available_monitors = get_available_monitors()
+        self._available_monitors = get_available_monitors(refresh=False)
 
         self._apply_window_mode()
 
@@ -70,102 +104,111 @@ class ScreenConfig:
     def get_selected_monitor(self) -> int:
         return self._selected_monitor
 
+    def _get_monitor(self, monitors: List[Dict]) -> Optional[Dict]:
+        if self._selected_monitor < len(monitors):
+            return monitors[self._selected_monitor]
+        return None
+
     def get_monitor_offset(self) -> tuple:
-        if self._selected_monitor < len(self._available_monitors):
-            mon = self._available_monitors[self._selected_monitor]
+        mon = self._get_monitor(self._available_monitors)
+        if mon:
             return mon['left'], mon['top']
         return 0, 0
 
     def get_monitor_resolution(self) -> tuple:
-        if self._selected_monitor < len(self._available_monitors):
-            mon = self._available_monitors[self._selected_monitor]
+        mon = self._get_monitor(self._available_monitors)
+        if mon:
             return mon['width'], mon['height']
         return 1920, 1080
 
+    def get_geometry(self) -> tuple:
+        return self.monitor_x, self.monitor_y, self.monitor_width, self.monitor_height
+
+    def probe(self) -> Tuple[tuple, List[Dict]]:
+        monitors = get_available_monitors(refresh=True)
+        geometry, _ = self._compute_geometry(monitors)
+        return geometry, monitors
+
+    def apply_geometry(self, geometry: tuple, monitors: List[Dict] = None, force: bool = True):
+        if monitors is not None:
+            self._available_monitors = monitors
+        resized = geometry[2:] != (self.monitor_width, self.monitor_height)
+        self.monitor_x, self.monitor_y, self.monitor_width, self.monitor_height = geometry
+
+        if self._detection_config and (resized or force):
+            self._detection_config.update_resolution(self.monitor_width, self.monitor_height)
+
     def _apply_window_mode(self):
+        geometry, messages = self._compute_geometry(self._available_monitors)
+        for message in messages:
+            print(message)
+
+        if messages:
+            self.apply_geometry(geometry)
+
+    def _compute_geometry(self, monitors: List[Dict]) -> Tuple[tuple, List[str]]:
         if self._window_mode == 'Auto Detect':
-            self._detect_window()
+            return self._detect_window(monitors)
         elif self._window_mode == 'Fullscreen':
-            self._use_fullscreen()
+            return self._use_fullscreen(monitors)
         elif self._window_mode == 'Windowed':
-            self._use_custom_resolution()
+            return self._use_custom_resolution(monitors)
+        return self.get_geometry(), []
     
-    def _use_fullscreen(self):
-        if self._selected_monitor < len(self._available_monitors):
-            mon = self._available_monitors[self._selected_monitor]
-            self.monitor_x = mon['left']
-            self.monitor_y = mon['top']
-            self.monitor_width = mon['width']
-            self.monitor_height = mon['height']
+    def _use_fullscreen(self, monitors: List[Dict]) -> Tuple[tuple, List[str]]:
+        mon = self._get_monitor(monitors)
+        if mon:
+            geometry = (mon['left'], mon['top'], mon['width'], mon['height'])
         else:
-            self.monitor_x = 0
-            self.monitor_y = 0
-            self.monitor_width = 1920
-            self.monitor_height = 1080
+            geometry = (0, 0, 1920, 1080)
             
-        print(f"[SCREEN] Fullscreen mode on Monitor {self._selected_monitor + 1}: {self.monitor_width}x{self.monitor_height}")
-        
-        if self._detection_config:
-            self._detection_config.update_resolution(self.monitor_width, self.monitor_height)
+        return geometry, [f"[SCREEN] Fullscreen mode on Monitor {self._selected_monitor + 1}: {geometry[2]}x{geometry[3]}"]
     
-    def _use_custom_resolution(self):
-        offset_x, offset_y = self.get_monitor_offset()
-        self.monitor_x = offset_x
-        self.monitor_y = offset_y
-        self.monitor_width = self._custom_width
-        self.monitor_height = self._custom_height
+    def _use_custom_resolution(self, monitors: List[Dict]) -> Tuple[tuple, List[str]]:
+        mon = self._get_monitor(monitors)
+        monitor_x, monitor_y = (mon['left'], mon['top']) if mon else (0, 0)
+        messages = []
         
-        windows = pwc.getAllWindows()
-        for window in windows:
+        for window in get_all_windows():
             if "Blue Protocol" in window.title:
-                (self.monitor_x, self.monitor_y) = window.topleft
-                if self.monitor_x > 0 or self.monitor_y > 0:
-                    self.monitor_y = self.monitor_y + 32
-                    self.monitor_x = self.monitor_x + 8
-                print(f"[SCREEN] Window found at ({self.monitor_x}, {self.monitor_y})")
+                (monitor_x, monitor_y) = window.topleft
+                if monitor_x > 0 or monitor_y > 0:
+                    monitor_y = monitor_y + 32
+                    monitor_x = monitor_x + 8
+                messages.append(f"[SCREEN] Window found at ({monitor_x}, {monitor_y})")
                 break
         
-        print(f"[SCREEN] Custom resolution: {self.monitor_width}x{self.monitor_height}")
-        
-        if self._detection_config:
-            self._detection_config.update_resolution(self.monitor_width, self.monitor_height)
-
-    def _detect_window(self):
-        windows = pwc.getAllWindows()
-        
-        mon_x, mon_y = self.get_monitor_offset()
-        mon_w, mon_h = self.get_monitor_resolution()
+        messages.append(f"[SCREEN] Custom resolution: {self._custom_width}x{self._custom_height}")
+        return (monitor_x, monitor_y, self._custom_width, self._custom_height), messages
 
-        for window in windows:
+    def _detect_window(self, monitors: List[Dict]) -> Tuple[tuple, List[str]]:
+        for window in get_all_windows():
             if "Blue Protocol: Star Resonance" in window.title:
-                (self.monitor_x, self.monitor_y) = window.topleft
-                (self.monitor_width, self.monitor_height) = window.size
+                (monitor_x, monitor_y) = window.topleft
+                (monitor_width, monitor_height) = window.size
                 
-                if self.monitor_x > 0 or self.monitor_y > 0:
-                    self.monitor_y = self.monitor_y + 32
-                    self.monitor_x = self.monitor_x + 8
-                    self.monitor_width = self.monitor_width - 16
-                    self.monitor_height = self.monitor_height - 39
-
-                    print(f"[SCREEN] Game window detected at ({self.monitor_x}, {self.monitor_y})")
-                    print(f"[SCREEN] Window size: {self.monitor_width}x{self.monitor_height}")
+                if monitor_x > 0 or monitor_y > 0:
+                    monitor_y = monitor_y + 32
+                    monitor_x = monitor_x + 8
+                    monitor_width = monitor_width - 16
+                    monitor_height = monitor_height - 39
+
+                    messages = [
+                        f"[SCREEN] Game window detected at ({monitor_x}, {monitor_y})",
+                        f"[SCREEN] Window size: {monitor_width}x{monitor_height}"
+                    ]
                 else:
-                    print(f"[SCREEN] Fullscreen mode detected: {self.monitor_width}x{self.monitor_height}")
-                
-                if self._detection_config:
-                    self._detection_config.update_resolution(self.monitor_width, self.monitor_height)
+                    messages = [f"[SCREEN] Fullscreen mode detected: {monitor_width}x{monitor_height}"]
                 
-                return
+                return (monitor_x, monitor_y, monitor_width, monitor_height), messages
         
-        self.monitor_x = mon_x
-        self.monitor_y = mon_y
-        self.monitor_width = mon_w
-        self.monitor_height = mon_h
-        
-        print(f"[SCREEN] Window not found. Using Monitor {self._selected_monitor + 1} resolution: {mon_w}x{mon_h}")
+        mon = self._get_monitor(monitors)
+        if mon:
+            geometry = (mon['left'], mon['top'], mon['width'], mon['height'])
+        else:
+            geometry = (0, 0, 1920, 1080)
         
-        if self._detection_config:
-            self._detection_config.update_resolution(self.monitor_width, self.monitor_height)
+        return geometry, [f"[SCREEN] Window not found. Using Monitor {self._selected_monitor + 1} resolution: {geometry[2]}x{geometry[3]}"]
 
     def refresh_window_position(self):
         self._apply_window_mode()
@@ -1,8 +1,12 @@
+import json
+import os
+import threading
 import time
 
 from src.fishbot.config import Config
 from src.fishbot.core.game.controller import GameController
 from src.fishbot.core.game.detector import Detector
+from src.fishbot.core.geometry import GeometryService
 from src.fishbot.core.interceptors.level_check_interceptor import LevelCheckInterceptor
 from src.fishbot.core.state.impl.casting_bait_state import CastingBaitState
 from src.fishbot.core.state.impl.checking_rod_state import CheckingRodState
@@ -13,24 +17,61 @@ from src.fishbot.core.state.impl.waiting_for_bite_state import WaitingForBiteSta
 from src.fishbot.core.state.state_machine import StateMachine
 from src.fishbot.core.state.state_type import StateType
 from src.fishbot.core.stats import StatsTracker
-from src.fishbot.utils.logger import log, set_debug_mode
+from src.fishbot.utils.logger import log, log_throttled, set_debug_mode, flush_logs
+from src.fishbot.utils.perf_metrics import PerfMetrics
+from src.fishbot.utils.tracer import get_tracer
+from src.fishbot.utils.event_log import emit_event, setup_event_logging, disable_event_logging, is_event_logging_enabled
 from src.fishbot.utils.config_watcher import ConfigWatcher
-from src.fishbot.config.paths import get_user_rois_path
+from src.fishbot.utils.startup import get_startup_profile
+from src.fishbot.config.paths import get_user_rois_path, BOT_SETTINGS_PATH
+
+
+SETTING_ALIASES = {
+    'quick_finish': 'quick_finish_enabled',
+}
+
+DETECTION_SETTINGS = ('precision', 'use_adaptive_threshold', 'persist_adaptive_threshold', 'persist_calibration',
+                      'roi_autotune_apply', 'bite_colour_detection', 'matcher_autoselect', 'early_reject_enabled',
+                      'early_reject_threshold')
 
 
 class FishingBot:
-    def __init__(self, window_mode: str = 'Auto Detect', custom_width: int = 1920, custom_height: int = 1080):
-        self.config = Config(
-            window_mode=window_mode,
-            custom_width=custom_width,
-            custom_height=custom_height
+    def __init__(self, window_mode: str = 'Auto Detect', custom_width: int = 1920, custom_height: int = 1080,
+                 capture_source=None, input_backend: str = 'live'):
+        startup = get_startup_profile()
+        with startup.step("bot:config"):
+            self.config = Config(
+                window_mode=window_mode,
+                custom_width=custom_width,
+                custom_height=custom_height
+            )
+        self.geometry = GeometryService(
+            self.config.bot.screen,
+            refresh_interval=getattr(self.config.bot, 'geometry_refresh_interval', 2.0)
         )
+        if getattr(self.config.bot, 'event_log_enabled', False) and not is_event_logging_enabled():
+            setup_event_logging()
+
         self.stats = StatsTracker()
+        self.metrics = PerfMetrics(enabled=getattr(self.config.bot, 'perf_metrics_enabled', True))
+        self.tracer = get_tracer()
+        self.configure_tracing(
+            enabled=getattr(self.config.bot, 'trace_enabled', False),
+            slow_tick_ms=getattr(self.config.bot, 'trace_slow_tick_ms', 250)
+        )
         self.log = log
+        self.log_throttled = log_throttled
 
         use_async = getattr(self.config.bot, 'async_capture_enabled', True)
-        self.detector = Detector(self.config, use_async=use_async)
-        self.controller = GameController(self.config)
+        with startup.step("bot:detector"):
+            self.detector = Detector(self.config, use_async=use_async, metrics=self.metrics, capture_source=capture_source)
+        self.geometry.add_listener(self.detector.on_geometry_changed)
+        with startup.step("bot:controller"):
+            if input_backend == 'mock':
+                from src.fishbot.core.game.mock_controller import MockController
+                self.controller = MockController(self.config, metrics=self.metrics)
+            else:
+                self.controller = GameController(self.config, metrics=self.metrics)
         self.state_machine = StateMachine(self)
 
         self.level_check_interceptor = LevelCheckInterceptor(self)
@@ -45,10 +86,39 @@ class FishingBot:
         if self.config.bot.target_fps > 0:
             self.target_delay = 1.0 / self.config.bot.target_fps
 
-        self._register_states()
+        with startup.step("bot:states"):
+            self._register_states()
+        self._handle_stage_names = {state: f"handle:{state.name}" for state in StateType}
+        self.tick_count = 0
+        self.thread_cpu_time = 0.0
+        self._last_perf_sample = None
         
+        self.reload_failures = 0
+        self._pending_reload = set()
+        self._pending_reload_since = 0.0
+        self._reload_lock = threading.Lock()
+        self._template_paths = {
+            os.path.abspath(str(self.config.get_template_path(name))): name
+            for name in self.config.bot.detection.templates
+        }
+        if BOT_SETTINGS_PATH.exists():
+            self.apply_settings_file()
+
         self._config_watcher = None
         self._setup_config_watcher()
+        self.geometry.add_listener(self._on_geometry_changed)
+
+    def configure_tracing(self, enabled: bool, slow_tick_ms: float = None):
+        self.tracer.configure(
+            enabled=enabled,
+            capacity=getattr(self.config.bot, 'trace_buffer_size', 100000),
+            slow_tick_ms=slow_tick_ms
+        )
+        if enabled:
+            log(f"[BOT] Tracing enabled (slow tick threshold: {self.tracer.slow_tick_ms} ms)")
+
+    def dump_trace(self):
+        return self.tracer.flush()
 
     def _setup_config_watcher(self):
         try:
@@ -56,21 +126,115 @@ class FishingBot:
             rois_path = get_user_rois_path(width, height)
             
             self._config_watcher = ConfigWatcher(
-                file_path=rois_path,
+                file_path=[rois_path, BOT_SETTINGS_PATH, *self._template_paths],
                 callback=self._on_config_changed,
-                poll_interval=2.0
+                poll_interval=getattr(self.config.bot, 'config_poll_interval', 1.0),
+                debounce=getattr(self.config.bot, 'config_reload_debounce', 0.3)
             )
             self._config_watcher.start()
-            log("[BOT] Config hot reload enabled")
+            log(f"[BOT] Config hot reload enabled ({self._config_watcher.backend_name})")
         except Exception as e:
             log(f"[BOT] Config watcher failed: {e}")
 
-    def _on_config_changed(self):
+    def _on_geometry_changed(self, old: tuple, new: tuple):
+        if old[2:] != new[2:] and self._config_watcher:
+            self._config_watcher.set_path(get_user_rois_path(old[2], old[3]), get_user_rois_path(new[2], new[3]))
+
+    def _on_config_changed(self, changed: set, first_change: float):
+        with self._reload_lock:
+            if not self._pending_reload:
+                self._pending_reload_since = first_change
+            self._pending_reload |= changed
+
+    def _apply_pending_reload(self):
+        with self._reload_lock:
+            changed = self._pending_reload
+            since = self._pending_reload_since
+            self._pending_reload = set()
+
+        start = time.perf_counter()
+        applied, failed = [], []
+        width, height = self.config.bot.detection.get_current_resolution()
+
+        if os.path.abspath(get_user_rois_path(width, height)) in changed:
+            try:
+                self.config.bot.detection.reload_config()
+                applied.append("rois")
+            except Exception as e:
+                failed.append("rois")
+                log(f"[BOT] ❌ ROI reload failed: {e}")
+
+        template_names = [self._template_paths[path] for path in changed if path in self._template_paths]
+        if template_names:
+            failed_templates = self.detector.reload_templates(template_names)
+            failed.extend(failed_templates)
+            reloaded = len(template_names) - len(failed_templates)
+            if reloaded:
+                applied.append(f"{reloaded} template(s)")
+
+        if os.path.abspath(BOT_SETTINGS_PATH) in changed:
+            if self.apply_settings_file():
+                applied.append("settings")
+            else:
+                failed.append("settings")
+
+        end = time.perf_counter()
+        self.metrics.record("config_reload", end - start)
+        self.reload_failures += len(failed)
+
+        if applied:
+            log(f"[BOT] ⚡ Reloaded {', '.join(applied)} in {(end - start) * 1000:.1f} ms "
+                f"({(end - since) * 1000:.0f} ms after change)")
+        if failed:
+            log(f"[BOT] ⚠️ Reload failed for: {', '.join(failed)} (total failures: {self.reload_failures})")
+        emit_event(
+            "config_reload", applied=applied, failed=failed,
+            apply_ms=round((end - start) * 1000, 3), latency_ms=round((end - since) * 1000, 3)
+        )
+
+    def apply_settings_file(self, path=BOT_SETTINGS_PATH) -> bool:
         try:
-            self.config.bot.detection.reload_config()
-            log("[BOT] ⚡ ROI config reloaded")
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+        except FileNotFoundError:
+            return True
         except Exception as e:
-            log(f"[BOT] Config reload error: {e}")
+            log(f"[BOT] ❌ Failed to read {path}: {e}")
+            return False
+
+        if not isinstance(settings, dict):
+            log(f"[BOT] ❌ {path} must contain a JSON object")
+            return False
+
+        self.apply_settings(settings)
+        return True
+
+    def apply_settings(self, settings: dict):
+        bot_config = self.config.bot
+        detection_changed = False
+        for key, value in settings.items():
+            key = SETTING_ALIASES.get(key, key)
+            target = bot_config
+            if not hasattr(bot_config, key) and key in DETECTION_SETTINGS:
+                target = bot_config.detection
+
+            current = getattr(target, key, None)
+            if current is None or isinstance(current, dict):
+                log(f"[BOT] Ignoring unknown setting '{key}'")
+                continue
+            if isinstance(current, bool) != isinstance(value, bool) or not isinstance(value, (type(current), int)):
+                log(f"[BOT] Ignoring setting '{key}': expected {type(current).__name__}")
+                continue
+            setattr(target, key, type(current)(value))
+            detection_changed = detection_changed or target is bot_config.detection
+
+        if detection_changed:
+            # Detection settings are baked into the compiled snapshot
+            bot_config.detection.version += 1
+        self.target_delay = 1.0 / bot_config.target_fps if bot_config.target_fps > 0 else 0
+        self.debug_mode = bot_config.debug_mode
+        set_debug_mode(self.debug_mode)
+        self.controller.set_debug(self.debug_mode)
 
     def _register_states(self):
         self.state_machine.add_state(StateType.STARTING, StartingState(self))
@@ -87,40 +251,119 @@ class FishingBot:
         log("[INFO] MODIFIED: https://github.com/KepomPong2816")
         log(f"[INFO] Accuracy: {self.config.bot.detection.precision * 100:.0f}%")
         log(f"[INFO] Target FPS: {'MAX' if self.config.bot.target_fps == 0 else self.config.bot.target_fps}")
-        log("[INFO] Warming up detection system...")
-        time.sleep(1)
+        log("[INFO] Waiting for first frame...")
+        startup = get_startup_profile()
+        with startup.step("bot:first_frame"):
+            ready = self.detector.wait_until_ready(timeout=2.0)
+        if not ready:
+            log("[WARNING] No frame from async capture yet, continuing anyway")
+        startup.report("Bot startup")
+        self.geometry.start()
         self.state_machine.set_state(StateType.STARTING)
 
     def update(self):
         if self._stopped:
             return
 
-        loop_start = time.time()
+        metrics = self.metrics
+        tracer = self.tracer
+        loop_start = time.perf_counter()
 
+        self.geometry.apply_pending()
+        if self._pending_reload:
+            self._apply_pending_reload()
         screen = self.detector.capture_screen()
+        captured_at = time.perf_counter()
+        metrics.record("capture_wait", captured_at - loop_start)
+        if tracer.enabled:
+            tracer.complete("capture", "capture", loop_start, captured_at)
         if screen is None:
             return
 
+        self.detector.poll_discovery(screen)
+        if self.detector.last_frame_time:
+            metrics.record("frame_age", captured_at - self.detector.last_frame_time)
+
+        handle_stage = self._handle_stage_names.get(self.state_machine.current_state_name, "handle")
         self.state_machine.handle(screen)
+        handled_at = time.perf_counter()
+        metrics.record(handle_stage, handled_at - captured_at)
+        if tracer.enabled:
+            tracer.complete(handle_stage, "state", captured_at, handled_at)
 
         if self.target_delay > 0:
-            loop_time = time.time() - loop_start
+            loop_time = handled_at - loop_start
             sleep_time = max(0, self.target_delay - loop_time)
             if sleep_time > 0:
                 time.sleep(sleep_time)
+                slept_at = time.perf_counter()
+                metrics.record("pacing_sleep", slept_at - handled_at)
+                if tracer.enabled:
+                    tracer.complete("pacing_sleep", "sleep", handled_at, slept_at)
+
+        loop_end = time.perf_counter()
+        metrics.record("tick", loop_end - loop_start)
+        tracer.end_tick(loop_start, loop_end)
+        self.tick_count += 1
+        self.thread_cpu_time = time.thread_time()
+
+    def get_perf_snapshot(self) -> dict:
+        now = time.perf_counter()
+        capture = self.detector.get_capture_stats()
+        sample = (now, self.tick_count, capture['frames_captured'], self.thread_cpu_time, capture['capture_cpu_time'])
+
+        previous = self._last_perf_sample
+        self._last_perf_sample = sample
+
+        snapshot = {
+            'loop_fps': 0.0,
+            'capture_fps': 0.0,
+            'bot_cpu': 0.0,
+            'capture_cpu': 0.0,
+            'async_capture': capture['async'],
+            'dropped_frames': capture['dropped_frames'],
+            'duplicate_frames': capture['duplicate_frames'],
+            'frame_age': self.metrics.get_percentiles("frame_age"),
+            'tick': self.metrics.get_percentiles("tick"),
+            'templates': {
+                stage[len("find:"):]: self.metrics.get_percentiles(stage)
+                for stage in self.metrics.get_stages() if stage.startswith("find:")
+            }
+        }
+
+        if previous is not None and now > previous[0]:
+            elapsed = now - previous[0]
+            snapshot['loop_fps'] = (sample[1] - previous[1]) / elapsed
+            snapshot['capture_fps'] = (sample[2] - previous[2]) / elapsed
+            snapshot['bot_cpu'] = (sample[3] - previous[3]) / elapsed * 100
+            snapshot['capture_cpu'] = (sample[4] - previous[4]) / elapsed * 100
+
+        return snapshot
 
     def stop(self):
         if not getattr(self, "_stats_shown", False):
+            flush_logs()
             self.stats.show()
+            self.metrics.show()
             self._stats_shown = True
 
         if not self._stopped:
             self.log("[BOT] 🛑 Shutting down the bot...")
             self._stopped = True
 
+            try:
+                self.config.bot.detection.save_thresholds()
+            except Exception as e:
+                self.log(f"[ERROR] Failed to save thresholds: {e}")
+
+            emit_event("session_end", **self.stats.stats)
+            disable_event_logging()
+
             if self._config_watcher:
                 self._config_watcher.stop()
 
+            self.geometry.stop()
+
             try:
                 self.detector.cleanup()
             except Exception as e:
@@ -1,15 +1,41 @@
+import functools
 import time
 
-import pyautogui as auto
-
 from src.fishbot.utils.logger import log
+from src.fishbot.utils.perf_metrics import PerfMetrics
+from src.fishbot.utils.tracer import get_tracer
+from src.fishbot.utils.event_log import emit_event, is_event_logging_enabled
+
+
+def _instrumented(func):
+    stage = f"input:{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if is_event_logging_enabled():
+            emit_event("input", action=func.__name__, args=[*args, *kwargs.values()])
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            self.metrics.record(stage, end - start)
+            if self.tracer.enabled:
+                self.tracer.complete(stage, "input", start, end)
+    return wrapper
+
 
 class GameController:
-    def __init__(self, config):
+    def __init__(self, config, metrics=None):
         self.config = config.bot
+        self.metrics = metrics if metrics is not None else PerfMetrics(enabled=False)
+        self.tracer = get_tracer()
         self._debug = False
-        auto.FAILSAFE = True
-        auto.PAUSE = 0.05
+
+        import pyautogui
+        self._auto = pyautogui
+        self._auto.FAILSAFE = True
+        self._auto.PAUSE = 0.05
 
     def set_debug(self, enabled: bool):
         self._debug = enabled
@@ -18,47 +44,56 @@ class GameController:
         if self._debug:
             log(message)
 
+    @_instrumented
     def press_key(self, key):
         self._log(f"[CONTROLLER] 🔘 Pressing key: {key}")
-        auto.press(key)
+        self._auto.press(key)
         time.sleep(0.1)
 
+    @_instrumented
     def click(self, button='left', clicks=1, interval=0.1):
         self._log(f"[CONTROLLER] 🖱️ Clicking: {button} ({clicks}x)")
-        auto.click(button=button, clicks=clicks, interval=interval)
+        self._auto.click(button=button, clicks=clicks, interval=interval)
         time.sleep(0.15)
 
+    @_instrumented
     def click_at(self, x, y, button='left'):
         self._log(f"[CONTROLLER] 🖱️ Clicking at ({x}, {y})")
-        auto.click(x, y, button=button)
+        self._auto.click(x, y, button=button)
         time.sleep(0.15)
 
+    @_instrumented
     def move_to(self, x, y):
         self._log(f"[CONTROLLER] 📍 Moving mouse to: ({x}, {y})")
-        auto.moveTo(x, y, duration=0.2)
+        self._auto.moveTo(x, y, duration=0.2)
         time.sleep(0.1)
 
+    @_instrumented
     def mouse_down(self, button='left'):
         self._log(f"[CONTROLLER] 🖱️ ⬇️ Holding mouse: {button}")
-        auto.mouseDown(button=button)
+        self._auto.mouseDown(button=button)
         time.sleep(0.1)
 
+    @_instrumented
     def mouse_up(self, button='left'):
         self._log(f"[CONTROLLER] 🖱️ ⬆️ Releasing mouse: {button}")
-        auto.mouseUp(button=button)
+        self._auto.mouseUp(button=button)
         time.sleep(0.1)
 
+    @_instrumented
     def key_down(self, key):
         self._log(f"[CONTROLLER] 🔘 ⬇️ Holding key: {key}")
-        auto.keyDown(key)
+        self._auto.keyDown(key)
 
+    @_instrumented
     def key_up(self, key):
         self._log(f"[CONTROLLER] 🔘 ⬆️ Releasing key: {key}")
-        auto.keyUp(key)
+        self._auto.keyUp(key)
 
+    @_instrumented
     def release_all_controls(self):
         log("[CONTROLLER] ⚠️ Releasing all controls...")
-        auto.mouseUp(button='left')
-        auto.mouseUp(button='right')
-        auto.keyUp('a')
-        auto.keyUp('d')
\ No newline at end of file
+        self._auto.mouseUp(button='left')
+        self._auto.mouseUp(button='right')
+        self._auto.keyUp('a')
+        self._auto.keyUp('d')
@@ -0,0 +1,133 @@
+from typing import Collection, Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from src.fishbot.core.game.hue_gate import HueRange, learn_hue_range
+from src.fishbot.core.game.matchers import MASKED, prepare_template
+from src.fishbot.core.game.rejector import RejectorSignature, build_signature
+
+EMPTY_ROI = (0, 0, 0, 0)
+
+
+class CompiledTemplate(NamedTuple):
+    name: str
+    gray: np.ndarray
+    mask: Optional[np.ndarray]
+    height: int
+    width: int
+    roi: Optional[Tuple[int, int, int, int]]
+    radius: Optional[int] = None
+    matcher: str = MASKED
+    channel: Optional[int] = None
+    signature: Optional[RejectorSignature] = None
+    hue_range: Optional[HueRange] = None
+
+
+class CompiledGroup(NamedTuple):
+    name: str
+    variants: Tuple[CompiledTemplate, ...]
+    roi: Optional[Tuple[int, int, int, int]]
+    radius: Optional[int] = None
+
+
+class DetectionSnapshot:
+    __slots__ = ('templates', 'groups', 'screen_width', 'screen_height', 'config_version')
+
+    def __init__(self, templates: Dict[str, CompiledTemplate], screen_width: int, screen_height: int,
+                 config_version: int, groups: Optional[Dict[str, CompiledGroup]] = None):
+        self.templates = templates
+        self.groups = groups or {}
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.config_version = config_version
+
+    def search_region(self, entry: Union[CompiledTemplate, CompiledGroup],
+                      radius: int = 0) -> Optional[Tuple[int, int, int, int]]:
+        roi = entry.roi
+        if roi is None:
+            return 0, 0, self.screen_width, self.screen_height
+        if roi is EMPTY_ROI:
+            return None
+        if entry.radius is not None:
+            radius = entry.radius
+        if radius <= 0:
+            return roi
+
+        # Expanding the ROI by the radius covers the same pixels as sliding it over every offset
+        x, y, w, h = roi
+        x0 = max(0, x - radius)
+        y0 = max(0, y - radius)
+        x1 = min(self.screen_width, x + w + radius)
+        y1 = min(self.screen_height, y + h + radius)
+        return x0, y0, x1 - x0, y1 - y0
+
+
+def clamp_roi(roi, screen_width: int, screen_height: int) -> Tuple[int, int, int, int]:
+    x, y, w, h = (int(value) for value in roi)
+    x = max(0, min(x, screen_width - 1))
+    y = max(0, min(y, screen_height - 1))
+    w = min(w, screen_width - x)
+    h = min(h, screen_height - y)
+    if w <= 0 or h <= 0:
+        return EMPTY_ROI
+    return x, y, w, h
+
+
+def _readonly(array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    if array is None:
+        return None
+    array = np.ascontiguousarray(array)
+    array.setflags(write=False)
+    return array
+
+
+def _resolve_roi(rois: dict, name: str):
+    roi = rois.get(name)
+    if isinstance(roi, str):
+        roi = rois.get(roi)
+    return roi
+
+
+def compile_snapshot(templates: Dict[str, tuple], rois: dict, screen_width: int, screen_height: int,
+                     config_version: int = 0, radii: Optional[dict] = None,
+                     groups: Optional[Dict[str, list]] = None, matchers: Optional[dict] = None,
+                     rejectors: Collection[str] = (), hue_templates: Collection[str] = ()) -> DetectionSnapshot:
+    radii = radii or {}
+    groups = groups or {}
+    matchers = matchers or {}
+    group_of = {variant: group for group, variants in groups.items() for variant in variants}
+
+    compiled = {}
+    for name, (template_img, mask) in templates.items():
+        # Variants share their group's search area, so a leftover per-variant ROI can't narrow it
+        roi = _resolve_roi(rois, group_of.get(name)) or _resolve_roi(rois, name)
+
+        matcher = matchers.get(name, MASKED)
+        signature = build_signature(template_img, mask) if name in rejectors else None
+        hue_range = learn_hue_range(template_img, mask) if name in hue_templates else None
+        gray, mask, channel = prepare_template(template_img, mask, matcher)
+        compiled[name] = CompiledTemplate(
+            name=name,
+            gray=_readonly(gray),
+            mask=_readonly(mask),
+            height=gray.shape[0],
+            width=gray.shape[1],
+            roi=clamp_roi(roi, screen_width, screen_height) if roi else None,
+            radius=radii.get(name),
+            matcher=matcher,
+            channel=channel,
+            signature=signature,
+            hue_range=hue_range
+        )
+
+    compiled_groups = {}
+    for group, variants in groups.items():
+        roi = _resolve_roi(rois, group)
+        compiled_groups[group] = CompiledGroup(
+            name=group,
+            variants=tuple(compiled[name] for name in variants if name in compiled),
+            roi=clamp_roi(roi, screen_width, screen_height) if roi else None,
+            radius=radii.get(group)
+        )
+
+    return DetectionSnapshot(compiled, screen_width, screen_height, config_version, compiled_groups)
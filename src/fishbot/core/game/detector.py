@@ -1,28 +1,55 @@
+import threading
+import time
+
 import cv2 as cv
 import numpy as np
 from typing import Optional
 
-from src.fishbot.utils.logger import log
-
-try:
-    import mss
-except ImportError:
-    log("[ERROR] ❌ MSS library not found! Install with: pip install mss")
-    log("[ERROR] The bot cannot run without MSS.")
-    exit(1)
+from src.fishbot.utils.logger import log, log_throttled, debug
+from src.fishbot.utils.perf_metrics import PerfMetrics
+from src.fishbot.utils.tracer import get_tracer
+from src.fishbot.utils.event_log import emit_event, is_event_logging_enabled
+from src.fishbot.core.game.template_cache import get_template_cache
+from src.fishbot.core.game.detection_snapshot import compile_snapshot, clamp_roi
+from src.fishbot.core.game.roi_tuner import RoiTuner
+from src.fishbot.core.game.roi_discovery import RoiDiscovery
+from src.fishbot.core.game.hue_gate import count_hue_pixels
+from src.fishbot.core.game.matchers import MASKED, prepare_search, select_matchers
+from src.fishbot.core.game.rejector import AUDIT, PASS, REJECT, EarlyRejector
 
 
 class Detector:
     BASE_WIDTH = 1920
     BASE_HEIGHT = 1080
     
-    def __init__(self, config, use_async: bool = True):
+    def __init__(self, config, use_async: bool = True, metrics=None, capture_source=None, template_cache=None):
         self.unified_config = config
         self.detection_config = config.bot.detection
         self.screen_config = config.bot.screen
-
+        self.metrics = metrics if metrics is not None else PerfMetrics(enabled=False)
+        self._find_stage_names = {}
+        self.tracer = get_tracer()
+        self.last_frame_time: float = 0
+        self.last_confidence: float = 0
+        self.last_location = None
+        self._last_frame_id = 0
+        self.duplicate_frames = 0
+        self.dropped_frames = 0
+
+        self.template_cache = template_cache if template_cache is not None else get_template_cache()
         self.templates = self._load_templates()
         self.scaled_templates = {}
+        self._snapshot = None
+        self._matcher_thread = None
+        self.roi_tuner = None
+        if getattr(self.detection_config, 'roi_autotune_enabled', True):
+            self.roi_tuner = RoiTuner(
+                self.detection_config,
+                min_samples=getattr(self.detection_config, 'roi_autotune_min_samples', 50),
+                margin=getattr(self.detection_config, 'roi_autotune_margin', 8)
+            )
+        self.roi_discovery = RoiDiscovery(self.detection_config)
+        self.rejector = EarlyRejector(self.detection_config)
         self.sct = None
         self.monitor = {
             'left': self.screen_config.monitor_x,
@@ -32,11 +59,17 @@ class Detector:
         }
         
         self._scale_templates()
+        self._start_matcher_selection()
         
         self._use_async = use_async
         self._async_capture = None
+        self._external_capture = capture_source is not None
         
-        if self._use_async:
+        if self._external_capture:
+            self._use_async = True
+            self._async_capture = capture_source
+            self._async_capture.start()
+        elif self._use_async:
             self._init_async_capture()
 
     def _init_async_capture(self):
@@ -54,38 +87,21 @@ class Detector:
             self._async_capture = None
 
     def _scale_templates(self):
-        scale_x = self.screen_config.monitor_width / self.BASE_WIDTH
-        scale_y = self.screen_config.monitor_height / self.BASE_HEIGHT
+        width = self.screen_config.monitor_width
+        height = self.screen_config.monitor_height
+        scale = self.detection_config.get_template_scale()
         
         # Check if scaling is needed (strict tolerance)
-        if abs(scale_x - 1.0) < 0.01 and abs(scale_y - 1.0) < 0.01:
+        if abs(scale - 1.0) < 0.01:
             self.scaled_templates = self.templates.copy()
-            log(f"[INFO] Templates at base resolution (1920x1080)")
+            log(f"[INFO] Templates at base scale ({width}x{height})")
             return
         
-        log(f"[INFO] Scaling templates for {self.screen_config.monitor_width}x{self.screen_config.monitor_height} (scale: {scale_x:.3f}x, {scale_y:.3f}y)")
+        log(f"[INFO] Scaling templates for {width}x{height} (UI scale: {scale:.3f})")
         
-        for name, (template_img, mask) in self.templates.items():
-            # Use separate scaling factors for width and height
-            new_w = int(template_img.shape[1] * scale_x)
-            new_h = int(template_img.shape[0] * scale_y)
-            
-            # Safety check for very small dimensions
-            if new_w < 4 or new_h < 4:
-                log(f"[WARNING] Template '{name}' too small after scaling ({new_w}x{new_h}), using original.")
-                self.scaled_templates[name] = (template_img, mask)
-                continue
-            
-            # Use INTER_AREA for shrinking (better quality), INTER_LINEAR for enlarging
-            interpolation = cv.INTER_AREA if (scale_x < 1.0 or scale_y < 1.0) else cv.INTER_LINEAR
-            
-            scaled_template = cv.resize(template_img, (new_w, new_h), interpolation=interpolation)
-            
-            scaled_mask = None
-            if mask is not None:
-                scaled_mask = cv.resize(mask, (new_w, new_h), interpolation=interpolation)
-            
-            self.scaled_templates[name] = (scaled_template, scaled_mask)
+        self.scaled_templates = {}
+        for name, template_data in self.templates.items():
+            self.scaled_templates[name] = self.template_cache.get_scaled(name, width, height, scale) or template_data
         
         log(f"[INFO] ✅ Scaled {len(self.scaled_templates)} templates")
 
@@ -94,7 +110,43 @@ class Detector:
         if self._async_capture:
             self._async_capture.update_monitor(monitor)
 
+    def on_geometry_changed(self, old: tuple, new: tuple):
+        if old[2:] != new[2:]:
+            self.scaled_templates = {}
+            self._snapshot = None
+            if self.roi_tuner:
+                self.roi_tuner.reset()
+            self._start_matcher_selection()
+            log(f"[INFO] Resolution changed to {new[2]}x{new[3]}, templates will be rescaled on demand")
+        self.update_monitor(self.screen_config.get_monitor_dict())
+
+    def wait_until_ready(self, timeout: float = 2.0) -> bool:
+        if self._use_async and self._async_capture:
+            return self._async_capture.wait_for_frame(timeout)
+        return True
+
+    def get_capture_stats(self) -> dict:
+        capture = self._async_capture if self._use_async else None
+        return {
+            'async': capture is not None,
+            'frames_captured': capture.get_frames_captured() if capture else 0,
+            'capture_cpu_time': capture.cpu_time if capture else 0.0,
+            'duplicate_frames': self.duplicate_frames,
+            'dropped_frames': self.dropped_frames
+        }
+
+    def poll_discovery(self, screen):
+        if self.roi_discovery.poll(screen, self.templates):
+            self.scaled_templates = {}
+            self._snapshot = None
+            self._start_matcher_selection()
+
     def cleanup(self):
+        self.roi_discovery.shutdown()
+        if self.rejector.stats:
+            checks = sum(stats['checks'] for stats in self.rejector.stats.values())
+            rejects = sum(stats['rejects'] for stats in self.rejector.stats.values())
+            log(f"[REJECTOR] Skipped {rejects}/{checks} template matches on colour statistics")
         if self._async_capture:
             self._async_capture.stop()
             self._async_capture = None
@@ -103,50 +155,46 @@ class Detector:
             self.sct = None
 
     def _load_templates(self):
-        loaded = {}
         log("[INFO] Loading templates...")
-        for name in self.detection_config.templates:
-            path = self.unified_config.get_template_path(name)
-            if not (path and path.exists()):
+        paths = {name: self.unified_config.get_template_path(name) for name in self.detection_config.templates}
+        loaded = self.template_cache.load_all(paths)
+        
+        for name, path in paths.items():
+            if name not in loaded:
                 log(f"[INFO] ❌ {name} - not found at '{path}'")
-                continue
-
-            img = cv.imread(str(path), cv.IMREAD_UNCHANGED)
-            template_img, mask = None, None
-
-            if img.shape[2] == 4:
+            elif loaded[name][1] is not None:
                 log(f"[INFO] ✅ {name} (with transparency mask)")
-                mask = img[:, :, 3]
-                template_img = cv.cvtColor(img, cv.COLOR_BGRA2BGR)
             else:
                 log(f"[INFO] ✅ {name}")
-                template_img = img
-            
-            loaded[name] = (template_img, mask)
-        return loaded
+        
+        return {name: loaded[name] for name in paths if name in loaded}
     
-    def _generate_concentric_square_pixels(self, center_x, center_y, max_radius):
-        for r in range(1, max_radius + 1):
-            for x in range(center_x - r, center_x + r + 1):
-                yield x, center_y - r
-            for x in range(center_x - r, center_x + r + 1):
-                yield x, center_y + r
-            for y in range(center_y - r + 1, center_y + r):
-                yield center_x - r, y
-            for y in range(center_y - r + 1, center_y + r):
-                yield center_x + r, y
-
     def capture_screen(self) -> Optional[np.ndarray]:
         if self._use_async and self._async_capture:
-            frame = self._async_capture.get_latest_frame()
+            frame, frame_time, frame_id = self._async_capture.get_latest_frame_info()
             if frame is not None:
+                if frame_id == self._last_frame_id:
+                    self.duplicate_frames += 1
+                elif self._last_frame_id and frame_id > self._last_frame_id + 1:
+                    self.dropped_frames += frame_id - self._last_frame_id - 1
+                self._last_frame_id = frame_id
+                self.last_frame_time = frame_time
                 return frame
         
+        if self._external_capture:
+            return None
+        
         if self.sct is None:
+            try:
+                import mss
+            except ImportError:
+                log_throttled("mss_missing", 10, "[ERROR] ❌ MSS library not found! Install with: pip install mss", "ERROR")
+                return None
             self.sct = mss.mss()
             log(f"[INFO] ✅ MSS initialized. Monitor: {self.monitor}")
 
         screenshot = self.sct.grab(self.monitor)
+        self.last_frame_time = time.perf_counter()
         img = np.array(screenshot)
         
         if img is None or img.size == 0:
@@ -159,83 +207,292 @@ class Detector:
             log(f"[ERROR] cvtColor failed: {e}. Shape: {img.shape}")
             return None
 
-    def _check_xy(self, search_area, x, y, template_data, template_img, template_name, debug):
-        confidence, location = self._perform_match(search_area, template_data)
+    def _check_xy(self, search_area, x, y, entry, debug):
+        confidence, location = self._perform_match(search_area, entry)
 
         if confidence is None:
             return None
         
+        template_name = entry.name
         precision = self.detection_config.get_precision_for_template(template_name)
         is_match = confidence >= precision
+        self.last_confidence = confidence
 
         if debug and confidence >= .3:
-            status = 'MATCH' if is_match else 'NO MATCH'
-            log(f"[DEBUG] [{template_name}] at ({x}, {y}) Confidence: {confidence:.2%} (required: {precision:.0%}) -> {status}")
+            log_throttled(
+                template_name, 0.1,
+                "[DEBUG] [%s] at (%d, %d) Confidence: %.2f%% (required: %.0f%%) -> %s", "DEBUG",
+                (template_name, x, y, confidence * 100, precision * 100, 'MATCH' if is_match else 'NO MATCH')
+            )
 
         if is_match:
             self.detection_config.record_detection_result(template_name, True, confidence)
-            return self._calculate_center(location, template_img.shape[:2], (x, y))
+            self.last_location = (location[0] + x, location[1] + y)
+            return self._calculate_center(location, (entry.height, entry.width), (x, y))
         else:
             if confidence >= 0.3:
                 self.detection_config.record_detection_result(template_name, False, confidence)
 
         return None
 
-    def _get_search_area(self, screen, template_name, radius, debug):
-        template_data = self.scaled_templates.get(template_name, self.templates.get(template_name))
-        if not template_data:
-            return None
-            
-        template_img, _ = template_data
+    def reload_templates(self, names) -> list:
+        templates = dict(self.templates)
+        scaled_templates = dict(self.scaled_templates)
+        failed = []
 
-        roi_config = self.detection_config.rois.get(template_name)
-        if isinstance(roi_config, str):
-            roi = self.detection_config.rois.get(roi_config)
-        else:
-            roi = roi_config
+        for name in names:
+            data = self.template_cache.load(name, self.unified_config.get_template_path(name), force=True)
+            if data is None:
+                failed.append(name)
+                log(f"[INFO] ❌ Failed to reload template '{name}'")
+                continue
+            templates[name] = data
+            scaled_templates.pop(name, None)
+
+        self.templates = templates
+        self.scaled_templates = scaled_templates
+        self._snapshot = None
+
+        reloaded = [name for name in names if name not in failed]
+        for name in reloaded:
+            self.detection_config.matchers.pop(name, None)
+        self._start_matcher_selection(reloaded)
+        return failed
+
+    def _start_matcher_selection(self, names=None):
+        # Only the calibrate tool picks matchers from real frames; synthetic benchmarks are opt-in and stay in memory
+        if not getattr(self.detection_config, 'matcher_autoselect', False):
+            return
+        if self._matcher_thread is not None and self._matcher_thread.is_alive():
+            return
 
-        if not roi:
-            return screen, (0, 0)
+        scale = self.detection_config.get_template_scale()
+        calibrated = self.detection_config.matchers
+        pending = [name for name in (names if names is not None else list(self.templates))
+                   if name not in calibrated and self.template_cache.get_matcher(name, scale) is None]
+
+        if pending:
+            self._matcher_thread = threading.Thread(target=self._select_matchers, args=(pending, scale),
+                                                    name="MatcherSelect", daemon=True)
+            self._matcher_thread.start()
+
+    def _select_matchers(self, names, scale):
+        start = time.perf_counter()
+        width, height = self.screen_config.monitor_width, self.screen_config.monitor_height
+        templates = {name: self.template_cache.get_scaled(name, width, height, scale) or data
+                     for name, data in self.templates.items()}
+
+        results = select_matchers(templates, names, self.detection_config.get_precision_for_template)
+        choices = {}
+        for name in names:
+            # Templates whose benchmark failed keep the masked matcher instead of being retried
+            matcher, report = results.get(name, (MASKED, {}))
+            self.template_cache.set_matcher(name, scale, matcher)
+            choices[name] = matcher
+            debug("[MATCHER] %s -> %s %s", name, matcher, report)
+
+        if not results or abs(self.detection_config.get_template_scale() - scale) > 1e-4:
+            return
 
-        x, y, w, h = roi
-        screen_h, screen_w = screen.shape[:2]
-        x = max(0, min(x, screen_w - 1))
-        y = max(0, min(y, screen_h - 1))
-        w = min(w, screen_w - x)
-        h = min(h, screen_h - y)
+        self._snapshot = None
+        fast = {name: matcher for name, matcher in choices.items() if matcher != 'masked'}
+        log(f"[MATCHER] Benchmarked {len(choices)} templates in {(time.perf_counter() - start) * 1000:.0f} ms, "
+            f"{len(fast)} use a faster matcher: {', '.join(f'{n}={m}' for n, m in sorted(fast.items())) or 'none'}")
+
+    def _get_template(self, template_name):
+        template_data = self.scaled_templates.get(template_name)
+        if template_data is None:
+            template_data = self.templates.get(template_name)
+            if template_data is None:
+                return None
+            scaled = self.template_cache.get_scaled(
+                template_name, self.screen_config.monitor_width, self.screen_config.monitor_height,
+                self.detection_config.get_template_scale()
+            )
+            template_data = self.scaled_templates[template_name] = scaled or template_data
+        return template_data
 
-        if w > 0 and h > 0:
-            result = self._check_xy(screen[y:y + h, x:x + w], x, y, template_data, template_img, template_name, debug)
+    def _get_snapshot(self, screen):
+        snapshot = self._snapshot
+        screen_h, screen_w = screen.shape[:2]
+        if (snapshot is None or snapshot.config_version != self.detection_config.version
+                or snapshot.screen_width != screen_w or snapshot.screen_height != screen_h):
+            snapshot = self._compile_snapshot(screen_w, screen_h)
+        return snapshot
+
+    def _compile_snapshot(self, screen_w, screen_h):
+        start = time.perf_counter()
+        config_version = self.detection_config.version
+        templates = {name: self._get_template(name) for name in self.templates}
+        snapshot = compile_snapshot(templates, dict(self.detection_config.rois), screen_w, screen_h, config_version,
+                                    radii=dict(getattr(self.detection_config, 'search_radii', {})),
+                                    groups=dict(getattr(self.detection_config, 'template_groups', {})),
+                                    matchers=self._active_matchers(),
+                                    rejectors=self._rejector_names(),
+                                    hue_templates=tuple(getattr(self.detection_config, 'colour_gate_templates', ())))
+        self._snapshot = snapshot
+        self.metrics.record("snapshot_compile", time.perf_counter() - start)
+        return snapshot
+
+    def _active_matchers(self):
+        matchers = dict(getattr(self.detection_config, 'matchers', {}))
+        if not getattr(self.detection_config, 'matcher_autoselect', False):
+            return matchers
+
+        self._start_matcher_selection()
+        scale = self.detection_config.get_template_scale()
+        for name in self.templates:
+            if name not in matchers:
+                matchers[name] = self.template_cache.get_matcher(name, scale) or MASKED
+        return matchers
+
+    def _rejector_names(self):
+        if not getattr(self.detection_config, 'early_reject_enabled', True):
+            return ()
+        return {name for name in self.templates if self.detection_config.is_rejector_enabled(name)}
+
+    def _screen_area(self, entry, search_area):
+        if search_area.shape[0] < entry.height or search_area.shape[1] < entry.width:
+            return PASS
+        if entry.hue_range is not None and getattr(self.detection_config, 'bite_colour_detection', False):
+            required = entry.hue_range.pixels * getattr(self.detection_config, 'colour_gate_min_fraction', 0.5)
+            return PASS if count_hue_pixels(search_area, entry.hue_range) >= required else REJECT
+        if entry.signature is None:
+            return PASS
+        return self.rejector.check(entry.name, search_area, entry.signature)
+
+    def _record_false_reject(self, name):
+        self.rejector.record_false_reject(name)
+        self._snapshot = None
 
-            if result != None:
-                return result
-            
-            if radius > 0:
-                concentric_coords = self._generate_concentric_square_pixels(x, y, radius)
+    def _get_search_area(self, screen, template_name, radius, debug):
+        snapshot = self._get_snapshot(screen)
+        entry = snapshot.templates.get(template_name)
+        if entry is None:
+            return None
 
-                for pixel in list(concentric_coords):
-                    x, y = pixel
+        region = snapshot.search_region(entry, radius)
+        if region is None:
+            return None
 
-                    result = self._check_xy(screen[y:y + h, x:x + w], x, y, template_data, template_img, template_name, debug)
+        x, y, w, h = region
+        search_area = screen[y:y + h, x:x + w]
+        verdict = self._screen_area(entry, search_area)
+        result = None if verdict == REJECT else self._check_xy(search_area, x, y, entry, debug)
+        if verdict == AUDIT and result is not None:
+            self._record_false_reject(template_name)
+
+        tuner = self.roi_tuner
+        if tuner is not None:
+            if result is not None:
+                tuner.record_hit(template_name, self.last_location, (entry.width, entry.height), region)
+            elif tuner.should_probe(template_name):
+                self._probe_original_roi(screen, snapshot, entry, radius)
+        return result
+
+    def _probe_original_roi(self, screen, snapshot, entry, radius):
+        original = self.roi_tuner.original_roi(entry.name)
+        if original is None:
+            return
 
-                    if result != None:
-                        return result
+        wide = entry._replace(roi=clamp_roi(original, snapshot.screen_width, snapshot.screen_height))
+        region = snapshot.search_region(wide, radius)
+        if region is None:
+            return
 
-        return None
+        x, y, w, h = region
+        confidence, _ = self._perform_match(screen[y:y + h, x:x + w], entry)
+        if confidence is not None and confidence >= self.detection_config.get_precision_for_template(entry.name):
+            self.roi_tuner.record_escape(entry.name)
 
-    def _perform_match(self, search_area, template_data):
-        template_img, mask = template_data
+    def _perform_match(self, search_area, entry):
+        if search_area.shape[0] < entry.height or search_area.shape[1] < entry.width:
+            return None, None
 
-        search_gray = cv.cvtColor(search_area, cv.COLOR_BGR2GRAY)
-        template_gray = cv.cvtColor(template_img, cv.COLOR_BGR2GRAY)
+        return self._match_gray(prepare_search(search_area, entry.matcher, entry.channel), entry)
 
-        if search_gray.shape[0] < template_gray.shape[0] or search_gray.shape[1] < template_gray.shape[1]:
+    def _match_gray(self, search_gray, entry):
+        if search_gray.shape[0] < entry.height or search_gray.shape[1] < entry.width:
             return None, None
 
-        result = cv.matchTemplate(search_gray, template_gray, cv.TM_CCOEFF_NORMED, mask=mask)
+        result = cv.matchTemplate(search_gray, entry.gray, cv.TM_CCOEFF_NORMED, mask=entry.mask)
         _, confidence, _, location = cv.minMaxLoc(result)
         return confidence, location
 
+    def _match_group(self, screen, group_name, radius, debug):
+        snapshot = self._get_snapshot(screen)
+        group = snapshot.groups.get(group_name)
+        if group is None or not group.variants:
+            return None
+
+        tuner = self.roi_tuner
+        result = self._match_variants(screen, snapshot, group, radius, debug)
+        if result is not None:
+            entry, confidence, center, region = result
+            if tuner is not None:
+                tuner.record_hit(group_name, self.last_location, (entry.width, entry.height), region)
+            return entry.name, confidence, center
+
+        # Group checks run once per cycle and a miss has real consequences (a rod marked broken),
+        # so a tightened group ROI is re-checked at its original size on every miss
+        original = tuner.original_roi(group_name) if tuner is not None else None
+        if original is None:
+            return None
+        wide = group._replace(roi=clamp_roi(original, snapshot.screen_width, snapshot.screen_height))
+        result = self._match_variants(screen, snapshot, wide, radius, debug)
+        if result is None:
+            return None
+        tuner.record_escape(group_name)
+        entry, confidence, center, _ = result
+        return entry.name, confidence, center
+
+    def _match_variants(self, screen, snapshot, group, radius, debug):
+        group_name = group.name
+        region = snapshot.search_region(group, radius)
+        if region is None:
+            return None
+
+        x, y, w, h = region
+        search_area = screen[y:y + h, x:x + w]
+        search_gray = cv.cvtColor(search_area, cv.COLOR_BGR2GRAY)
+
+        best = None
+        closest = None
+        for entry in group.variants:
+            verdict = self._screen_area(entry, search_area)
+            if verdict == REJECT:
+                continue
+            image = prepare_search(search_area, entry.matcher, entry.channel, search_gray)
+            confidence, location = self._match_gray(image, entry)
+            if confidence is None:
+                continue
+
+            precision = self.detection_config.get_precision_for_template(entry.name)
+            if verdict == AUDIT and confidence >= precision:
+                self._record_false_reject(entry.name)
+            if debug and confidence >= .3:
+                log_throttled(
+                    entry.name, 0.1,
+                    "[DEBUG] [%s/%s] at (%d, %d) Confidence: %.2f%% (required: %.0f%%)", "DEBUG",
+                    (group_name, entry.name, x, y, confidence * 100, precision * 100)
+                )
+            if confidence >= precision and (best is None or confidence > best[1]):
+                best = (entry, confidence, location)
+            if closest is None or confidence > closest[1]:
+                closest = (entry, confidence)
+
+        if best is None:
+            if closest is not None and closest[1] >= 0.3:
+                self.last_confidence = closest[1]
+                self.detection_config.record_detection_result(closest[0].name, False, closest[1])
+            return None
+
+        entry, confidence, location = best
+        self.last_confidence = confidence
+        self.last_location = (location[0] + x, location[1] + y)
+        self.detection_config.record_detection_result(entry.name, True, confidence)
+        return entry, confidence, self._calculate_center(location, (entry.height, entry.width), (x, y)), region
+
     def _calculate_center(self, location, template_shape, offset):
         h_t, w_t = template_shape
         offset_x, offset_y = offset
@@ -244,9 +501,43 @@ class Detector:
             location[1] + h_t // 2 + offset_y + self.screen_config.monitor_y
         )
 
+    def find_best(self, screen, group_name, radius=0, debug=False):
+        stage = self._find_stage_names.get(group_name)
+        if stage is None:
+            stage = self._find_stage_names[group_name] = f"find:{group_name}"
+
+        start = time.perf_counter()
+        result = self._match_group(screen, group_name, radius, debug)
+        end = time.perf_counter()
+        self.metrics.record(stage, end - start)
+        if self.tracer.enabled:
+            self.tracer.complete(stage, "detect", start, end, {'found': result is not None})
+        if result is not None and is_event_logging_enabled():
+            variant, confidence, (cx, cy) = result
+            emit_event(
+                "detection", template=group_name, variant=variant, confidence=round(confidence, 4),
+                x=int(cx), y=int(cy), frame_t=self.last_frame_time, match_ms=round((end - start) * 1000, 3)
+            )
+        return result
+
     def find(self, screen, template_name, radius = 0, debug=False):
         if template_name not in self.templates:
             log(f"[INFO] ❌ Template '{template_name}' was not loaded.")
             return None
-        
-        return self._get_search_area(screen, template_name, radius, debug)
\ No newline at end of file
+
+        stage = self._find_stage_names.get(template_name)
+        if stage is None:
+            stage = self._find_stage_names[template_name] = f"find:{template_name}"
+
+        start = time.perf_counter()
+        result = self._get_search_area(screen, template_name, radius, debug)
+        end = time.perf_counter()
+        self.metrics.record(stage, end - start)
+        if self.tracer.enabled:
+            self.tracer.complete(stage, "detect", start, end, {'found': result is not None})
+        if result is not None and is_event_logging_enabled():
+            emit_event(
+                "detection", template=template_name, confidence=round(self.last_confidence, 4),
+                x=int(result[0]), y=int(result[1]), frame_t=self.last_frame_time, match_ms=round((end - start) * 1000, 3)
+            )
+        return result
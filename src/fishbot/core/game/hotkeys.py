@@ -1,20 +1,25 @@
-import keyboard
 import multiprocessing
+import threading
 from src.fishbot.utils.logger import log
-from src.fishbot.utils.roi_visualizer import main as show_roi_visualizer
+from src.fishbot.utils.profiler import SamplingProfiler
 
 class Hotkeys:
     def __init__(self, bot):
         self.bot = bot
         self.paused = True
         self.visualizer_process = None
+        self.profiler = SamplingProfiler()
+        self._bot_thread_id = threading.get_ident()
         self._register_hotkeys()
 
     def _register_hotkeys(self):
+        import keyboard
         keyboard.add_hotkey('7', self._toggle_pause)
         keyboard.add_hotkey('8', self._stop)
         keyboard.add_hotkey('0', self._toggle_visualizer)
-        log("[INFO] Hotkeys registered: '7' (Pause/Resume), '8' (Exit), '0' (HUD Visualizer)")
+        keyboard.add_hotkey('5', self._dump_trace)
+        keyboard.add_hotkey('6', self._toggle_profiler)
+        log("[INFO] Hotkeys registered: '7' (Pause/Resume), '8' (Exit), '0' (HUD Visualizer), '5' (Dump Trace), '6' (Profiler)")
 
     def _toggle_pause(self):
         self.paused = not self.paused
@@ -25,8 +30,23 @@ class Hotkeys:
         log("[HOTKEY] Stopping the bot...")
         if self.visualizer_process and self.visualizer_process.is_alive():
             self.visualizer_process.terminate()
+        self.profiler.stop()
         self.bot.stop()
 
+    def _dump_trace(self):
+        if not self.bot.tracer.enabled:
+            log("[HOTKEY] Tracing is disabled.")
+            return
+        log("[HOTKEY] Dumping trace...")
+        self.bot.dump_trace()
+
+    def _toggle_profiler(self):
+        if self.profiler.is_running():
+            log("[HOTKEY] Stopping profiler...")
+        else:
+            log("[HOTKEY] Starting profiler...")
+        self.profiler.toggle(self._bot_thread_id)
+
     def _toggle_visualizer(self):
         if self.visualizer_process and self.visualizer_process.is_alive():
             log("[HOTKEY] Closing the HUD visualizer.")
@@ -34,8 +54,10 @@ class Hotkeys:
             self.visualizer_process = None
         else:
             log("[HOTKEY] Opening the HUD visualizer.")
+            from src.fishbot.utils.roi_visualizer import main as show_roi_visualizer
             self.visualizer_process = multiprocessing.Process(target=show_roi_visualizer, daemon=True)
             self.visualizer_process.start()
 
     def wait_for_exit(self):
+        import keyboard
         keyboard.wait('8')
\ No newline at end of file
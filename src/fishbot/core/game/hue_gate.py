@@ -0,0 +1,44 @@
+from typing import NamedTuple, Optional
+
+import cv2 as cv
+import numpy as np
+
+MIN_SATURATION = 100
+MIN_VALUE = 100
+HUE_WINDOW = 15
+HUE_MARGIN = 4
+SV_MARGIN = 40
+STRIDE = 2
+
+
+class HueRange(NamedTuple):
+    lower: np.ndarray
+    upper: np.ndarray
+    pixels: int
+
+
+def learn_hue_range(template_img: np.ndarray, mask: Optional[np.ndarray]) -> Optional[HueRange]:
+    if template_img.ndim != 3:
+        return None
+
+    hsv = cv.cvtColor(template_img, cv.COLOR_BGR2HSV)
+    pixels = hsv[mask > 127] if mask is not None else hsv.reshape(-1, 3)
+    pixels = pixels[(pixels[:, 1] >= MIN_SATURATION) & (pixels[:, 2] >= MIN_VALUE)]
+    if len(pixels) == 0:
+        return None
+
+    # The indicator colour is the dominant saturated hue; outlines and shading fall outside the window
+    peak = int(np.argmax(np.bincount(pixels[:, 0], minlength=180)))
+    pixels = pixels[np.abs(pixels[:, 0].astype(np.int32) - peak) <= HUE_WINDOW]
+
+    low = np.percentile(pixels, 2, axis=0)
+    high = np.percentile(pixels, 98, axis=0)
+    lower = np.array([max(0, low[0] - HUE_MARGIN), max(0, low[1] - SV_MARGIN), max(0, low[2] - SV_MARGIN)],
+                     dtype=np.uint8)
+    upper = np.array([min(179, high[0] + HUE_MARGIN), 255, 255], dtype=np.uint8)
+    return HueRange(lower, upper, len(pixels) // (STRIDE * STRIDE))
+
+
+def count_hue_pixels(search_area: np.ndarray, hue_range: HueRange) -> int:
+    hsv = cv.cvtColor(np.ascontiguousarray(search_area[::STRIDE, ::STRIDE]), cv.COLOR_BGR2HSV)
+    return cv.countNonZero(cv.inRange(hsv, hue_range.lower, hue_range.upper))
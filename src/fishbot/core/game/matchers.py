@@ -0,0 +1,143 @@
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import cv2 as cv
+import numpy as np
+
+from src.fishbot.utils.logger import log
+
+MASKED = "masked"
+GRAY = "gray"
+CHANNEL = "channel"
+EDGES = "edges"
+
+MATCHERS = (GRAY, CHANNEL, EDGES, MASKED)
+CANNY_LOW = 50
+CANNY_HIGH = 150
+
+
+def prepare_template(template_img: np.ndarray, mask: Optional[np.ndarray], matcher: str):
+    if matcher == CHANNEL:
+        channel = int(np.argmax([template_img[:, :, c].std() for c in range(3)]))
+        return np.ascontiguousarray(template_img[:, :, channel]), None, channel
+
+    gray = template_img if template_img.ndim == 2 else cv.cvtColor(template_img, cv.COLOR_BGR2GRAY)
+    if matcher == EDGES:
+        return cv.Canny(gray, CANNY_LOW, CANNY_HIGH), None, None
+    if matcher == GRAY:
+        return gray, None, None
+    return gray, mask, None
+
+
+def prepare_search(search_area: np.ndarray, matcher: str, channel: Optional[int] = None,
+                   search_gray: Optional[np.ndarray] = None) -> np.ndarray:
+    if matcher == CHANNEL:
+        return np.ascontiguousarray(search_area[:, :, channel])
+    if search_gray is None:
+        search_gray = cv.cvtColor(search_area, cv.COLOR_BGR2GRAY)
+    if matcher == EDGES:
+        return cv.Canny(search_gray, CANNY_LOW, CANNY_HIGH)
+    return search_gray
+
+
+def match_score(image: np.ndarray, template: np.ndarray, mask: Optional[np.ndarray]) -> float:
+    result = cv.matchTemplate(image, template, cv.TM_CCOEFF_NORMED, mask=mask)
+    np.nan_to_num(result, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    return float(result.max())
+
+
+def _composite(background: np.ndarray, template_img: np.ndarray, mask: Optional[np.ndarray], x: int, y: int):
+    h, w = template_img.shape[:2]
+    region = background[y:y + h, x:x + w]
+    if mask is None:
+        region[:] = template_img
+    else:
+        alpha = (mask.astype(np.float32) / 255.0)[:, :, None]
+        region[:] = (template_img * alpha + region * (1 - alpha)).astype(np.uint8)
+
+
+def _background(rng, height: int, width: int) -> np.ndarray:
+    if rng.random() < 0.5:
+        return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    color = rng.integers(0, 256, 3)
+    noise = rng.integers(-25, 26, (height, width, 3))
+    return np.clip(color + noise, 0, 255).astype(np.uint8)
+
+
+def build_samples(template_img: np.ndarray, mask: Optional[np.ndarray], others: List[Tuple[np.ndarray, Optional[np.ndarray]]],
+                  samples: int = 8, pad: int = 8, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    h, w = template_img.shape[:2]
+    height, width = h + 2 * pad, w + 2 * pad
+
+    positives = []
+    for _ in range(samples):
+        area = _background(rng, height, width)
+        gain = rng.uniform(0.9, 1.1)
+        shaded = np.clip(template_img.astype(np.float32) * gain, 0, 255).astype(np.uint8)
+        _composite(area, shaded, mask, int(rng.integers(0, 2 * pad + 1)), int(rng.integers(0, 2 * pad + 1)))
+        positives.append(area)
+
+    negatives = []
+    fitting = [(img, m) for img, m in others if img.shape[0] <= height and img.shape[1] <= width]
+    for index in range(samples):
+        area = _background(rng, height, width)
+        if fitting and index % 2 == 0:
+            other_img, other_mask = fitting[int(rng.integers(0, len(fitting)))]
+            oh, ow = other_img.shape[:2]
+            _composite(area, other_img, other_mask, int(rng.integers(0, width - ow + 1)),
+                       int(rng.integers(0, height - oh + 1)))
+        negatives.append(area)
+
+    return positives, negatives
+
+
+def benchmark_template(template_img: np.ndarray, mask: Optional[np.ndarray], precision: float,
+                       others: List[Tuple[np.ndarray, Optional[np.ndarray]]] = (), samples: int = 8,
+                       margin: float = 0.05, repeats: int = 3, positives: Sequence[np.ndarray] = (),
+                       negatives: Sequence[np.ndarray] = ()) -> Tuple[str, Dict[str, dict]]:
+    # Real search areas (e.g. labelled frames) are scored alongside the synthetic ones
+    h, w = template_img.shape[:2]
+    synthetic_pos, synthetic_neg = build_samples(template_img, mask, list(others), samples)
+    positives = synthetic_pos + [area for area in positives if area.shape[0] >= h and area.shape[1] >= w]
+    negatives = synthetic_neg + [area for area in negatives if area.shape[0] >= h and area.shape[1] >= w]
+    report = {}
+
+    for matcher in MATCHERS:
+        template, template_mask, channel = prepare_template(template_img, mask, matcher)
+        pos_scores = [match_score(prepare_search(area, matcher, channel), template, template_mask) for area in positives]
+        neg_scores = [match_score(prepare_search(area, matcher, channel), template, template_mask) for area in negatives]
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for area in positives:
+                match_score(prepare_search(area, matcher, channel), template, template_mask)
+            timings.append((time.perf_counter() - start) / len(positives))
+
+        report[matcher] = {
+            'min_positive': round(min(pos_scores), 4),
+            'max_negative': round(max(neg_scores), 4),
+            'accurate': min(pos_scores) >= precision + margin and max(neg_scores) < precision - margin,
+            'match_ms': round(min(timings) * 1000, 4)
+        }
+
+    accurate = [matcher for matcher in MATCHERS if report[matcher]['accurate']]
+    if not accurate:
+        return MASKED, report
+    return min(accurate, key=lambda matcher: report[matcher]['match_ms']), report
+
+
+def select_matchers(templates: Dict[str, tuple], names: Iterable[str],
+                    precision_for: Callable[[str], float]) -> Dict[str, Tuple[str, Dict[str, dict]]]:
+    results = {}
+    for name in names:
+        if name not in templates:
+            continue
+        template_img, mask = templates[name]
+        others = [data for other, data in templates.items() if other != name]
+        try:
+            results[name] = benchmark_template(template_img, mask, precision_for(name), others)
+        except Exception as e:
+            log(f"[MATCHER] Benchmark failed for '{name}': {e}")
+    return results
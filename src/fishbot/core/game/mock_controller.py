@@ -0,0 +1,67 @@
+from collections import deque
+
+from src.fishbot.core.game.controller import _instrumented
+from src.fishbot.utils.logger import log
+from src.fishbot.utils.perf_metrics import PerfMetrics
+from src.fishbot.utils.tracer import get_tracer
+
+
+class MockController:
+    def __init__(self, config, metrics=None, history_size: int = 1000):
+        self.config = config.bot
+        self.metrics = metrics if metrics is not None else PerfMetrics(enabled=False)
+        self.tracer = get_tracer()
+        self.actions = deque(maxlen=history_size)
+        self.action_count = 0
+        self.held = set()
+        self._debug = False
+
+    def set_debug(self, enabled: bool):
+        self._debug = enabled
+
+    def _record(self, action: str, *args):
+        self.actions.append((action, *args))
+        self.action_count += 1
+        if self._debug:
+            log(f"[MOCK] {action} {args}")
+
+    @_instrumented
+    def press_key(self, key):
+        self._record("press_key", key)
+
+    @_instrumented
+    def click(self, button='left', clicks=1, interval=0.1):
+        self._record("click", button, clicks)
+
+    @_instrumented
+    def click_at(self, x, y, button='left'):
+        self._record("click_at", x, y, button)
+
+    @_instrumented
+    def move_to(self, x, y):
+        self._record("move_to", x, y)
+
+    @_instrumented
+    def mouse_down(self, button='left'):
+        self.held.add(f"mouse:{button}")
+        self._record("mouse_down", button)
+
+    @_instrumented
+    def mouse_up(self, button='left'):
+        self.held.discard(f"mouse:{button}")
+        self._record("mouse_up", button)
+
+    @_instrumented
+    def key_down(self, key):
+        self.held.add(f"key:{key}")
+        self._record("key_down", key)
+
+    @_instrumented
+    def key_up(self, key):
+        self.held.discard(f"key:{key}")
+        self._record("key_up", key)
+
+    @_instrumented
+    def release_all_controls(self):
+        self.held.clear()
+        self._record("release_all_controls")
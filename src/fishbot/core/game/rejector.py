@@ -0,0 +1,87 @@
+from typing import Dict, NamedTuple, Optional
+
+import cv2 as cv
+import numpy as np
+
+from src.fishbot.utils.logger import log
+from src.fishbot.utils.event_log import emit_event
+
+STRIDE = 4
+LEVELS = 4
+BINS = LEVELS ** 3
+RANGES = [0, 256] * 3
+
+PASS = 0
+REJECT = 1
+AUDIT = 2
+
+
+class RejectorSignature(NamedTuple):
+    histogram: np.ndarray
+    pixels: float
+
+
+def _neighbour_matrix() -> np.ndarray:
+    cells = np.array(np.unravel_index(np.arange(BINS), (LEVELS,) * 3)).T
+    return (np.abs(cells[:, None, :] - cells[None, :, :]).max(axis=2) <= 1).astype(np.float32)
+
+
+# Neighbouring colour bins count too, so brightness shifts across a bin edge don't reject true hits
+NEIGHBOURS = _neighbour_matrix()
+
+
+def _histogram(img: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    return cv.calcHist([img], [0, 1, 2], mask, [LEVELS] * 3, RANGES).ravel()
+
+
+def build_signature(template_img: np.ndarray, mask: Optional[np.ndarray]) -> Optional[RejectorSignature]:
+    if template_img.ndim != 3:
+        return None
+
+    opaque = (mask > 127).astype(np.uint8) if mask is not None else None
+    # Search areas are sampled every STRIDE pixels, so expect 1/STRIDE^2 of the template's colours
+    histogram = _histogram(template_img, opaque) / (STRIDE * STRIDE)
+    pixels = float(histogram.sum())
+    if pixels < 1:
+        return None
+    histogram.setflags(write=False)
+    return RejectorSignature(histogram, pixels)
+
+
+def containment(search_area: np.ndarray, signature: RejectorSignature) -> float:
+    sampled = np.ascontiguousarray(search_area[::STRIDE, ::STRIDE])
+    available = NEIGHBOURS @ _histogram(sampled)
+    return float(np.minimum(available, signature.histogram).sum() / signature.pixels)
+
+
+class EarlyRejector:
+    def __init__(self, detection_config, audit_interval: int = 20):
+        self.config = detection_config
+        self.audit_interval = audit_interval
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def threshold(self) -> float:
+        return getattr(self.config, 'early_reject_threshold', 0.7)
+
+    def check(self, name: str, search_area: np.ndarray, signature: RejectorSignature) -> int:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = {'checks': 0, 'rejects': 0, 'audits': 0, 'false_rejects': 0}
+        stats['checks'] += 1
+
+        if containment(search_area, signature) >= self.threshold:
+            return PASS
+
+        stats['rejects'] += 1
+        if stats['rejects'] % self.audit_interval == 0:
+            stats['audits'] += 1
+            return AUDIT
+        return REJECT
+
+    def record_false_reject(self, name: str):
+        stats = self.stats.setdefault(name, {'checks': 0, 'rejects': 0, 'audits': 0, 'false_rejects': 0})
+        stats['false_rejects'] += 1
+        self.config.disable_rejector(name, "false reject during play", stats['false_rejects'])
+        emit_event("rejector_disabled", template=name, **stats)
+        log(f"[REJECTOR] ⚠️ '{name}' rejected a real match, early rejection disabled for it")
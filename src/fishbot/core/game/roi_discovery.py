@@ -0,0 +1,195 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import cv2 as cv
+import numpy as np
+
+from src.fishbot.core.game.template_cache import BASE_HEIGHT, BASE_WIDTH, TemplateData, scale_template
+from src.fishbot.utils.logger import log
+from src.fishbot.utils.event_log import emit_event
+
+COARSE_FACTOR = 0.5
+SCALE_FACTORS = (0.75, 0.85, 1.0, 1.15, 1.3)
+FINE_FACTORS = (0.95, 0.975, 1.0, 1.025, 1.05)
+
+
+class DiscoveryResult(NamedTuple):
+    scale: float
+    offset: Tuple[int, int]
+    rois: Dict[str, Tuple[int, int, int, int]]
+    found: Dict[str, float]
+
+
+def _gray(img: np.ndarray) -> np.ndarray:
+    return img if img.ndim == 2 else cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+
+
+def _match(area: np.ndarray, template: np.ndarray, mask: Optional[np.ndarray]) -> Tuple[float, Tuple[int, int]]:
+    if area.shape[0] < template.shape[0] or area.shape[1] < template.shape[1]:
+        return 0.0, (0, 0)
+    result = cv.matchTemplate(area, template, cv.TM_CCOEFF_NORMED, mask=mask)
+    np.nan_to_num(result, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    _, confidence, _, location = cv.minMaxLoc(result)
+    return float(confidence), location
+
+
+def _coarse_search(frame_small: np.ndarray, data: TemplateData, base_scale: float):
+    template_img, mask = data
+    gray = _gray(template_img)
+    results = {}
+    for factor in SCALE_FACTORS:
+        scale = base_scale * factor * COARSE_FACTOR
+        size = (int(gray.shape[1] * scale), int(gray.shape[0] * scale))
+        if size[0] < 4 or size[1] < 4:
+            continue
+        small = cv.resize(gray, size, interpolation=cv.INTER_AREA)
+        small_mask = cv.resize(mask, size, interpolation=cv.INTER_AREA) if mask is not None else None
+        results[factor] = _match(frame_small, small, small_mask)
+    return results
+
+
+def _fine_search(frame: np.ndarray, name: str, data: TemplateData, scale: float, coarse_location):
+    results = {}
+    cx, cy = (int(value / COARSE_FACTOR) for value in coarse_location)
+    for factor in FINE_FACTORS:
+        template_img, mask = scale_template(name, data, scale * factor, scale * factor)
+        gray = _gray(template_img)
+        th, tw = gray.shape[:2]
+        pad = max(8, int(max(tw, th) * 0.25))
+        x0, y0 = max(0, cx - pad), max(0, cy - pad)
+        area = frame[y0:y0 + th + 2 * pad, x0:x0 + tw + 2 * pad]
+        confidence, (x, y) = _match(area, gray, mask)
+        results[factor] = (confidence, (x + x0, y + y0, tw, th))
+    return results
+
+
+def discover_layout(frame: np.ndarray, templates: Dict[str, TemplateData], base_rois: dict, pool: ThreadPoolExecutor,
+                    min_confidence: float = 0.7, min_templates: int = 2, margin: int = 8) -> Optional[DiscoveryResult]:
+    frame = _gray(frame)
+    height, width = frame.shape[:2]
+    base_scale = min(width / BASE_WIDTH, height / BASE_HEIGHT)
+    frame_small = cv.resize(frame, None, fx=COARSE_FACTOR, fy=COARSE_FACTOR, interpolation=cv.INTER_AREA)
+
+    names = list(templates)
+    coarse = dict(zip(names, pool.map(lambda name: _coarse_search(frame_small, templates[name], base_scale), names)))
+
+    def factor_score(factor):
+        hits = [results[factor][0] for results in coarse.values()
+                if factor in results and results[factor][0] >= min_confidence]
+        return len(hits), sum(hits)
+
+    best_factor = max(SCALE_FACTORS, key=factor_score)
+    candidates = [name for name in names if best_factor in coarse[name]
+                  and coarse[name][best_factor][0] >= min_confidence]
+    if len(candidates) < min_templates:
+        return None
+
+    scale = base_scale * best_factor
+    fine = dict(zip(candidates, pool.map(
+        lambda name: _fine_search(frame, name, templates[name], scale, coarse[name][best_factor][1]), candidates
+    )))
+    fine_factor = max(FINE_FACTORS, key=lambda factor: sum(results[factor][0] for results in fine.values()))
+    scale *= fine_factor
+
+    found = {name: results[fine_factor] for name, results in fine.items() if results[fine_factor][0] >= min_confidence}
+    if len(found) < min_templates:
+        return None
+
+    deltas = [(x - base_rois[name][0] * scale, y - base_rois[name][1] * scale)
+              for name, (_, (x, y, _, _)) in found.items() if base_rois.get(name)]
+    offset = tuple(int(value) for value in np.median(deltas, axis=0)) if deltas else (0, 0)
+
+    pad = max(4, int(margin * scale))
+    rois = {}
+    for name, roi in base_rois.items():
+        if name in found:
+            _, (x, y, tw, th) = found[name]
+            x, y, w, h = x - pad, y - pad, tw + 2 * pad, th + 2 * pad
+        elif roi:
+            bx, by, bw, bh = roi
+            x, y, w, h = int(bx * scale) + offset[0], int(by * scale) + offset[1], int(bw * scale), int(bh * scale)
+        else:
+            continue
+        x, y = max(0, x), max(0, y)
+        rois[name] = (x, y, min(w, width - x), min(h, height - y))
+
+    return DiscoveryResult(scale, offset, rois, {name: round(result[0], 3) for name, result in found.items()})
+
+
+class RoiDiscovery:
+    def __init__(self, detection_config, max_workers: int = 4, retry_interval: float = 5.0, max_attempts: int = 12):
+        self.config = detection_config
+        self.max_workers = max_workers
+        self.retry_interval = retry_interval
+        self.max_attempts = max_attempts
+        self.attempts = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._runner: Optional[ThreadPoolExecutor] = None
+        self._future = None
+        self._resolution = None
+        self._last_attempt = 0.0
+
+    def poll(self, screen, templates: Dict[str, TemplateData]) -> bool:
+        if self._future is not None:
+            if not self._future.done():
+                return False
+            return self._finish()
+
+        if not self.config.discovery_pending:
+            return False
+
+        resolution = self.config.get_current_resolution()
+        if resolution != self._resolution:
+            self._resolution = resolution
+            self.attempts = 0
+        if self.attempts >= self.max_attempts:
+            self.config.discovery_pending = False
+            log(f"[DISCOVERY] ❌ No UI found after {self.attempts} attempts, keeping scaled ROIs")
+            return False
+
+        now = time.perf_counter()
+        if now - self._last_attempt < self.retry_interval:
+            return False
+
+        self._last_attempt = now
+        self.attempts += 1
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="RoiDiscovery")
+            self._runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RoiDiscoveryRunner")
+        self._future = self._runner.submit(
+            discover_layout, screen.copy(), dict(templates), self.config.get_default_rois(), self._pool,
+            margin=getattr(self.config, 'roi_autotune_margin', 8)
+        )
+        log(f"[DISCOVERY] 🔍 Searching UI layout for {self._resolution[0]}x{self._resolution[1]} "
+            f"(attempt {self.attempts}/{self.max_attempts})")
+        return False
+
+    def _finish(self) -> bool:
+        future, self._future = self._future, None
+        try:
+            result = future.result()
+        except Exception as e:
+            log(f"[DISCOVERY] ❌ Discovery failed: {e}")
+            return False
+
+        if self.config.get_current_resolution() != self._resolution:
+            return False
+        if result is None:
+            log(f"[DISCOVERY] Not enough UI visible yet, retrying in {self.retry_interval:.0f}s")
+            return False
+
+        self.config.apply_discovery(result.scale, result.offset, result.rois, result.found)
+        log(f"[DISCOVERY] ✅ UI scale {result.scale:.3f}, offset {result.offset}, "
+            f"located {len(result.found)} templates: {', '.join(sorted(result.found))}")
+        emit_event("roi_discovery", scale=round(result.scale, 4), offset=list(result.offset), found=result.found)
+        self.shutdown()
+        return True
+
+    def shutdown(self):
+        if self._runner:
+            self._runner.shutdown(wait=False, cancel_futures=True)
+            self._runner = None
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,157 @@
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from src.fishbot.config.calibration import load_calibration_section
+from src.fishbot.utils.logger import log
+from src.fishbot.utils.event_log import emit_event
+
+Roi = Tuple[int, int, int, int]
+
+
+class RoiTuner:
+    def __init__(self, detection_config, min_samples: int = 50, margin: int = 8, min_gain: float = 0.2,
+                 probe_interval: int = 30, max_misses: int = 3):
+        self.config = detection_config
+        self.min_samples = min_samples
+        self.margin = margin
+        self.min_gain = min_gain
+        self.probe_interval = probe_interval
+        self.max_misses = max_misses
+        self.proposals: Dict[str, Roi] = {}
+        self._hits: Dict[str, Counter] = {}
+        self._hit_counts: Dict[str, int] = {}
+        self._since_probe: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._widen_count: Dict[str, int] = {}
+        self._tightened: Dict[str, dict] = {}
+        self.load_state()
+
+    @property
+    def apply(self) -> bool:
+        return getattr(self.config, 'roi_autotune_apply', False)
+
+    def reset(self):
+        self.proposals.clear()
+        self._hits.clear()
+        self._hit_counts.clear()
+        self._since_probe.clear()
+        self._misses.clear()
+        self._widen_count.clear()
+        self.load_state()
+
+    def load_state(self):
+        width, height = self.config.get_current_resolution()
+        state = load_calibration_section(width, height, "roi_tuning")
+        self._tightened = {name: entry for name, entry in state.items()
+                           if isinstance(entry, dict) and 'original' in entry}
+
+    def _save_state(self):
+        self.config._save_section("roi_tuning", self._tightened)
+
+    def is_tightened(self, name: str) -> bool:
+        return name in self._tightened
+
+    def original_roi(self, name: str) -> Optional[Roi]:
+        entry = self._tightened.get(name)
+        return tuple(entry['original']) if entry else None
+
+    def record_hit(self, name: str, location: Tuple[int, int], size: Tuple[int, int], region: Roi):
+        hits = self._hits.get(name)
+        if hits is None:
+            hits = self._hits[name] = Counter()
+        hits[location] += 1
+        count = self._hit_counts[name] = self._hit_counts.get(name, 0) + 1
+
+        if name in self._tightened:
+            if self._on_edge(location, size, region):
+                self._record_miss(name, "hit on the ROI edge")
+            return
+
+        required = self.min_samples * (1 + self._widen_count.get(name, 0))
+        if count >= required and name not in self.proposals:
+            self._propose(name, hits, size)
+
+    def should_probe(self, name: str) -> bool:
+        if name not in self._tightened:
+            return False
+        count = self._since_probe[name] = self._since_probe.get(name, 0) + 1
+        if count < self.probe_interval:
+            return False
+        self._since_probe[name] = 0
+        return True
+
+    def record_escape(self, name: str):
+        self._record_miss(name, "match outside the tightened ROI")
+
+    def _on_edge(self, location: Tuple[int, int], size: Tuple[int, int], region: Roi) -> bool:
+        x, y = location
+        w, h = size
+        rx, ry, rw, rh = region
+        width, height = self.config.get_current_resolution()
+        return ((x <= rx and rx > 0) or (y <= ry and ry > 0)
+                or (x + w >= rx + rw and rx + rw < width) or (y + h >= ry + rh and ry + rh < height))
+
+    def _current_roi(self, name: str) -> Optional[Roi]:
+        roi = self.config.rois.get(name)
+        if isinstance(roi, str):
+            roi = self.config.rois.get(roi)
+        return tuple(roi) if roi else None
+
+    def _propose(self, name: str, hits: Counter, size: Tuple[int, int]):
+        width, height = self.config.get_current_resolution()
+        xs = [x for x, _ in hits]
+        ys = [y for _, y in hits]
+        x0 = max(0, min(xs) - self.margin)
+        y0 = max(0, min(ys) - self.margin)
+        x1 = min(width, max(xs) + size[0] + self.margin)
+        y1 = min(height, max(ys) + size[1] + self.margin)
+        proposal = (x0, y0, x1 - x0, y1 - y0)
+
+        current = self._current_roi(name) or (0, 0, width, height)
+        current_area = current[2] * current[3]
+        gain = 1 - (proposal[2] * proposal[3]) / current_area if current_area else 0
+        if gain < self.min_gain:
+            return
+
+        self.proposals[name] = proposal
+        log(f"[ROI] 📐 '{name}': {current} -> {proposal} ({gain * 100:.0f}% less area, "
+            f"{self._hit_counts[name]} hits)")
+
+        if self.apply:
+            self._write_roi(name, proposal)
+            self._tightened[name] = {'original': list(current), 'tightened': list(proposal)}
+            self._save_state()
+            emit_event("roi_tightened", template=name, roi=list(proposal), original=list(current))
+            log(f"[ROI] ✅ Applied tightened ROI for '{name}'")
+
+    def _record_miss(self, name: str, reason: str):
+        misses = self._misses[name] = self._misses.get(name, 0) + 1
+        log(f"[ROI] ⚠️ '{name}': {reason} ({misses}/{self.max_misses})")
+        if misses >= self.max_misses:
+            self.widen(name)
+
+    def widen(self, name: str):
+        entry = self._tightened.pop(name, None)
+        if entry is None:
+            return
+
+        original = tuple(entry['original'])
+        self._write_roi(name, original)
+        self._save_state()
+        self.proposals.pop(name, None)
+        self._hits.pop(name, None)
+        self._hit_counts.pop(name, None)
+        self._misses.pop(name, None)
+        self._since_probe.pop(name, None)
+        self._widen_count[name] = self._widen_count.get(name, 0) + 1
+        emit_event("roi_widened", template=name, roi=list(original))
+        log(f"[ROI] ↔️ Restored ROI for '{name}': {original}")
+
+    def _write_roi(self, name: str, roi: Roi):
+        rois = dict(self.config.user_rois)
+        rois[name] = list(roi)
+        if self.config.persist_calibration:
+            self.config.save_user_rois(rois)
+        else:
+            self.config.user_rois = rois
+            self.config._apply_user_rois()
@@ -0,0 +1,142 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import cv2 as cv
+import numpy as np
+
+from src.fishbot.utils.logger import log
+
+BASE_WIDTH = 1920
+BASE_HEIGHT = 1080
+
+TemplateData = Tuple[np.ndarray, Optional[np.ndarray]]
+
+
+class TemplateCache:
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._base: Dict[str, Tuple[str, float, TemplateData]] = {}
+        self._scaled: Dict[Tuple[str, float], TemplateData] = {}
+        self._matchers: Dict[Tuple[str, float], str] = {}
+        self._lock = threading.Lock()
+        self._name_locks: Dict[str, threading.Lock] = {}
+
+    def _name_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            lock = self._name_locks.get(name)
+            if lock is None:
+                lock = self._name_locks[name] = threading.Lock()
+            return lock
+
+    def load(self, name: str, path: str, force: bool = False) -> Optional[TemplateData]:
+        path = str(path)
+        with self._name_lock(name):
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                return None
+
+            cached = self._base.get(name)
+            if cached and not force and cached[0] == path and cached[1] == mtime:
+                return cached[2]
+
+            img = cv.imread(path, cv.IMREAD_UNCHANGED)
+            if img is None:
+                return None
+
+            if img.ndim == 3 and img.shape[2] == 4:
+                data = (cv.cvtColor(img, cv.COLOR_BGRA2BGR), img[:, :, 3])
+            elif img.ndim == 2:
+                data = (cv.cvtColor(img, cv.COLOR_GRAY2BGR), None)
+            else:
+                data = (img, None)
+
+            with self._lock:
+                self._base[name] = (path, mtime, data)
+                for key in [key for key in self._scaled if key[0] == name]:
+                    del self._scaled[key]
+                for key in [key for key in self._matchers if key[0] == name]:
+                    del self._matchers[key]
+            return data
+
+    def load_all(self, templates: Dict[str, str]) -> Dict[str, TemplateData]:
+        items = [(name, str(path)) for name, path in templates.items() if path]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="TemplateLoad") as pool:
+            results = list(pool.map(lambda item: (item[0], self.load(*item)), items))
+        return {name: data for name, data in results if data is not None}
+
+    def get(self, name: str) -> Optional[TemplateData]:
+        cached = self._base.get(name)
+        return cached[2] if cached else None
+
+    def get_scaled(self, name: str, width: int, height: int, scale: Optional[float] = None) -> Optional[TemplateData]:
+        # The game UI scales uniformly, so non-16:9 sizes must not stretch templates per axis
+        if scale is None:
+            scale = min(width / BASE_WIDTH, height / BASE_HEIGHT)
+        key = (name, round(scale, 4))
+        scaled = self._scaled.get(key)
+        if scaled is not None:
+            return scaled
+
+        base = self.get(name)
+        if base is None:
+            return None
+
+        scaled = scale_template(name, base, scale, scale)
+        with self._lock:
+            self._scaled[key] = scaled
+        return scaled
+
+    def get_matcher(self, name: str, scale: float) -> Optional[str]:
+        return self._matchers.get((name, round(scale, 4)))
+
+    def set_matcher(self, name: str, scale: float, matcher: str):
+        with self._lock:
+            self._matchers[(name, round(scale, 4))] = matcher
+
+    def invalidate(self, name: str = None):
+        with self._lock:
+            if name is None:
+                self._base.clear()
+                self._scaled.clear()
+                self._matchers.clear()
+                return
+            self._base.pop(name, None)
+            for key in [key for key in self._scaled if key[0] == name]:
+                del self._scaled[key]
+            for key in [key for key in self._matchers if key[0] == name]:
+                del self._matchers[key]
+
+
+def scale_template(name: str, template_data: TemplateData, scale_x: float, scale_y: float) -> TemplateData:
+    template_img, mask = template_data
+
+    if abs(scale_x - 1.0) < 0.01 and abs(scale_y - 1.0) < 0.01:
+        return template_data
+
+    # Use separate scaling factors for width and height
+    new_w = int(template_img.shape[1] * scale_x)
+    new_h = int(template_img.shape[0] * scale_y)
+
+    if new_w < 4 or new_h < 4:
+        log(f"[WARNING] Template '{name}' too small after scaling ({new_w}x{new_h}), using original.")
+        return template_data
+
+    # Use INTER_AREA for shrinking (better quality), INTER_LINEAR for enlarging
+    interpolation = cv.INTER_AREA if (scale_x < 1.0 or scale_y < 1.0) else cv.INTER_LINEAR
+
+    scaled_template = cv.resize(template_img, (new_w, new_h), interpolation=interpolation)
+    scaled_mask = None
+    if mask is not None:
+        scaled_mask = cv.resize(mask, (new_w, new_h), interpolation=interpolation)
+
+    return scaled_template, scaled_mask
+
+
+_cache = TemplateCache()
+
+
+def get_template_cache() -> TemplateCache:
+    return _cache
@@ -0,0 +1,92 @@
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from src.fishbot.utils.logger import log
+from src.fishbot.utils.event_log import emit_event
+
+
+class GeometryService:
+    def __init__(self, screen_config, refresh_interval: float = 2.0):
+        self.screen = screen_config
+        self.refresh_interval = refresh_interval
+        self.refresh_count = 0
+        self.change_count = 0
+        self._listeners: List[Callable[[tuple, tuple], None]] = []
+        self._pending: Optional[Tuple[tuple, list]] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def geometry(self) -> tuple:
+        return self.screen.get_geometry()
+
+    def add_listener(self, callback: Callable[[tuple, tuple], None]):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[tuple, tuple], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def start(self):
+        if self._thread is not None or self.refresh_interval <= 0:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="GeometryService", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def refresh(self) -> bool:
+        try:
+            geometry, monitors = self.screen.probe()
+        except Exception as e:
+            log(f"[GEOMETRY] Refresh failed: {e}")
+            return False
+
+        self.refresh_count += 1
+        if geometry == self.geometry:
+            with self._lock:
+                self._pending = None
+            return False
+
+        with self._lock:
+            self._pending = (geometry, monitors)
+        return True
+
+    def apply_pending(self) -> bool:
+        if self._pending is None:
+            return False
+
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+        if pending is None:
+            return False
+
+        geometry, monitors = pending
+        old = self.geometry
+        if geometry == old:
+            return False
+
+        self.screen.apply_geometry(geometry, monitors, force=False)
+        self.change_count += 1
+        log(f"[GEOMETRY] Window changed: ({old[0]}, {old[1]}) {old[2]}x{old[3]} -> "
+            f"({geometry[0]}, {geometry[1]}) {geometry[2]}x{geometry[3]}")
+        emit_event("geometry", old=list(old), new=list(geometry))
+
+        for listener in list(self._listeners):
+            try:
+                listener(old, geometry)
+            except Exception as e:
+                log(f"[GEOMETRY] Listener failed: {e}")
+        return True
+
+    def _refresh_loop(self):
+        while not self._stop_event.wait(self.refresh_interval):
+            self.refresh()
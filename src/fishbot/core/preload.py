@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict
+
+from src.fishbot.utils.logger import log
+from src.fishbot.utils.startup import get_startup_profile
+
+
+def _load_templates():
+    from src.fishbot.config.detection_config import DEFAULT_TEMPLATES
+    from src.fishbot.config.paths import TEMPLATES_PATH
+    from src.fishbot.core.game.template_cache import get_template_cache
+
+    paths = {name: TEMPLATES_PATH / filename for name, filename in DEFAULT_TEMPLATES.items()}
+    return len(get_template_cache().load_all(paths))
+
+
+def _enumerate_monitors():
+    from src.fishbot.config.screen_config import get_available_monitors
+    return len(get_available_monitors(refresh=True))
+
+
+def warm_up_opencv():
+    import cv2 as cv
+    import numpy as np
+
+    screen = np.random.randint(0, 255, (96, 128, 3), dtype=np.uint8)
+    template = screen[16:48, 16:64].copy()
+    mask = np.full(template.shape[:2], 255, dtype=np.uint8)
+
+    screen_gray = cv.cvtColor(screen, cv.COLOR_BGR2GRAY)
+    template_gray = cv.cvtColor(template, cv.COLOR_BGR2GRAY)
+    cv.resize(template, (24, 16), interpolation=cv.INTER_AREA)
+    cv.matchTemplate(screen_gray, template_gray, cv.TM_CCOEFF_NORMED)
+    result = cv.matchTemplate(screen_gray, template_gray, cv.TM_CCOEFF_NORMED, mask=mask)
+    return cv.minMaxLoc(result)[1]
+
+
+PRELOAD_TASKS = {
+    'templates': _load_templates,
+    'monitors': _enumerate_monitors,
+    'opencv_warmup': warm_up_opencv,
+}
+
+
+class Preload:
+    def __init__(self, tasks: Dict = None):
+        self._tasks = tasks if tasks is not None else PRELOAD_TASKS
+        self._pool = ThreadPoolExecutor(max_workers=len(self._tasks), thread_name_prefix="Preload")
+        self._futures = {name: self._pool.submit(self._run, name, task) for name, task in self._tasks.items()}
+        self._pool.shutdown(wait=False)
+
+    def _run(self, name: str, task):
+        with get_startup_profile().step(f"preload:{name}"):
+            try:
+                return task()
+            except Exception as e:
+                log(f"[STARTUP] Preload '{name}' failed: {e}")
+                return None
+
+    def total(self) -> int:
+        return len(self._futures)
+
+    def completed(self) -> int:
+        return sum(1 for future in self._futures.values() if future.done())
+
+    def done(self) -> bool:
+        return self.completed() == self.total()
+
+    def wait(self, timeout: float = None) -> bool:
+        _, pending = wait(self._futures.values(), timeout=timeout)
+        return not pending
+
+
+def start_preload(tasks: Dict = None) -> Preload:
+    return Preload(tasks)
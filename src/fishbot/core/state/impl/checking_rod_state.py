@@ -18,18 +18,9 @@ class CheckingRodState(BotState):
 
         time.sleep(1)
 
-        found_rod = 0
-
-        if self.detector.find(screen, "flex_rod", 5, debug=True):
-            found_rod = 1
-
-        if found_rod == 0 and self.detector.find(screen, "sturdy_rod", 5, debug=self.bot.debug_mode):
-            found_rod = 1
-
-        if found_rod == 0 and self.detector.find(screen, "reg_rod", 5, debug=self.bot.debug_mode):
-            found_rod = 1
+        rod = self.detector.find_best(screen, "rod", 5, debug=self.bot.debug_mode)
                
-        if found_rod == 0:
+        if rod is None:
             self.bot.log("[CHECKING_ROD] ⚠️ Broken rod! Replacing...")
             self.bot.stats.increment('rod_breaks')
             time.sleep(1)
@@ -49,6 +40,6 @@ class CheckingRodState(BotState):
             self.bot.log("[CHECKING_ROD] ✅ Rod replaced")
         else:
             time.sleep(1)
-            self.bot.log("[CHECKING_ROD] ✅ Rod OK")
+            self.bot.log(f"[CHECKING_ROD] ✅ Rod OK ({rod[0]})")
 
         return StateType.CASTING_BAIT
@@ -10,7 +10,6 @@ class PlayingMinigameState(BotState):
     def __init__(self, bot):
         super().__init__(bot)
         self._current_direction = None
-        self.switch_delay = 0.5
         self._retry_handler = RetryHandler(
             max_retries=3,
             base_delay=0.3,
@@ -29,13 +28,13 @@ class PlayingMinigameState(BotState):
                 self.bot.log(f"[MINIGAME] ▶️ Moving to the {direction} (Holding '{key_to_press}')")
                 self.controller.key_down(key_to_press)
                 self._current_direction = direction
-                time.sleep(self.switch_delay)
+                time.sleep(self.config.switch_delay)
 
             if self._current_direction == opposite_direction:
                 self.bot.log(f"[MINIGAME] ◀️ Switching to the {direction} (Releasing '{key_to_release}')")
                 self.controller.key_up(key_to_release)
                 self._current_direction = None
-                time.sleep(self.switch_delay)
+                time.sleep(self.config.switch_delay)
 
     def _click_continue_with_retry(self, screen) -> bool:
         continue_pos = self.detector.find(screen, "continue", 5, debug=False)
@@ -8,7 +8,7 @@ class StartingState(BotState):
 
     def __init__(self, bot):
         super().__init__(bot)
-        self._last_search_log = 0
+        self._last_search_nudge = 0
 
     def _scale_coords(self, base_x: int, base_y: int) -> tuple:
         scale_x, scale_y = self.config.detection.get_scale_info()
@@ -49,17 +49,17 @@ class StartingState(BotState):
             self.bot.log("[STARTING] 🎣 Already in fishing mode — skipping interaction")
             return StateType.CHECKING_ROD      
         
+        self.bot.log_throttled("starting.search", 2, "[STARTING] 🔍 Searching for fishing spot...")
+        if self.bot.debug_mode:
+            self.bot.log_throttled("starting.debug", 2, "[STARTING] 💡Debug enabled")
+
         current_time = time.time()
-        if current_time - self._last_search_log > 2:
-            self.bot.log("[STARTING] 🔍 Searching for fishing spot...")
+        if current_time - self._last_search_nudge > 2:
             self.controller.key_down('s')
             self.controller.key_down('d')
             time.sleep(0.1)
             self.controller.key_up('s')
             self.controller.key_up('d')
-
-            if self.bot.debug_mode:
-                self.bot.log("[STARTING] 💡Debug enabled")
-            self._last_search_log = current_time
+            self._last_search_nudge = current_time
 
         return StateType.STARTING
@@ -5,22 +5,19 @@ from ..state_type import StateType
 
 
 class WaitingForBiteState(BotState):
-    def __init__(self, bot):
-        super().__init__(bot)
-        self._last_wait_log = 0
 
     def handle(self, screen):
 
         pos = self.detector.find(screen, "exclamation", 1, debug=self.bot.debug_mode)
 
         if pos:
-            self.bot.log("[WAITING_FOR_BITE] ❗ Fish hooked!")
+            # Frame capture to the click being issued, the reaction time that decides whether the fish is hooked
+            latency = time.perf_counter() - self.detector.last_frame_time
             self.controller.mouse_down('left')
+            self.bot.metrics.record("bite_latency", latency)
+            self.bot.log(f"[WAITING_FOR_BITE] ❗ Fish hooked! ({latency * 1000:.1f} ms)")
             return StateType.PLAYING_MINIGAME
         else:
-            current_time = time.time()
-            if current_time - self._last_wait_log > 5:
-                self.bot.log("[WAITING_FOR_BITE] ⏳ Waiting for fish...")
-                self._last_wait_log = current_time
+            self.bot.log_throttled("waiting_for_bite", 5, "[WAITING_FOR_BITE] ⏳ Waiting for fish...")
 
             return StateType.WAITING_FOR_BITE
\ No newline at end of file
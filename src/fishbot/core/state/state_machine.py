@@ -1,6 +1,8 @@
 import time
 
 from src.fishbot.utils.logger import log
+from src.fishbot.utils.tracer import get_tracer
+from src.fishbot.utils.event_log import emit_event
 
 class StateMachine:
     def __init__(self, bot):
@@ -10,6 +12,7 @@ class StateMachine:
         self.current_state_name = None
         self.current_state = None
         self.state_start_time = None
+        self.tracer = get_tracer()
 
     def add_state(self, name, state_instance):
         self.states[name] = state_instance
@@ -29,6 +32,14 @@ class StateMachine:
         elif force:
             log(f"[INFO] Forcing state reset: {new_state_name.name}")
 
+        previous = self.current_state_name.name if self.current_state_name else None
+        if self.tracer.enabled:
+            self.tracer.instant(f"state:{new_state_name.name}", "state", {'from': previous})
+        emit_event(
+            "state", state=new_state_name.name, previous=previous, forced=force,
+            previous_duration=round(time.time() - self.state_start_time, 3) if self.state_start_time else None
+        )
+
         self.current_state_name = new_state_name
         self.current_state = self.states[self.current_state_name]
         self.state_start_time = time.time()
@@ -1,7 +1,21 @@
 import time
 
+from src.fishbot.utils.event_log import emit_event
+
 
 class StatsTracker:
+    EVENT_TYPES = {
+        'cycles': 'cycle',
+        'fish_caught': 'catch',
+        'fish_escaped': 'escape',
+        'rod_breaks': 'rod_break',
+        'timeouts': 'timeout'
+    }
+
+    BUCKET_SECONDS = 60
+    RING_SIZE = 60
+    WINDOWS = (1, 10, 60)
+
     def __init__(self):
         self.stats = {
             'cycles': 0,
@@ -12,19 +26,68 @@ class StatsTracker:
         }
         self._start_time: float = 0
         self._session_start: float = 0
-        self._hourly_catches: list = []
+        self._session_start_mono: float = 0
+        self._reset_buckets()
+
+    def _reset_buckets(self):
+        self._buckets = {name: [0] * self.RING_SIZE for name in self.stats}
+        self._window_sums = {name: {window: 0 for window in self.WINDOWS} for name in self.stats}
+        self._current_bucket = int(time.monotonic() // self.BUCKET_SECONDS)
+
+    def _advance(self, now: float) -> int:
+        bucket = int(now // self.BUCKET_SECONDS)
+        steps = bucket - self._current_bucket
+        if steps <= 0:
+            return bucket
+
+        if steps >= self.RING_SIZE:
+            self._reset_buckets()
+            self._current_bucket = bucket
+            return bucket
+
+        for step in range(1, steps + 1):
+            entering = self._current_bucket + step
+            for name, ring in self._buckets.items():
+                sums = self._window_sums[name]
+                for window in self.WINDOWS:
+                    sums[window] -= ring[(entering - window) % self.RING_SIZE]
+                ring[entering % self.RING_SIZE] = 0
+
+        self._current_bucket = bucket
+        return bucket
 
     def start_session(self):
         self._session_start = time.time()
+        self._session_start_mono = time.monotonic()
         self._start_time = self._session_start
-        self._hourly_catches = []
+        self._reset_buckets()
+        emit_event("session_start")
 
     def increment(self, stat_name: str, value: int = 1):
         if stat_name in self.stats:
             self.stats[stat_name] += value
-            
-            if stat_name == 'fish_caught':
-                self._hourly_catches.append(time.time())
+            emit_event(self.EVENT_TYPES[stat_name], total=self.stats[stat_name])
+
+            bucket = self._advance(time.monotonic())
+            self._buckets[stat_name][bucket % self.RING_SIZE] += value
+            sums = self._window_sums[stat_name]
+            for window in self.WINDOWS:
+                sums[window] += value
+
+    def get_rolling_count(self, stat_name: str, minutes: int = 60) -> int:
+        self._advance(time.monotonic())
+        return self._window_sums[stat_name][minutes]
+
+    def get_rolling_rate(self, stat_name: str, minutes: int = 60) -> float:
+        now = time.monotonic()
+        count = self.get_rolling_count(stat_name, minutes)
+
+        covered = (minutes - 1) * self.BUCKET_SECONDS + now % self.BUCKET_SECONDS
+        if self._session_start_mono:
+            covered = min(covered, now - self._session_start_mono)
+        if covered < 1:
+            return 0.0
+        return count * 3600 / covered
 
     def get_elapsed_seconds(self) -> int:
         if self._session_start == 0:
@@ -51,11 +114,7 @@ class StatsTracker:
         return self.stats['fish_caught'] / elapsed_hours
 
     def get_catches_last_hour(self) -> int:
-        if not self._hourly_catches:
-            return 0
-        
-        one_hour_ago = time.time() - 3600
-        return sum(1 for t in self._hourly_catches if t >= one_hour_ago)
+        return self.get_rolling_count('fish_caught', 60)
 
     def get_extended_stats(self) -> dict:
         return {
@@ -63,14 +122,18 @@ class StatsTracker:
             'catch_rate': round(self.get_catch_rate(), 1),
             'fish_per_hour': round(self.get_fish_per_hour(), 1),
             'elapsed': self.get_elapsed_formatted(),
-            'catches_last_hour': self.get_catches_last_hour()
+            'catches_last_hour': self.get_catches_last_hour(),
+            'fish_per_hour_1m': round(self.get_rolling_rate('fish_caught', 1), 1),
+            'fish_per_hour_10m': round(self.get_rolling_rate('fish_caught', 10), 1),
+            'fish_per_hour_60m': round(self.get_rolling_rate('fish_caught', 60), 1)
         }
 
     def reset(self):
         for key in self.stats:
             self.stats[key] = 0
-        self._hourly_catches = []
+        self._reset_buckets()
         self._session_start = 0
+        self._session_start_mono = 0
 
     def show(self):
         print("\n" + "=" * 50)
@@ -0,0 +1,322 @@
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import cv2 as cv
+import numpy as np
+
+from src.fishbot.config.calibration import load_calibration_section, save_calibration_section, write_json_atomic
+from src.fishbot.config.detection_config import DEFAULT_TEMPLATES
+from src.fishbot.config.paths import TEMPLATES_PATH, get_user_rois_path
+from src.fishbot.core.game.matchers import benchmark_template
+from src.fishbot.core.game.rejector import RejectorSignature, build_signature, containment
+from src.fishbot.core.game.template_cache import get_template_cache
+
+LABELS_FILE = "labels.json"
+LOCATION_TOLERANCE = 12
+
+
+class TemplateStats:
+    def __init__(self, name: str, image: np.ndarray, mask: Optional[np.ndarray],
+                 signature: Optional[RejectorSignature] = None):
+        self.name = name
+        self.image = image
+        self.gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+        self.mask = mask
+        self.signature = signature
+        self.height, self.width = self.gray.shape[:2]
+        self.hits: List[Tuple[int, int]] = []
+        self.positives: List[float] = []
+        self.negatives: List[float] = []
+        self.containments: List[float] = []
+        self.positive_areas: List[np.ndarray] = []
+        self.negative_areas: List[np.ndarray] = []
+        self.roi: Optional[Tuple[int, int, int, int]] = None
+        self.radius = 0
+
+
+def load_labels(corpus_dir: str) -> Dict[str, dict]:
+    with open(os.path.join(corpus_dir, LABELS_FILE), 'r', encoding='utf-8') as f:
+        labels = json.load(f)
+    if not isinstance(labels, dict):
+        raise ValueError(f"{LABELS_FILE} must map frame file names to label objects")
+
+    frames = {}
+    for frame_name, frame_labels in sorted(labels.items()):
+        if not os.path.exists(os.path.join(corpus_dir, frame_name)):
+            print(f"[CALIBRATE] ⚠️ Missing frame '{frame_name}', skipping")
+            continue
+        frames[frame_name] = frame_labels if isinstance(frame_labels, dict) else {}
+    return frames
+
+
+def load_frame(corpus_dir: str, frame_name: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    frame = cv.imread(os.path.join(corpus_dir, frame_name), cv.IMREAD_COLOR)
+    if frame is None:
+        return None, None
+    return frame, cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+
+
+def load_templates(names: List[str], width: int, height: int) -> Dict[str, TemplateStats]:
+    cache = get_template_cache()
+    cache.load_all({name: os.path.join(TEMPLATES_PATH, DEFAULT_TEMPLATES[name]) for name in names})
+
+    # Match at the same scale the bot uses, which discovery may have measured for this resolution
+    scale = load_calibration_section(width, height, "ui").get("scale")
+    templates = {}
+    for name in names:
+        data = cache.get_scaled(name, width, height, scale)
+        if data is None:
+            print(f"[CALIBRATE] ⚠️ Template '{name}' could not be loaded, skipping")
+            continue
+        template_img, mask = data
+        templates[name] = TemplateStats(name, template_img, mask, build_signature(template_img, mask))
+    return templates
+
+
+def match(area: np.ndarray, stats: TemplateStats) -> Tuple[float, Tuple[int, int]]:
+    if area.shape[0] < stats.height or area.shape[1] < stats.width:
+        return 0.0, (0, 0)
+    result = cv.matchTemplate(area, stats.gray, cv.TM_CCOEFF_NORMED, mask=stats.mask)
+    np.nan_to_num(result, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    _, confidence, _, location = cv.minMaxLoc(result)
+    return float(confidence), location
+
+
+def crop(image: np.ndarray, region: Tuple[int, int, int, int]) -> Tuple[np.ndarray, int, int]:
+    x, y, w, h = region
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(image.shape[1], x + w), min(image.shape[0], y + h)
+    return image[y0:y1, x0:x1], x0, y0
+
+
+def locate_hit(gray: np.ndarray, stats: TemplateStats, label) -> Tuple[int, int]:
+    if isinstance(label, (list, tuple)) and len(label) == 2:
+        cx, cy = int(label[0]), int(label[1])
+        region = (cx - stats.width // 2 - LOCATION_TOLERANCE, cy - stats.height // 2 - LOCATION_TOLERANCE,
+                  stats.width + 2 * LOCATION_TOLERANCE, stats.height + 2 * LOCATION_TOLERANCE)
+        area, x0, y0 = crop(gray, region)
+    else:
+        area, x0, y0 = gray, 0, 0
+
+    _, (x, y) = match(area, stats)
+    return x + x0, y + y0
+
+
+def is_positive(label) -> bool:
+    return label is True or (isinstance(label, (list, tuple)) and len(label) == 2)
+
+
+def fit_roi(stats: TemplateStats, margin: int):
+    hits = np.asarray(stats.hits, dtype=np.int32)
+    x, y = (int(value) for value in np.median(hits, axis=0))
+    stats.roi = (x, y, stats.width, stats.height)
+    stats.radius = int(np.abs(hits - (x, y)).max()) + margin
+
+
+def search_region(stats: TemplateStats) -> Tuple[int, int, int, int]:
+    x, y, w, h = stats.roi
+    r = stats.radius
+    return x - r, y - r, w + 2 * r, h + 2 * r
+
+
+def roc_curve(positives: np.ndarray, negatives: np.ndarray):
+    thresholds = np.unique(np.concatenate([positives, negatives]))[::-1]
+    sorted_pos = np.sort(positives)
+    sorted_neg = np.sort(negatives)
+    tpr = 1.0 - np.searchsorted(sorted_pos, thresholds, side='left') / max(len(sorted_pos), 1)
+    fpr = 1.0 - np.searchsorted(sorted_neg, thresholds, side='left') / max(len(sorted_neg), 1)
+    curve_tpr = np.concatenate([[0.0], tpr, [1.0]])
+    curve_fpr = np.concatenate([[0.0], fpr, [1.0]])
+    auc = float(np.sum(np.diff(curve_fpr) * (curve_tpr[1:] + curve_tpr[:-1]) / 2))
+    return thresholds, tpr, fpr, auc
+
+
+def recommend_threshold(positives: np.ndarray, negatives: np.ndarray, thresholds, tpr, fpr) -> float:
+    if len(negatives) == 0:
+        return float(positives.min()) - 0.05
+    if positives.min() > negatives.max():
+        return float(positives.min() + negatives.max()) / 2
+    return float(thresholds[int(np.argmax(tpr - fpr))])
+
+
+def calibrate(corpus_dir: str, names: List[str], margin: int = 2, workers: int = 4, reject_threshold: float = 0.7):
+    frames = load_labels(corpus_dir)
+    if not frames:
+        raise ValueError(f"No labelled frames found in {corpus_dir}")
+
+    first = next((gray for gray in (load_frame(corpus_dir, name)[1] for name in frames) if gray is not None), None)
+    if first is None:
+        raise ValueError(f"No readable frames found in {corpus_dir}")
+    height, width = first.shape[:2]
+    templates = load_templates(names, width, height)
+
+    def collect_hits(frame_name):
+        _, gray = load_frame(corpus_dir, frame_name)
+        if gray is None:
+            return None
+        hits = []
+        for name, label in frames[frame_name].items():
+            if name in templates and is_positive(label):
+                hits.append((name, locate_hit(gray, templates[name], label)))
+        return hits
+
+    def collect_scores(frame_name):
+        frame, gray = load_frame(corpus_dir, frame_name)
+        if frame is None:
+            return []
+        scores = []
+        for name, stats in templates.items():
+            if stats.roi is None:
+                continue
+            region = search_region(stats)
+            area, _, _ = crop(gray, region)
+            confidence, _ = match(area, stats)
+            positive = is_positive(frames[frame_name].get(name))
+            area = crop(frame, region)[0].copy()
+            contained = None
+            if positive and stats.signature is not None:
+                contained = containment(area, stats.signature)
+            scores.append((name, positive, confidence, contained, area))
+        return scores
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Calibrate") as pool:
+        unreadable = []
+        for frame_name, hits in zip(frames, pool.map(collect_hits, frames)):
+            if hits is None:
+                unreadable.append(frame_name)
+                continue
+            for name, location in hits:
+                templates[name].hits.append(location)
+        for frame_name in unreadable:
+            print(f"[CALIBRATE] ⚠️ Could not read frame '{frame_name}', skipping")
+            del frames[frame_name]
+
+        for stats in templates.values():
+            if stats.hits:
+                fit_roi(stats, margin)
+
+        for scores in pool.map(collect_scores, frames):
+            for name, positive, confidence, contained, area in scores:
+                (templates[name].positives if positive else templates[name].negatives).append(confidence)
+                (templates[name].positive_areas if positive else templates[name].negative_areas).append(area)
+                if contained is not None:
+                    templates[name].containments.append(contained)
+
+    results = {}
+    for name, stats in templates.items():
+        if not stats.positives:
+            continue
+        positives = np.asarray(stats.positives)
+        negatives = np.asarray(stats.negatives)
+        thresholds, tpr, fpr, auc = roc_curve(positives, negatives)
+        threshold = recommend_threshold(positives, negatives, thresholds, tpr, fpr)
+        # Labelled frames are the real negatives a cheaper matcher has to keep rejecting
+        others = [(other.image, other.mask) for other_name, other in templates.items() if other_name != name]
+        matcher, _ = benchmark_template(stats.image, stats.mask, threshold, others,
+                                        positives=stats.positive_areas, negatives=stats.negative_areas)
+        min_containment = round(min(stats.containments), 4) if stats.containments else None
+        results[name] = {
+            'threshold': round(threshold, 4),
+            'matcher': matcher,
+            'radius': stats.radius,
+            'roi': list(stats.roi),
+            'auc': round(auc, 4),
+            'positives': len(positives),
+            'negatives': len(negatives),
+            'min_positive': round(float(positives.min()), 4),
+            'max_negative': round(float(negatives.max()), 4) if len(negatives) else None,
+            'min_containment': min_containment,
+            'rejector': min_containment is not None and min_containment >= reject_threshold,
+            'roc': {
+                'thresholds': thresholds.round(4).tolist(),
+                'tpr': tpr.round(4).tolist(),
+                'fpr': fpr.round(4).tolist()
+            }
+        }
+    return (width, height), results
+
+
+def write_results(width: int, height: int, results: dict):
+    rois_path = get_user_rois_path(width, height)
+    user_rois = {}
+    if os.path.exists(rois_path):
+        with open(rois_path, 'r') as f:
+            user_rois = json.load(f)
+    for name, result in results.items():
+        user_rois[name] = result['roi']
+    write_json_atomic(rois_path, user_rois)
+
+    calibrated = load_calibration_section(width, height, "calibrated_thresholds")
+    calibrated.update({name: r['threshold'] for name, r in results.items()})
+    save_calibration_section(width, height, "calibrated_thresholds", calibrated)
+    # Thresholds learned at runtime started from the old base and would override the new one on warm start
+    learned = load_calibration_section(width, height, "thresholds")
+    save_calibration_section(width, height, "thresholds",
+                             {name: value for name, value in learned.items() if name not in results})
+    radii = load_calibration_section(width, height, "radii")
+    radii.update({name: r['radius'] for name, r in results.items()})
+    save_calibration_section(width, height, "radii", radii)
+    matchers = load_calibration_section(width, height, "matchers")
+    matchers.update({name: r['matcher'] for name, r in results.items()})
+    save_calibration_section(width, height, "matchers", matchers)
+    rejectors = load_calibration_section(width, height, "rejectors")
+    for name, r in results.items():
+        rejectors[name] = {'enabled': r['rejector'], 'min_containment': r['min_containment']}
+        if not r['rejector']:
+            rejectors[name]['reason'] = "false reject in calibration data"
+    save_calibration_section(width, height, "rejectors", rejectors)
+    report = load_calibration_section(width, height, "calibration")
+    report.update({name: {key: value for key, value in r.items() if key != 'roc'} for name, r in results.items()})
+    save_calibration_section(width, height, "calibration", report)
+    print(f"[CALIBRATE] ✅ Wrote {len(results)} ROIs to {rois_path} and thresholds/radii/matchers/rejectors for {width}x{height}")
+
+
+def print_summary(results: dict):
+    print(f"{'template':<18} {'thr':>6} {'auc':>6} {'pos':>5} {'neg':>5} {'min+':>6} {'max-':>6} {'radius':>6} "
+          f"{'reject':>6} {'matcher':>8}  roi")
+    for name, r in sorted(results.items()):
+        max_negative = f"{r['max_negative']:.3f}" if r['max_negative'] is not None else "-"
+        rejector = 'on' if r['rejector'] else 'off'
+        print(f"{name:<18} {r['threshold']:>6.3f} {r['auc']:>6.3f} {r['positives']:>5} {r['negatives']:>5} "
+              f"{r['min_positive']:>6.3f} {max_negative:>6} {r['radius']:>6} {rejector:>6} {r['matcher']:>8}  {tuple(r['roi'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate thresholds and ROIs from a labelled frame corpus")
+    parser.add_argument("corpus", help=f"Directory of frames with a {LABELS_FILE} file")
+    parser.add_argument("--templates", nargs="+", default=list(DEFAULT_TEMPLATES), help="Templates to calibrate")
+    parser.add_argument("--margin", type=int, default=2, help="Extra pixels added to the recommended radius")
+    parser.add_argument("--workers", type=int, default=4, help="Frames matched in parallel")
+    parser.add_argument("--reject-threshold", type=float, default=0.7,
+                        help="Minimum colour containment every positive must reach to keep early rejection on")
+    parser.add_argument("--report", metavar="PATH", help="Write full ROC curves as JSON")
+    parser.add_argument("--dry-run", action="store_true", help="Print recommendations without writing files")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.templates if name not in DEFAULT_TEMPLATES]
+    if unknown:
+        parser.error(f"unknown templates: {', '.join(unknown)}")
+
+    (width, height), results = calibrate(args.corpus, args.templates, args.margin, args.workers,
+                                         args.reject_threshold)
+    if not results:
+        print("[CALIBRATE] ❌ No template had positive labels, nothing to calibrate")
+        return 1
+
+    print_summary(results)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'resolution': [width, height], 'templates': results}, f, indent=2)
+        print(f"[CALIBRATE] ROC report written to {args.report}")
+
+    if not args.dry_run:
+        write_results(width, height, results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
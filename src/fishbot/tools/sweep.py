@@ -0,0 +1,259 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+from src.fishbot.config.detection_config import DEFAULT_TEMPLATES
+from src.fishbot.config.paths import TEMPLATES_PATH
+from src.fishbot.core.game.template_cache import get_template_cache
+
+RANK_KEYS = {
+    'fish_per_hour': True,
+    'cycles_per_hour': True,
+    'loop_fps': True,
+    'tick_p50_ms': False,
+    'tick_p95_ms': False,
+    'frame_age_p95_ms': False,
+    'bite_latency_p50_ms': False,
+}
+
+# Trials share the per-resolution ROI and calibration files, so none of them may write back
+BASE_SETTINGS = {
+    'persist_adaptive_threshold': False,
+    'persist_calibration': False,
+    'roi_autotune_apply': False,
+    'event_log_enabled': False,
+    'file_logging_enabled': False,
+}
+
+
+def parse_value(text: str):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_grid(params: List[str]) -> List[Dict]:
+    names, choices = [], []
+    for param in params:
+        name, sep, values = param.partition("=")
+        if not sep or not values:
+            raise ValueError(f"Invalid --param '{param}', expected name=v1,v2,...")
+        names.append(name.strip())
+        choices.append([parse_value(value.strip()) for value in values.split(",")])
+    return [dict(zip(names, combo)) for combo in itertools.product(*choices)]
+
+
+def unknown_settings(names) -> List[str]:
+    from src.fishbot.config.bot_config import BotConfig
+    from src.fishbot.core.fishing_bot import DETECTION_SETTINGS, SETTING_ALIASES
+
+    bot_config = BotConfig()
+    known = {key for key, value in vars(bot_config).items() if isinstance(value, (bool, int, float, str))}
+    known.update(DETECTION_SETTINGS)
+    return [name for name in names if SETTING_ALIASES.get(name, name) not in known]
+
+
+def preload_templates():
+    cache = get_template_cache()
+    templates = cache.load_all({name: os.path.join(TEMPLATES_PATH, path) for name, path in DEFAULT_TEMPLATES.items()})
+    for template_img, mask in templates.values():
+        template_img.setflags(write=False)
+        if mask is not None:
+            mask.setflags(write=False)
+
+
+def select_trial_matchers(config) -> Dict[str, str]:
+    from src.fishbot.core.game.matchers import MASKED, select_matchers
+
+    width, height = config.get_current_resolution()
+    scale = config.get_template_scale()
+    cache = get_template_cache()
+    loaded = cache.load_all({name: os.path.join(TEMPLATES_PATH, path) for name, path in config.templates.items()})
+    templates = {name: cache.get_scaled(name, width, height, scale) or data for name, data in loaded.items()}
+
+    # Calibrated matchers reach the workers through the calibration file; only the rest are benchmarked here
+    pending = [name for name in templates if name not in config.matchers]
+    results = select_matchers(templates, pending, config.get_precision_for_template)
+    return {name: results.get(name, (MASKED, None))[0] for name in pending}
+
+
+def _init_worker(quiet: bool, scale: float, matchers: Dict[str, str]):
+    if quiet:
+        sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    preload_templates()
+    # Seeding the cache keeps each trial's Detector from benchmarking matchers in the background
+    cache = get_template_cache()
+    for name, matcher in matchers.items():
+        cache.set_matcher(name, scale, matcher)
+
+
+def _ms(percentiles: dict, key: str) -> float:
+    return round(percentiles[key] * 1000, 2)
+
+
+def run_trial(replay: str, settings: dict, duration: float, loop: bool) -> dict:
+    from src.fishbot.core.fishing_bot import FishingBot
+    from src.fishbot.utils.logger import flush_logs
+    from src.fishbot.utils.replay_capture import ReplayCapture
+
+    capture = ReplayCapture(replay, loop=loop)
+    width, height = capture.frame_size
+    bot = FishingBot(window_mode='Windowed', custom_width=width, custom_height=height,
+                     capture_source=capture, input_backend='mock')
+    bot.geometry.refresh_interval = 0
+    bot.apply_settings({**BASE_SETTINGS, **settings})
+
+    bot.start()
+    started_at = time.perf_counter()
+    try:
+        while not bot.is_stopped():
+            if duration > 0 and time.perf_counter() - started_at >= duration:
+                break
+            if not capture.is_running():
+                break
+            bot.update()
+    finally:
+        elapsed = time.perf_counter() - started_at
+        bot.stop()
+        flush_logs()
+
+    stats = bot.stats.stats
+    hours = elapsed / 3600 if elapsed > 0 else 0
+    metrics = bot.metrics
+    return {
+        'settings': settings,
+        'elapsed': round(elapsed, 2),
+        'ticks': bot.tick_count,
+        'loop_fps': round(bot.tick_count / elapsed, 1) if elapsed > 0 else 0.0,
+        'fish_caught': stats.get('fish_caught', 0),
+        'fish_escaped': stats.get('fish_escaped', 0),
+        'timeouts': stats.get('timeouts', 0),
+        'cycles': stats.get('cycles', 0),
+        'fish_per_hour': round(stats.get('fish_caught', 0) / hours, 1) if hours else 0.0,
+        'cycles_per_hour': round(stats.get('cycles', 0) / hours, 1) if hours else 0.0,
+        'tick_p50_ms': _ms(metrics.get_percentiles("tick"), 'p50'),
+        'tick_p95_ms': _ms(metrics.get_percentiles("tick"), 'p95'),
+        'frame_age_p95_ms': _ms(metrics.get_percentiles("frame_age"), 'p95'),
+        'bite_latency_p50_ms': _ms(metrics.get_percentiles("bite_latency"), 'p50'),
+    }
+
+
+def rank(results: List[dict], key: str) -> List[dict]:
+    descending = RANK_KEYS[key]
+    return sorted(results, key=lambda r: r[key], reverse=descending)
+
+
+def print_table(results: List[dict], names: List[str]):
+    columns = ['fish_per_hour', 'cycles_per_hour', 'timeouts', 'loop_fps', 'tick_p50_ms', 'tick_p95_ms',
+               'frame_age_p95_ms', 'bite_latency_p50_ms']
+    widths = [max(len(name), 8) for name in names]
+    header = " ".join(f"{name:>{w}}" for name, w in zip(names, widths))
+    print(f"{'#':>3} {header} " + " ".join(f"{column:>15}" for column in columns))
+    for position, result in enumerate(results, 1):
+        values = " ".join(f"{str(result['settings'].get(name)):>{w}}" for name, w in zip(names, widths))
+        print(f"{position:>3} {values} " + " ".join(f"{result[column]:>15}" for column in columns))
+
+
+def run_sweep(replay: str, grid: List[Dict], duration: float, repeat: int = 1, workers: int = None,
+              loop: bool = True, quiet: bool = True) -> List[dict]:
+    from src.fishbot.config.detection_config import DetectionConfig
+    from src.fishbot.utils.logger import flush_logs
+    from src.fishbot.utils.replay_capture import ReplayCapture
+
+    # Create the per-resolution ROI file once so workers don't race to write it
+    config = DetectionConfig()
+    config.update_resolution(*ReplayCapture(replay).frame_size)
+    matchers = {}
+    if any(settings.get('matcher_autoselect') for settings in grid):
+        started_at = time.perf_counter()
+        matchers = select_trial_matchers(config)
+        print(f"[SWEEP] Matchers for {len(matchers)} templates benchmarked in {time.perf_counter() - started_at:.1f}s")
+        flush_logs()
+
+    # The parent already runs the log writer thread, and forking a process with live threads can leave a
+    # child stuck on a lock held at fork time; workers start clean and decode the templates in the initializer
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+    trials = [settings for settings in grid for _ in range(repeat)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=context,
+                             initializer=_init_worker,
+                             initargs=(quiet, config.get_template_scale(), matchers)) as pool:
+        futures = {pool.submit(run_trial, replay, settings, duration, loop): settings for settings in trials}
+        for done, future in enumerate(as_completed(futures), 1):
+            settings = futures[future]
+            try:
+                results.append(future.result())
+                print(f"[SWEEP] ({done}/{len(trials)}) {settings} done")
+            except Exception as e:
+                print(f"[SWEEP] ❌ ({done}/{len(trials)}) {settings} failed: {e}")
+
+    return average_repeats(results) if repeat > 1 else results
+
+
+def average_repeats(results: List[dict]) -> List[dict]:
+    groups: Dict[str, List[dict]] = {}
+    for result in results:
+        groups.setdefault(json.dumps(result['settings'], sort_keys=True), []).append(result)
+
+    averaged = []
+    for runs in groups.values():
+        merged = {'settings': runs[0]['settings'], 'runs': len(runs)}
+        for key, value in runs[0].items():
+            if key != 'settings' and isinstance(value, (int, float)):
+                merged[key] = round(sum(run[key] for run in runs) / len(runs), 2)
+        averaged.append(merged)
+    return averaged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep bot settings over a replay with a mock controller")
+    parser.add_argument("replay", help="Directory of frames or video file")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2",
+                        help="Setting and the values to try (any bot_settings.json key, repeatable)")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per run (0 = until the replay ends)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per combination, results are averaged")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--replay-once", action="store_true", help="Stop each run when the replay runs out")
+    parser.add_argument("--rank-by", choices=sorted(RANK_KEYS), default='fish_per_hour', help="Ranking column")
+    parser.add_argument("--out", metavar="PATH", help="Write the ranked results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep worker console output")
+    args = parser.parse_args(argv)
+
+    if args.duration <= 0 and not args.replay_once:
+        parser.error("--duration 0 requires --replay-once")
+
+    try:
+        grid = parse_grid(args.param) or [{}]
+    except ValueError as e:
+        parser.error(str(e))
+    unknown = unknown_settings(grid[0])
+    if unknown:
+        parser.error(f"Unknown --param setting(s): {', '.join(unknown)}")
+
+    print(f"[SWEEP] {len(grid)} combinations x {args.repeat} runs, {args.duration:.0f}s each")
+    started_at = time.perf_counter()
+    results = rank(run_sweep(args.replay, grid, args.duration, args.repeat, args.workers,
+                             loop=not args.replay_once, quiet=not args.verbose), args.rank_by)
+    print(f"[SWEEP] Finished in {time.perf_counter() - started_at:.1f}s, ranked by {args.rank_by}")
+
+    names = list(grid[0])
+    print_table(results, names)
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump({'rank_by': args.rank_by, 'results': results}, f, indent=2)
+        print(f"[SWEEP] Results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,18 @@
 import sys
 import os
+import time
+from collections import deque
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit, QGroupBox, QGridLayout, QFrame, QMessageBox
+    QLabel, QPushButton, QPlainTextEdit, QGroupBox, QGridLayout, QFrame, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 
 from .styles import MAIN_STYLESHEET, get_status_style, COLORS
 from .workers import BotWorker, TimerWorker
 from .settings_dialog import SettingsDialog
 from ..utils.logger import set_log_callback
+from ..utils.tracer import get_tracer
 from ..utils.roi_visualizer import main as show_roi_editor
 from ..utils.path import resource_path
 import multiprocessing
@@ -67,6 +70,7 @@ class StatCard(QFrame):
 
 class MainWindow(QMainWindow):    
     MAX_LOG_LINES = 500
+    LOG_FLUSH_INTERVAL_MS = 50
     
     def __init__(self):
         super().__init__()
@@ -74,15 +78,21 @@ class MainWindow(QMainWindow):
         self.timer = TimerWorker(self)
         self._is_paused = False
         self._user_scrolling = False
-        self._log_line_count = 0
+        self._log_buffer = deque(maxlen=self.MAX_LOG_LINES)
+        self._log_overflow = 0
         self._hotkeys_enabled = True
         self._settings = self._default_settings()
         self.visualizer_process = None
+        self._tracer = get_tracer()
         
         self._setup_ui()
         self._connect_signals()
         self._setup_hotkeys()
         
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self._log_flush_timer.start(self.LOG_FLUSH_INTERVAL_MS)
+        
         set_log_callback(self._safe_append_log)
         
         self._check_admin()
@@ -99,6 +109,9 @@ class MainWindow(QMainWindow):
             'quick_finish': False,
             'debug_mode': False,
             'file_logging_enabled': False,
+            'trace_enabled': False,
+            'event_log_enabled': False,
+            'stats_refresh_hz': 4,
             'hotkeys_enabled': True,
         }
         
@@ -175,6 +188,35 @@ class MainWindow(QMainWindow):
         self.roi_btn.clicked.connect(self._open_roi_editor)
         header_layout.addWidget(self.roi_btn)
 
+        self.trace_btn = QPushButton("TRC")
+        self.trace_btn.setFixedSize(35, 22)
+        self.trace_btn.setToolTip("Dump Timeline Trace")
+        self.trace_btn.setStyleSheet(button_style)
+        self.trace_btn.clicked.connect(self._dump_trace)
+        header_layout.addWidget(self.trace_btn)
+
+        self.profile_btn = QPushButton("PRF")
+        self.profile_btn.setFixedSize(35, 22)
+        self.profile_btn.setToolTip("Start/Stop Sampling Profiler")
+        self.profile_btn.setCheckable(True)
+        self.profile_btn.setStyleSheet(f"""
+            QPushButton {{
+                min-width: 30px;
+                max-width: 35px;
+                padding: 2px 4px;
+                font-size: 10px;
+                background-color: {COLORS['bg_light']};
+                border: 1px solid {COLORS['border']};
+                border-radius: 4px;
+            }}
+            QPushButton:checked {{
+                background-color: {COLORS['accent']};
+                color: white;
+            }}
+        """)
+        self.profile_btn.clicked.connect(self._toggle_profiler)
+        header_layout.addWidget(self.profile_btn)
+
         self.bg_btn = QPushButton("🖼️ BG")
         self.bg_btn.setFixedSize(45, 22)
         self.bg_btn.setToolTip("Toggle Background")
@@ -238,6 +280,33 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(status_group)
         
+        perf_group = QGroupBox("Performance")
+        perf_layout = QGridLayout(perf_group)
+        perf_layout.setSpacing(4)
+        
+        self.perf_labels = {}
+        perf_fields = [
+            ('fps', "FPS"), ('frame_age', "Frame Age"),
+            ('cpu', "CPU"), ('frames', "Drop/Dup"),
+        ]
+        for index, (key, title) in enumerate(perf_fields):
+            title_label = QLabel(title)
+            title_label.setStyleSheet(f"font-size: 10px; color: {COLORS['text_secondary']};")
+            value_label = QLabel("-")
+            value_label.setStyleSheet(f"font-size: 11px; color: {COLORS['text_primary']};")
+            perf_layout.addWidget(title_label, index // 2, (index % 2) * 2)
+            perf_layout.addWidget(value_label, index // 2, (index % 2) * 2 + 1)
+            self.perf_labels[key] = value_label
+        
+        self.perf_templates_label = QLabel("-")
+        self.perf_templates_label.setWordWrap(True)
+        self.perf_templates_label.setStyleSheet(f"font-size: 10px; color: {COLORS['text_secondary']};")
+        perf_layout.addWidget(self.perf_templates_label, 2, 0, 1, 4)
+        
+        main_layout.addWidget(perf_group)
+        
+        self._last_gui_cpu = None
+        
         controls_layout = QHBoxLayout()
         controls_layout.setSpacing(10)
         
@@ -261,11 +330,12 @@ class MainWindow(QMainWindow):
         log_layout.setContentsMargins(8, 10, 8, 8)
         log_layout.setSpacing(5)
         
-        self.log_console = QTextEdit()
+        self.log_console = QPlainTextEdit()
         self.log_console.setReadOnly(True)
+        self.log_console.setMaximumBlockCount(self.MAX_LOG_LINES)
         self.log_console.setMinimumHeight(150)
         self.log_console.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {COLORS['bg_dark']};
                 color: {COLORS['text_primary']};
                 border: 1px solid {COLORS['border']};
@@ -361,6 +431,31 @@ class MainWindow(QMainWindow):
         p = multiprocessing.Process(target=show_roi_editor, args=(monitor_index,), daemon=True)
         p.start()
     
+    def _dump_trace(self):
+        if not self._tracer.enabled:
+            self._append_log("[GUI] Tracing is disabled (enable it in Settings)")
+            return
+        
+        path = self._tracer.flush(background=True)
+        if path:
+            self._append_log(f"[GUI] 📼 Writing trace to {path}")
+    
+    @pyqtSlot()
+    def _toggle_profiler(self):
+        if self.worker is None:
+            self._append_log("[GUI] Start the bot before profiling")
+            self.profile_btn.setChecked(False)
+            return
+        
+        if self.worker.is_profiling():
+            self.worker.stop_profiling()
+            self.profile_btn.setChecked(False)
+        elif self.worker.start_profiling():
+            self.profile_btn.setChecked(True)
+        else:
+            self._append_log("[GUI] Bot thread not running yet")
+            self.profile_btn.setChecked(False)
+    
     def _toggle_background(self, checked: bool):
         if checked:
             bg_path = resource_path('maskot2.png')
@@ -380,7 +475,7 @@ class MainWindow(QMainWindow):
                         background-color: rgba(0, 0, 0, 40);
                         border: 1px solid rgba(255, 255, 255, 50);
                     }
-                    QTextEdit {
+                    QPlainTextEdit {
                         background-color: rgba(0, 0, 0, 40);
                         border: 1px solid rgba(255, 255, 255, 50);
                     }
@@ -418,6 +513,7 @@ class MainWindow(QMainWindow):
             self.worker = BotWorker(self._settings)
             self.worker.state_changed.connect(self._on_state_changed)
             self.worker.stats_updated.connect(self._on_stats_updated)
+            self.worker.perf_updated.connect(self._on_perf_updated)
             self.worker.log_message.connect(self._append_log)
             self.worker.bot_stopped.connect(self._on_bot_stopped)
             self.worker.bot_error.connect(self._on_bot_error)
@@ -473,9 +569,35 @@ class MainWindow(QMainWindow):
     
     @pyqtSlot(dict)
     def _on_stats_updated(self, stats: dict):
-        for key, value in stats.items():
-            if key in self.stat_cards:
-                self.stat_cards[key].set_value(value)
+        with self._tracer.span("gui:stats_updated", "gui"):
+            for key, value in stats.items():
+                if key in self.stat_cards:
+                    self.stat_cards[key].set_value(value)
+    
+    @pyqtSlot(dict)
+    def _on_perf_updated(self, perf: dict):
+        now = time.perf_counter()
+        cpu_time = time.thread_time()
+        gui_cpu = 0.0
+        if self._last_gui_cpu is not None and now > self._last_gui_cpu[0]:
+            gui_cpu = (cpu_time - self._last_gui_cpu[1]) / (now - self._last_gui_cpu[0]) * 100
+        self._last_gui_cpu = (now, cpu_time)
+        
+        capture_fps = f"{perf['capture_fps']:.0f}" if perf['async_capture'] else "sync"
+        self.perf_labels['fps'].setText(f"{perf['loop_fps']:.0f} loop / {capture_fps} cap")
+        self.perf_labels['frame_age'].setText(
+            f"{perf['frame_age']['p50'] * 1000:.1f} / {perf['frame_age']['p95'] * 1000:.1f} ms"
+        )
+        self.perf_labels['cpu'].setText(
+            f"cap {perf['capture_cpu']:.0f}% bot {perf['bot_cpu']:.0f}% gui {gui_cpu:.0f}%"
+        )
+        self.perf_labels['frames'].setText(f"{perf['dropped_frames']} / {perf['duplicate_frames']}")
+        
+        slowest = sorted(perf['templates'].items(), key=lambda item: item[1]['p50'], reverse=True)[:3]
+        if slowest:
+            self.perf_templates_label.setText(
+                "Slowest: " + ", ".join(f"{name} {stats['p50'] * 1000:.1f} ms" for name, stats in slowest)
+            )
     
     @pyqtSlot()
     def _on_bot_stopped(self):
@@ -495,38 +617,45 @@ class MainWindow(QMainWindow):
         scrollbar = self.log_console.verticalScrollBar()
         self._user_scrolling = (value < scrollbar.maximum() - 10)
     
-    @pyqtSlot(str)
     def _safe_append_log(self, message: str):
-        from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-        QMetaObject.invokeMethod(
-            self, "_append_log",
-            Qt.ConnectionType.QueuedConnection,
-            Q_ARG(str, message)
-        )
+        if len(self._log_buffer) == self.MAX_LOG_LINES:
+            self._log_overflow += 1
+        self._log_buffer.append(message)
     
     @pyqtSlot(str)
     def _append_log(self, message: str):
-        if self._log_line_count >= self.MAX_LOG_LINES:
-            cursor = self.log_console.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)
-            cursor.movePosition(cursor.MoveOperation.Down, cursor.MoveMode.KeepAnchor, 50)
-            cursor.removeSelectedText()
-            self._log_line_count -= 50
-        
-        self.log_console.append(message)
-        self._log_line_count += 1
-        
-        if not self._is_paused and not self._user_scrolling:
-            scrollbar = self.log_console.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+        self._safe_append_log(message)
+    
+    def _flush_log_buffer(self):
+        if not self._log_buffer:
+            return
+        
+        with self._tracer.span("gui:flush_log", "gui"):
+            lines = []
+            while self._log_buffer:
+                try:
+                    lines.append(self._log_buffer.popleft())
+                except IndexError:
+                    break
+            
+            if self._log_overflow:
+                lines.insert(0, f"[GUI] ⚠️ {self._log_overflow} log lines skipped")
+                self._log_overflow = 0
+            
+            self.log_console.appendPlainText("\n".join(lines))
+            
+            if not self._is_paused and not self._user_scrolling:
+                scrollbar = self.log_console.verticalScrollBar()
+                scrollbar.setValue(scrollbar.maximum())
     
     def _clear_log(self):
+        self._log_buffer.clear()
         self.log_console.clear()
-        self._log_line_count = 0
         
     def _reset_ui(self, stopped: bool = False):
         self._is_paused = False
         self._user_scrolling = False
+        self.profile_btn.setChecked(False)
         
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
@@ -540,6 +669,11 @@ class MainWindow(QMainWindow):
         for key in self.stat_cards:
             self.stat_cards[key].set_value(0)
         
+        for label in self.perf_labels.values():
+            label.setText("-")
+        self.perf_templates_label.setText("-")
+        self._last_gui_cpu = None
+        
         if not stopped:
             self.status_label.setText("READY")
             self.status_label.setStyleSheet(get_status_style('READY'))
@@ -36,7 +36,8 @@ class ROIEditorDialog(QDialog):
         select_layout = QVBoxLayout(select_group)
         
         self.template_combo = QComboBox()
-        self.template_combo.addItems(sorted(self.detection_config.templates.keys()))
+        names = set(self.detection_config.templates) | set(self.detection_config.template_groups)
+        self.template_combo.addItems(sorted(names))
         self.template_combo.currentIndexChanged.connect(self._load_selected_roi)
         select_layout.addWidget(self.template_combo)
         
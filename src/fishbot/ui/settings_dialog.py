@@ -122,6 +122,21 @@ class SettingsDialog(QDialog):
         self.file_logging_checkbox.setToolTip("Save logs to file (logs/fishbot.log)")
         bot_layout.addWidget(self.file_logging_checkbox, 5, 0, 1, 2)
         
+        self.trace_checkbox = QCheckBox("Enable Timeline Tracing")
+        self.trace_checkbox.setToolTip("Record a Chrome trace of bot ticks (logs/traces/), auto-dumped on slow ticks")
+        bot_layout.addWidget(self.trace_checkbox, 6, 0, 1, 2)
+        
+        self.event_log_checkbox = QCheckBox("Enable Event Log (JSONL)")
+        self.event_log_checkbox.setToolTip("Write structured session events to logs/events.jsonl")
+        bot_layout.addWidget(self.event_log_checkbox, 7, 0, 1, 2)
+        
+        bot_layout.addWidget(QLabel("Stats Refresh (Hz):"), 8, 0)
+        self.stats_refresh_spinbox = QSpinBox()
+        self.stats_refresh_spinbox.setRange(0, 60)
+        self.stats_refresh_spinbox.setValue(4)
+        self.stats_refresh_spinbox.setToolTip("How often the dashboard stats refresh. Counter changes are always shown immediately. 0 = every tick")
+        bot_layout.addWidget(self.stats_refresh_spinbox, 8, 1)
+        
         layout.addWidget(bot_group)
         
         hotkey_group = QGroupBox("⌨️ Hotkeys")
@@ -194,6 +209,9 @@ class SettingsDialog(QDialog):
         self.quick_finish_checkbox.setChecked(self._current_settings.get('quick_finish', False))
         self.debug_checkbox.setChecked(self._current_settings.get('debug_mode', False))
         self.file_logging_checkbox.setChecked(self._current_settings.get('file_logging_enabled', False))
+        self.trace_checkbox.setChecked(self._current_settings.get('trace_enabled', False))
+        self.event_log_checkbox.setChecked(self._current_settings.get('event_log_enabled', False))
+        self.stats_refresh_spinbox.setValue(self._current_settings.get('stats_refresh_hz', 4))
         
         self.hotkey_checkbox.setChecked(self._current_settings.get('hotkeys_enabled', True))
     
@@ -209,5 +227,8 @@ class SettingsDialog(QDialog):
             'quick_finish': self.quick_finish_checkbox.isChecked(),
             'debug_mode': self.debug_checkbox.isChecked(),
             'file_logging_enabled': self.file_logging_checkbox.isChecked(),
+            'trace_enabled': self.trace_checkbox.isChecked(),
+            'event_log_enabled': self.event_log_checkbox.isChecked(),
+            'stats_refresh_hz': self.stats_refresh_spinbox.value(),
             'hotkeys_enabled': self.hotkey_checkbox.isChecked(),
         }
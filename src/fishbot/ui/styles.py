@@ -121,7 +121,7 @@ QLabel#statLabel {{
     color: {COLORS['text_secondary']};
 }}
 
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     background-color: {COLORS['bg_medium']};
     color: {COLORS['text_primary']};
     border: 1px solid {COLORS['border']};
@@ -131,7 +131,7 @@ QTextEdit {{
     font-size: 11px;
 }}
 
-QTextEdit:focus {{
+QTextEdit:focus, QPlainTextEdit:focus {{
     border-color: {COLORS['accent']};
 }}
 
@@ -1,10 +1,18 @@
+import threading
+import time
+
 from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QMetaObject, Qt, Q_ARG
 
+from src.fishbot.utils.profiler import SamplingProfiler
+
 
 class BotWorker(QThread):
+    PERF_INTERVAL = 1.0
+    
     state_changed = pyqtSignal(str)
     log_message = pyqtSignal(str)
     stats_updated = pyqtSignal(dict)
+    perf_updated = pyqtSignal(dict)
     bot_stopped = pyqtSignal()
     bot_ready = pyqtSignal()
     bot_error = pyqtSignal(str)
@@ -19,10 +27,20 @@ class BotWorker(QThread):
         self._should_stop = False
         self._session_start_time = 0
         self._session_time_limit = settings.get('session_time_limit', 0)
+        self._thread_id = None
+        self.profiler = SamplingProfiler()
+        self._last_state = None
+        self._last_counters = None
+        self._last_stats_emit = 0.0
+        self._last_perf_emit = 0.0
+        stats_hz = settings.get('stats_refresh_hz', 4)
+        self._stats_interval = 1.0 / stats_hz if stats_hz > 0 else 0.0
         
     def run(self):
         import time
         
+        self._thread_id = threading.get_ident()
+        
         try:
             self.log_message.emit("[GUI] ⏳ Initializing bot...")
             self._init_bot()
@@ -48,11 +66,9 @@ class BotWorker(QThread):
                 if not self._is_paused:
                     try:
                         self.bot.update()
-                        
-                        if self.bot.state_machine.current_state_name:
-                            self.state_changed.emit(self.bot.state_machine.current_state_name.name)
-                        
-                        self.stats_updated.emit(self.bot.stats.get_extended_stats())
+                        self._publish_state()
+                        self._publish_stats()
+                        self._publish_perf()
                         
                     except Exception as e:
                         self.log_message.emit(f"[ERROR] Bot update failed: {e}")
@@ -66,12 +82,39 @@ class BotWorker(QThread):
             self.bot_error.emit(str(e))
             self.log_message.emit(f"[ERROR] ❌ Bot initialization failed: {e}")
         finally:
+            self.stop_profiling()
             self._cleanup()
             self.bot_stopped.emit()
     
+    def _publish_state(self):
+        state_name = self.bot.state_machine.current_state_name
+        if state_name is not None and state_name != self._last_state:
+            self._last_state = state_name
+            self.state_changed.emit(state_name.name)
+    
+    def _publish_stats(self, force: bool = False):
+        now = time.monotonic()
+        counters = tuple(self.bot.stats.stats.values())
+        
+        if not force and counters == self._last_counters and now - self._last_stats_emit < self._stats_interval:
+            return
+        
+        self._last_counters = counters
+        self._last_stats_emit = now
+        self.stats_updated.emit(self.bot.stats.get_extended_stats())
+    
+    def _publish_perf(self):
+        now = time.monotonic()
+        if now - self._last_perf_emit < self.PERF_INTERVAL:
+            return
+        
+        self._last_perf_emit = now
+        self.perf_updated.emit(self.bot.get_perf_snapshot())
+    
     def _init_bot(self):
         from src.fishbot.core.fishing_bot import FishingBot
         from src.fishbot.utils.logger import setup_file_logging, set_debug_mode
+        from src.fishbot.utils.event_log import setup_event_logging
         
         window_mode = self.settings.get('window_mode', 'Auto Detect')
         custom_width = self.settings.get('custom_width', 1920)
@@ -80,6 +123,9 @@ class BotWorker(QThread):
         if self.settings.get('file_logging_enabled', False):
             setup_file_logging()
         
+        if self.settings.get('event_log_enabled', False):
+            setup_event_logging()
+        
         set_debug_mode(self.settings.get('debug_mode', False))
         
         self.bot = FishingBot(
@@ -93,6 +139,8 @@ class BotWorker(QThread):
         self.bot.config.bot.quick_finish_enabled = self.settings.get('quick_finish', False)
         self.bot.config.bot.debug_mode = self.settings.get('debug_mode', False)
         self.bot.config.bot.selected_monitor = self.settings.get('selected_monitor', 0)
+        self.bot.config.bot.trace_enabled = self.settings.get('trace_enabled', False)
+        self.bot.configure_tracing(enabled=self.bot.config.bot.trace_enabled)
         
         if self.bot.config.bot.target_fps > 0:
             self.bot.target_delay = 1.0 / self.bot.config.bot.target_fps
@@ -123,6 +171,7 @@ class BotWorker(QThread):
         self.state_changed.emit('PAUSED')
     
     def resume(self):
+        self._last_state = None
         self._is_paused = False
     
     def stop(self):
@@ -132,6 +181,18 @@ class BotWorker(QThread):
         
     def is_paused(self):
         return self._is_paused
+    
+    def start_profiling(self) -> bool:
+        if self._thread_id is None:
+            return False
+        self.profiler.start(self._thread_id)
+        return True
+    
+    def stop_profiling(self):
+        return self.profiler.stop()
+    
+    def is_profiling(self) -> bool:
+        return self.profiler.is_running()
 
 
 class TimerWorker(QTimer):
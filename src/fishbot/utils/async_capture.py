@@ -1,6 +1,6 @@
 import threading
 import time
-from typing import Optional
+from typing import Optional, Tuple
 import numpy as np
 
 try:
@@ -15,7 +15,11 @@ class AsyncScreenCapture:
         self.monitor = monitor
         self.fps = fps
         self._frame: Optional[np.ndarray] = None
+        self._frame_time: float = 0
+        self._frame_id: int = 0
+        self.cpu_time: float = 0
         self._lock = threading.Lock()
+        self._first_frame = threading.Event()
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._sct = None
@@ -39,13 +43,27 @@ class AsyncScreenCapture:
 
     def update_monitor(self, monitor: dict):
         with self._lock:
+            resized = (monitor['width'], monitor['height']) != (self.monitor['width'], self.monitor['height'])
             self.monitor = monitor
+            if resized:
+                self._frame = None
+                self._first_frame.clear()
 
     def get_latest_frame(self) -> Optional[np.ndarray]:
+        frame, _, _ = self.get_latest_frame_info()
+        return frame
+
+    def get_latest_frame_info(self) -> Tuple[Optional[np.ndarray], float, int]:
         with self._lock:
             if self._frame is not None:
-                return self._frame.copy()
-            return None
+                return self._frame.copy(), self._frame_time, self._frame_id
+            return None, 0, 0
+
+    def get_frames_captured(self) -> int:
+        return self._frame_id
+
+    def wait_for_frame(self, timeout: float = None) -> bool:
+        return self._first_frame.wait(timeout)
 
     def _capture_loop(self):
         self._sct = mss.mss()
@@ -58,13 +76,18 @@ class AsyncScreenCapture:
                     current_monitor = self.monitor.copy()
                 
                 screenshot = self._sct.grab(current_monitor)
+                grabbed_at = time.perf_counter()
                 img = np.array(screenshot)
                 
                 if img is not None and img.size > 0:
                     frame = cv.cvtColor(img, cv.COLOR_BGRA2BGR)
                     with self._lock:
                         self._frame = frame
+                        self._frame_time = grabbed_at
+                        self._frame_id += 1
+                    self._first_frame.set()
                 
+                self.cpu_time = time.thread_time()
                 elapsed = time.perf_counter() - start_time
                 sleep_time = max(0, self._frame_interval - elapsed)
                 if sleep_time > 0:
@@ -1,25 +1,162 @@
+import ctypes
+import ctypes.util
 import os
+import select
+import struct
+import sys
 import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from src.fishbot.utils.logger import log
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _InotifyBackend:
+    name = "inotify"
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        self._dir_wds: Dict[str, int] = {}
+
+    def watch(self, path: str):
+        directory = os.path.dirname(path)
+        if directory in self._dir_wds or not os.path.isdir(directory):
+            return
+
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+        self._dir_wds[directory] = wd
+
+    def unwatch(self, path: str):
+        pass
+
+    def wait(self, timeout: float) -> Set[str]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            directory = self._dirs.get(wd)
+            if directory and name:
+                changed.add(os.path.join(directory, os.fsdecode(name)))
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingBackend:
+    name = "polling"
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+        self._mtimes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0
+
+    def watch(self, path: str):
+        with self._lock:
+            self._mtimes[path] = self._get_mtime(path)
+
+    def unwatch(self, path: str):
+        with self._lock:
+            self._mtimes.pop(path, None)
+
+    def wait(self, timeout: float) -> Set[str]:
+        time.sleep(min(timeout, self.poll_interval))
+
+        changed = set()
+        with self._lock:
+            for path, last_mtime in self._mtimes.items():
+                mtime = self._get_mtime(path)
+                if mtime != last_mtime:
+                    self._mtimes[path] = mtime
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        pass
 
 
 class ConfigWatcher:
-    def __init__(self, file_path: str, callback: Callable[[], None], poll_interval: float = 1.0):
-        self.file_path = file_path
+    def __init__(self, file_path=None, callback: Callable[[Set[str], float], None] = None,
+                 poll_interval: float = 1.0, debounce: float = 0.3, max_delay: float = 2.0,
+                 use_inotify: bool = True):
         self.callback = callback
         self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.use_inotify = use_inotify
+        self.failures = 0
+        self._paths: Set[str] = set()
+        self._lock = threading.Lock()
+        self._backend = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._last_mtime: float = 0
+
+        if isinstance(file_path, (str, os.PathLike)):
+            file_path = [file_path]
+        for path in file_path or ():
+            self.watch(path)
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name if self._backend else "none"
+
+    @property
+    def file_path(self) -> Optional[str]:
+        with self._lock:
+            return next(iter(sorted(self._paths)), None)
 
     def start(self):
         if self._running:
             return
-        
+
+        self._backend = self._create_backend()
+        with self._lock:
+            paths = list(self._paths)
+        for path in paths:
+            self._backend.watch(path)
+
         self._running = True
-        self._last_mtime = self._get_mtime()
-        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._thread = threading.Thread(target=self._watch_loop, name="ConfigWatcher", daemon=True)
         self._thread.start()
 
     def stop(self):
@@ -27,37 +164,82 @@ class ConfigWatcher:
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        if self._backend:
+            self._backend.close()
+            self._backend = None
 
-    def _get_mtime(self) -> float:
-        try:
-            if os.path.exists(self.file_path):
-                return os.path.getmtime(self.file_path)
-        except Exception:
-            pass
-        return 0
+    def _create_backend(self):
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend()
+            except Exception as e:
+                log(f"[WATCHER] inotify unavailable, falling back to polling: {e}")
+        return _PollingBackend(self.poll_interval)
+
+    def watch(self, path):
+        path = os.path.abspath(os.fspath(path))
+        with self._lock:
+            self._paths.add(path)
+        if self._backend:
+            self._backend.watch(path)
+
+    def watch_all(self, paths: Iterable):
+        for path in paths:
+            self.watch(path)
+
+    def unwatch(self, path):
+        path = os.path.abspath(os.fspath(path))
+        with self._lock:
+            self._paths.discard(path)
+        if self._backend:
+            self._backend.unwatch(path)
+
+    def set_path(self, old_path, new_path):
+        self.unwatch(old_path)
+        self.watch(new_path)
 
     def _watch_loop(self):
+        pending: Set[str] = set()
+        first_change = 0.0
+        last_change = 0.0
+
         while self._running:
+            timeout = self.poll_interval
+            if pending:
+                timeout = max(0.01, min(self.debounce - (time.perf_counter() - last_change), timeout))
+
             try:
-                current_mtime = self._get_mtime()
-                
-                if current_mtime > self._last_mtime and self._last_mtime > 0:
-                    self._last_mtime = current_mtime
-                    try:
-                        self.callback()
-                    except Exception:
-                        pass
-                elif current_mtime != self._last_mtime:
-                    self._last_mtime = current_mtime
-                    
-            except Exception:
-                pass
-            
-            time.sleep(self.poll_interval)
+                changed = self._backend.wait(timeout)
+            except Exception as e:
+                log(f"[WATCHER] Watch error: {e}")
+                time.sleep(self.poll_interval)
+                continue
+
+            with self._lock:
+                changed &= self._paths
+
+            now = time.perf_counter()
+            if changed:
+                if not pending:
+                    first_change = now
+                pending |= changed
+                last_change = now
+
+            if pending and (now - last_change >= self.debounce or now - first_change >= self.max_delay):
+                self._fire(pending, first_change)
+                pending = set()
+
+    def _fire(self, changed: Set[str], first_change: float):
+        try:
+            self.callback(changed, first_change)
+        except Exception as e:
+            self.failures += 1
+            log(f"[WATCHER] Reload callback failed: {e}")
 
     def is_running(self) -> bool:
         return self._running
 
     def trigger_reload(self):
-        if self.callback:
-            self.callback()
+        with self._lock:
+            paths = set(self._paths)
+        self._fire(paths, time.perf_counter())
@@ -0,0 +1,165 @@
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Optional
+
+from src.fishbot.utils.logger import log, get_log_dir
+
+
+class EventLogWriter:
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3,
+                 buffer_size: int = 64 * 1024, flush_interval: float = 1.0, queue_size: int = 50000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._size = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._running:
+            return
+
+        parent_dir = os.path.dirname(self.path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+
+        self._open()
+        self._running = True
+        self._thread = threading.Thread(target=self._write_loop, name="EventLogWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self._running:
+            return
+
+        self._running = False
+        self._queue.put(None)
+        if self._thread:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self._close()
+
+    def put(self, event: dict):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _open(self):
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=self.buffer_size)
+        self._size = self._file.tell()
+
+    def _close(self):
+        if self._file:
+            self._file.flush()
+            self._file.close()
+            self._file = None
+
+    def _rotate(self):
+        self._close()
+
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+        self._open()
+
+    def _write_loop(self):
+        last_flush = time.monotonic()
+
+        while True:
+            try:
+                event = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                event = False
+
+            if event is None:
+                break
+
+            try:
+                if event:
+                    line = json.dumps(event, ensure_ascii=False, separators=(',', ':')) + "\n"
+                    self._file.write(line)
+                    self._size += len(line.encode('utf-8'))
+
+                    if self.max_bytes > 0 and self._size >= self.max_bytes:
+                        self._rotate()
+
+                now = time.monotonic()
+                if now - last_flush >= self.flush_interval:
+                    self._file.flush()
+                    last_flush = now
+            except Exception as e:
+                log(f"[EVENTS] Failed to write event: {e}")
+
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event:
+                try:
+                    self._file.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + "\n")
+                except Exception:
+                    pass
+
+
+_writer: Optional[EventLogWriter] = None
+_session_id: str = ""
+
+
+def setup_event_logging(log_dir: str = None, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3) -> str:
+    global _writer, _session_id
+
+    disable_event_logging()
+
+    if log_dir is None:
+        log_dir = get_log_dir()
+
+    path = os.path.join(log_dir, "events.jsonl")
+    writer = EventLogWriter(path, max_bytes=max_bytes, backup_count=backup_count)
+    writer.start()
+
+    _session_id = uuid.uuid4().hex[:12]
+    _writer = writer
+
+    log(f"[EVENTS] Structured event log enabled: {path}")
+    return path
+
+
+def disable_event_logging():
+    global _writer
+
+    writer = _writer
+    _writer = None
+    if writer:
+        writer.stop()
+
+
+def is_event_logging_enabled() -> bool:
+    return _writer is not None
+
+
+def emit_event(event_type: str, **fields):
+    writer = _writer
+    if writer is None:
+        return
+
+    event = {'type': event_type, 't': time.perf_counter(), 'ts': time.time(), 'session': _session_id}
+    event.update(fields)
+    writer.put(event)
@@ -1,14 +1,117 @@
+import atexit
 import time
 import os
+import queue
+import threading
 import logging
 from logging.handlers import RotatingFileHandler
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
 
 _log_callback: Optional[Callable[[str], None]] = None
 _file_logger: Optional[logging.Logger] = None
 _debug_enabled: bool = False
 _file_logging_enabled: bool = False
 _log_file_path: str = ""
+_log_dir: str = ""
+
+_QUEUE_SIZE = 10000
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+_FLUSH = object()
+_REPEAT_FLUSH_INTERVAL = 1.0
+
+_queue: "queue.Queue" = queue.Queue(maxsize=_QUEUE_SIZE)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_dropped_count: int = 0
+_reported_dropped: int = 0
+
+_throttle_last: Dict[object, float] = {}
+
+_last_message: Optional[str] = None
+_last_level: str = "INFO"
+_last_seen: float = 0
+_last_repeat_time: float = 0
+_repeat_started: float = 0
+_repeat_count: int = 0
+
+
+class _LogSink:
+    def __init__(self, name: str, write: Callable[[float, str, str, str], None], rate: float = 0, burst: int = 0):
+        self.name = name
+        self._write = write
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._suppressed = 0
+
+    def set_budget(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+
+    def _allow(self, level: str) -> bool:
+        if self.rate <= 0 or _LEVELS.get(level, logging.INFO) >= logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+
+        self._suppressed += 1
+        return False
+
+    def report_suppressed(self, created: float):
+        if self._suppressed:
+            notice = f"[LOGGER] ⚠️ {self._suppressed} messages suppressed ({self.name} budget)"
+            self._suppressed = 0
+            timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+            self._write(created, "WARNING", notice, f"[{timestamp}] {notice}")
+
+    def emit(self, created: float, level: str, message: str, formatted: str):
+        if not self._allow(level):
+            return
+
+        self.report_suppressed(created)
+        self._write(created, level, message, formatted)
+
+
+def _write_console(created: float, level: str, message: str, formatted: str):
+    print(formatted)
+
+
+def _write_gui(created: float, level: str, message: str, formatted: str):
+    if _log_callback is not None:
+        try:
+            _log_callback(formatted)
+        except Exception:
+            pass
+
+
+def _write_file(created: float, level: str, message: str, formatted: str):
+    if _file_logging_enabled and _file_logger:
+        try:
+            _file_logger.log(_LEVELS.get(level.upper(), logging.INFO), message)
+        except Exception:
+            pass
+
+
+_sinks: Dict[str, _LogSink] = {
+    'console': _LogSink('console', _write_console, rate=200, burst=400),
+    'gui': _LogSink('gui', _write_gui, rate=30, burst=100),
+    'file': _LogSink('file', _write_file, rate=500, burst=1000),
+}
 
 
 def set_log_callback(callback: Callable[[str], None]):
@@ -25,22 +128,29 @@ def is_debug_enabled() -> bool:
     return _debug_enabled
 
 
+def get_log_dir() -> str:
+    if _log_dir:
+        return _log_dir
+    return os.path.join(os.getcwd(), "logs")
+
+
 def setup_file_logging(log_dir: str = None, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3):
-    global _file_logger, _file_logging_enabled, _log_file_path
-    
+    global _file_logger, _file_logging_enabled, _log_file_path, _log_dir
+
     if log_dir is None:
-        log_dir = os.path.join(os.getcwd(), "logs")
-    
+        log_dir = get_log_dir()
+
     os.makedirs(log_dir, exist_ok=True)
-    
+    _log_dir = log_dir
+
     _log_file_path = os.path.join(log_dir, "fishbot.log")
-    
+
     _file_logger = logging.getLogger("fishbot")
     _file_logger.setLevel(logging.DEBUG)
-    
+
     for handler in _file_logger.handlers[:]:
         _file_logger.removeHandler(handler)
-    
+
     file_handler = RotatingFileHandler(
         _log_file_path,
         maxBytes=max_bytes,
@@ -48,24 +158,26 @@ def setup_file_logging(log_dir: str = None, max_bytes: int = 5 * 1024 * 1024, ba
         encoding='utf-8'
     )
     file_handler.setLevel(logging.DEBUG)
-    
+
     formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
     file_handler.setFormatter(formatter)
-    
+
     _file_logger.addHandler(file_handler)
     _file_logging_enabled = True
-    
+
     log(f"[LOGGER] File logging enabled: {_log_file_path}")
 
 
 def disable_file_logging():
     global _file_logger, _file_logging_enabled
-    
+
+    flush_logs()
+
     if _file_logger:
         for handler in _file_logger.handlers[:]:
             handler.close()
             _file_logger.removeHandler(handler)
-    
+
     _file_logging_enabled = False
 
 
@@ -73,45 +185,162 @@ def get_log_file_path() -> str:
     return _log_file_path
 
 
-def log(message: str, level: str = "INFO"):
-    timestamp = time.strftime("%H:%M:%S")
-    formatted_message = f"[{timestamp}] {message}"
-    
-    print(formatted_message)
-    
-    if _log_callback is not None:
+def get_dropped_count() -> int:
+    return _dropped_count
+
+
+def set_sink_budget(sink: str, rate: float, burst: int):
+    _sinks[sink].set_budget(rate, burst)
+
+
+def _ensure_writer():
+    global _writer_thread
+
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="LogWriter", daemon=True)
+            _writer_thread.start()
+
+
+def _writer_loop():
+    while True:
         try:
-            _log_callback(formatted_message)
-        except Exception:
-            pass
-    
-    if _file_logging_enabled and _file_logger:
+            record = _queue.get(timeout=_REPEAT_FLUSH_INTERVAL)
+        except queue.Empty:
+            _flush_pending()
+            continue
+
         try:
-            level_map = {
-                "DEBUG": logging.DEBUG,
-                "INFO": logging.INFO,
-                "WARNING": logging.WARNING,
-                "ERROR": logging.ERROR,
-                "CRITICAL": logging.CRITICAL
-            }
-            log_level = level_map.get(level.upper(), logging.INFO)
-            _file_logger.log(log_level, message)
+            if record is _FLUSH:
+                _flush_pending()
+            else:
+                _handle_record(*record)
+                _report_dropped()
         except Exception:
             pass
+        finally:
+            _queue.task_done()
+
+
+def _handle_record(created: float, level: str, message: str, args: tuple):
+    global _last_message, _last_level, _last_seen, _last_repeat_time, _repeat_started, _repeat_count
+
+    if args:
+        message = message % args
+
+    # Only back-to-back repeats collapse; a throttled line seconds later is printed as is
+    if message == _last_message and created - _last_seen <= _REPEAT_FLUSH_INTERVAL:
+        _last_seen = created
+        if _repeat_count == 0:
+            _repeat_started = created
+        _repeat_count += 1
+        _last_repeat_time = created
+        if created - _repeat_started >= _REPEAT_FLUSH_INTERVAL:
+            _flush_repeats()
+        return
+
+    _flush_repeats()
+    _last_message = message
+    _last_level = level
+    _last_seen = created
+    _write_record(created, level, message, ())
+
+
+def _flush_repeats():
+    global _repeat_count
+
+    if _repeat_count:
+        count = _repeat_count
+        _repeat_count = 0
+        if count == 1:
+            _write_record(_last_repeat_time, _last_level, _last_message, ())
+        else:
+            _write_record(_last_repeat_time, _last_level, "%s (x%d)", (_last_message, count))
+
+
+def _flush_pending():
+    _flush_repeats()
+
+    now = time.time()
+    for sink in _sinks.values():
+        sink.report_suppressed(now)
+
+
+def _report_dropped():
+    global _reported_dropped
+
+    dropped = _dropped_count
+    if dropped != _reported_dropped:
+        lost = dropped - _reported_dropped
+        _reported_dropped = dropped
+        _write_record(time.time(), "WARNING", "[LOGGER] ⚠️ Log queue full, dropped %d messages", (lost,))
+
+
+def _write_record(created: float, level: str, message: str, args: tuple):
+    if args:
+        message = message % args
+
+    timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+    formatted_message = f"[{timestamp}] {message}"
+
+    for sink in _sinks.values():
+        sink.emit(created, level, message, formatted_message)
+
+
+def log(message: str, level: str = "INFO", args: tuple = ()):
+    global _dropped_count
+
+    _ensure_writer()
+
+    try:
+        _queue.put_nowait((time.time(), level, message, args))
+    except queue.Full:
+        _dropped_count += 1
+
+
+def log_throttled(key, interval: float, message: str, level: str = "INFO", args: tuple = ()) -> bool:
+    now = time.monotonic()
+    last = _throttle_last.get(key)
+    if last is not None and now - last < interval:
+        return False
+
+    _throttle_last[key] = now
+    log(message, level, args)
+    return True
+
+
+def flush_logs(timeout: float = 2.0):
+    if _writer_thread is None or not _writer_thread.is_alive():
+        return
+
+    try:
+        _queue.put_nowait(_FLUSH)
+    except queue.Full:
+        pass
+
+    deadline = time.time() + timeout
+    while _queue.unfinished_tasks and time.time() < deadline:
+        time.sleep(0.01)
+
+
+atexit.register(flush_logs)
 
 
-def debug(message: str):
+def debug(message: str, *args):
     if _debug_enabled:
-        log(f"[DEBUG] {message}", "DEBUG")
+        log(f"[DEBUG] {message}", "DEBUG", args)
 
 
-def info(message: str):
-    log(message, "INFO")
+def info(message: str, *args):
+    log(message, "INFO", args)
 
 
-def warning(message: str):
-    log(f"[WARNING] {message}", "WARNING")
+def warning(message: str, *args):
+    log(f"[WARNING] {message}", "WARNING", args)
 
 
-def error(message: str):
-    log(f"[ERROR] {message}", "ERROR")
\ No newline at end of file
+def error(message: str, *args):
+    log(f"[ERROR] {message}", "ERROR", args)
@@ -0,0 +1,146 @@
+import math
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class LatencyHistogram:
+    # 20 log-spaced buckets per decade from 10us to 100s (~12% resolution)
+    MIN_SECONDS = 1e-5
+    BUCKETS_PER_DECADE = 20
+    DECADES = 7
+
+    def __init__(self):
+        self._bucket_count = self.BUCKETS_PER_DECADE * self.DECADES + 2
+        self._counts: List[int] = [0] * self._bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = int(math.log10(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_DECADE) + 1
+            if index >= self._bucket_count:
+                index = self._bucket_count - 1
+
+        self._counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def _bucket_upper_bound(self, index: int) -> float:
+        return self.MIN_SECONDS * 10 ** (index / self.BUCKETS_PER_DECADE)
+
+    def percentile(self, p: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        target = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    def reset(self):
+        self._counts = [0] * self._bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class PerfMetrics:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.perf_counter()
+
+    def record(self, stage: str, seconds: float):
+        if not self.enabled:
+            return
+
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(seconds)
+
+    def measure(self, stage: str) -> "_StageTimer":
+        return _StageTimer(self, stage)
+
+    def get_histogram(self, stage: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get(stage)
+
+    def get_percentiles(self, stage: str) -> dict:
+        histogram = self._histograms.get(stage)
+        if histogram is None or histogram.count == 0:
+            return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+        return {
+            'count': histogram.count,
+            'mean': histogram.mean(),
+            'p50': histogram.percentile(50),
+            'p95': histogram.percentile(95),
+            'p99': histogram.percentile(99),
+            'max': histogram.max
+        }
+
+    def get_stages(self) -> List[str]:
+        with self._lock:
+            return sorted(self._histograms)
+
+    def snapshot(self) -> dict:
+        return {stage: self.get_percentiles(stage) for stage in self.get_stages()}
+
+    def get_uptime_seconds(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+        self._started_at = time.perf_counter()
+
+    def show(self):
+        stages = self.get_stages()
+        if not stages:
+            return
+
+        print("\n" + "=" * 72)
+        print("⏱️ PERFORMANCE (ms)")
+        print("=" * 72)
+        print(f"  {'stage':<30}{'count':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+        for stage in stages:
+            p = self.get_percentiles(stage)
+            print(
+                f"  {stage:<30}{p['count']:>8}"
+                f"{p['p50'] * 1000:>8.2f}{p['p95'] * 1000:>8.2f}"
+                f"{p['p99'] * 1000:>8.2f}{p['max'] * 1000:>8.2f}"
+            )
+        print("=" * 72)
+
+
+class _StageTimer:
+    __slots__ = ('_metrics', '_stage', '_start')
+
+    def __init__(self, metrics: PerfMetrics, stage: str):
+        self._metrics = metrics
+        self._stage = stage
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._metrics.record(self._stage, time.perf_counter() - self._start)
+        return False
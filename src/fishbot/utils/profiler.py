@@ -0,0 +1,127 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+from src.fishbot.utils.logger import log, get_log_dir
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005, top_n: int = 30, max_depth: int = 128):
+        self.interval = interval
+        self.top_n = top_n
+        self.max_depth = max_depth
+        self._stacks: Counter = Counter()
+        self._labels = {}
+        self._target_thread: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._started_at = 0.0
+        self._samples = 0
+        self._missed = 0
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self, thread_id: int = None):
+        if self._running:
+            return
+
+        self._target_thread = thread_id if thread_id is not None else threading.get_ident()
+        self._stacks = Counter()
+        self._samples = 0
+        self._missed = 0
+        self._started_at = time.perf_counter()
+        self._running = True
+        self._thread = threading.Thread(target=self._sample_loop, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        log(f"[PROFILER] 🔬 Sampling started ({self.interval * 1000:.0f} ms interval)")
+
+    def stop(self, output_dir: str = None) -> Optional[Tuple[str, str]]:
+        if not self._running:
+            return None
+
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+        duration = time.perf_counter() - self._started_at
+        if not self._stacks:
+            log("[PROFILER] No samples collected")
+            return None
+
+        return self._write_reports(output_dir or os.path.join(get_log_dir(), "profiles"), duration)
+
+    def toggle(self, thread_id: int = None):
+        if self._running:
+            return self.stop()
+        self.start(thread_id)
+        return None
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.basename(code.co_filename)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(';', ':')
+            self._labels[code] = label
+        return label
+
+    def _sample_loop(self):
+        own_thread = threading.get_ident()
+        while self._running:
+            frame = sys._current_frames().get(self._target_thread)
+            if frame is None or self._target_thread == own_thread:
+                self._missed += 1
+            else:
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                self._stacks[tuple(stack)] += 1
+                self._samples += 1
+            del frame
+            time.sleep(self.interval)
+
+    def _write_reports(self, output_dir: str, duration: float) -> Optional[Tuple[str, str]]:
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        collapsed_path = os.path.join(output_dir, f"profile_{stamp}.collapsed")
+        summary_path = os.path.join(output_dir, f"profile_{stamp}_summary.txt")
+
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self._stacks.items():
+            self_counts[stack[-1]] += count
+            for label in set(stack):
+                total_counts[label] += count
+
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+
+            with open(collapsed_path, 'w', encoding='utf-8') as f:
+                for stack, count in self._stacks.most_common():
+                    f.write(f"{';'.join(stack)} {count}\n")
+
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                f.write(f"Samples: {self._samples} (missed: {self._missed})\n")
+                f.write(f"Duration: {duration:.1f}s | Interval: {self.interval * 1000:.1f} ms\n\n")
+
+                f.write(f"Top {self.top_n} by self samples\n")
+                f.write(f"{'self%':>8}{'self':>8}  function\n")
+                for label, count in self_counts.most_common(self.top_n):
+                    f.write(f"{count / self._samples * 100:>7.1f}%{count:>8}  {label}\n")
+
+                f.write(f"\nTop {self.top_n} by total samples\n")
+                f.write(f"{'total%':>8}{'total':>8}  function\n")
+                for label, count in total_counts.most_common(self.top_n):
+                    f.write(f"{count / self._samples * 100:>7.1f}%{count:>8}  {label}\n")
+        except Exception as e:
+            log(f"[PROFILER] Failed to write profile: {e}")
+            return None
+
+        log(f"[PROFILER] 💾 {self._samples} samples written to {collapsed_path}")
+        log(f"[PROFILER] 💾 Summary: {summary_path}")
+        return collapsed_path, summary_path
@@ -0,0 +1,116 @@
+import os
+import time
+from typing import List, Optional, Tuple
+
+import cv2 as cv
+import numpy as np
+
+from src.fishbot.utils.logger import log
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+class ReplayCapture:
+    def __init__(self, source: str, loop: bool = True):
+        self.source = source
+        self.loop = loop
+        self.monitor = None
+        self.cpu_time: float = 0
+        # Frames are decoded on demand so long recordings don't have to fit in memory
+        self._paths: List[str] = []
+        self._video: Optional[cv.VideoCapture] = None
+        self._size: Optional[Tuple[int, int]] = None
+        self._index = 0
+        self._frame_id = 0
+        self._running = False
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        if self._size is None:
+            self._open()
+        return self._size
+
+    def start(self):
+        if self._running:
+            return
+        if self._size is None or (not self._paths and self._video is None):
+            self._open()
+        self._rewind()
+        self._running = True
+
+    def stop(self):
+        self._running = False
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+
+    def update_monitor(self, monitor: dict):
+        self.monitor = monitor
+
+    def get_latest_frame(self) -> Optional[np.ndarray]:
+        frame, _, _ = self.get_latest_frame_info()
+        return frame
+
+    def get_latest_frame_info(self) -> Tuple[Optional[np.ndarray], float, int]:
+        if not self._running:
+            return None, 0, 0
+
+        frame = self._read_next()
+        if frame is None and self.loop:
+            self._rewind()
+            frame = self._read_next()
+        if frame is None:
+            self._running = False
+            log("[REPLAY] End of replay reached")
+            return None, 0, 0
+
+        self._frame_id += 1
+        return frame, time.perf_counter(), self._frame_id
+
+    def get_frames_captured(self) -> int:
+        return self._frame_id
+
+    def wait_for_frame(self, timeout: float = None) -> bool:
+        return self._running
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _open(self):
+        if os.path.isdir(self.source):
+            self._paths = [os.path.join(self.source, name) for name in sorted(os.listdir(self.source))
+                           if name.lower().endswith(IMAGE_EXTENSIONS)]
+            count = len(self._paths)
+        else:
+            self._video = cv.VideoCapture(self.source)
+            count = int(self._video.get(cv.CAP_PROP_FRAME_COUNT)) if self._video.isOpened() else 0
+
+        self._index = 0
+        first = self._read_next()
+        if first is None:
+            raise ValueError(f"No replay frames found in '{self.source}'")
+        self._rewind()
+
+        height, width = first.shape[:2]
+        self._size = (width, height)
+        log(f"[REPLAY] ✅ Opened {count} frames ({width}x{height}) from {self.source}")
+
+    def _rewind(self):
+        self._index = 0
+        if self._video is not None:
+            self._video.set(cv.CAP_PROP_POS_FRAMES, 0)
+
+    def _read_next(self) -> Optional[np.ndarray]:
+        if self._video is not None:
+            ok, img = self._video.read()
+            return img if ok else None
+
+        while self._index < len(self._paths):
+            path = self._paths[self._index]
+            img = cv.imread(path, cv.IMREAD_COLOR)
+            if img is not None:
+                self._index += 1
+                return img
+            log(f"[REPLAY] ❌ Failed to read {os.path.basename(path)}")
+            del self._paths[self._index]
+        return None
@@ -0,0 +1,64 @@
+import threading
+import time
+from typing import List, Tuple
+
+from src.fishbot.utils.logger import log
+
+
+class StartupProfile:
+    def __init__(self):
+        self._steps: List[Tuple[str, float, float, str]] = []
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._steps.clear()
+
+    def record(self, name: str, start: float, end: float):
+        with self._lock:
+            self._steps.append((name, start, end, threading.current_thread().name))
+
+    def step(self, name: str) -> "_Step":
+        return _Step(self, name)
+
+    def report(self, title: str = "Startup"):
+        with self._lock:
+            steps = sorted(self._steps, key=lambda step: step[1])
+            self._steps.clear()
+
+        if not steps:
+            return
+
+        origin = steps[0][1]
+        total = max(end for _, _, end, _ in steps) - origin
+        lines = [f"[STARTUP] ⏱️ {title}: {total * 1000:.0f} ms total"]
+        for name, start, end, thread_name in steps:
+            lines.append(
+                f"[STARTUP]   {name:<28}{(start - origin) * 1000:>8.0f} ms +{(end - start) * 1000:>7.1f} ms  {thread_name}"
+            )
+        for line in lines:
+            log(line)
+
+
+class _Step:
+    __slots__ = ('_profile', '_name', '_start')
+
+    def __init__(self, profile: StartupProfile, name: str):
+        self._profile = profile
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profile.record(self._name, self._start, time.perf_counter())
+        return False
+
+
+_profile = StartupProfile()
+
+
+def get_startup_profile() -> StartupProfile:
+    return _profile
@@ -0,0 +1,147 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from src.fishbot.utils.logger import log, get_log_dir
+
+
+class Tracer:
+    def __init__(self, enabled: bool = False, capacity: int = 100000, slow_tick_ms: float = 0,
+                 auto_flush_cooldown: float = 30.0):
+        self.enabled = enabled
+        self.slow_tick_ms = slow_tick_ms
+        self.auto_flush_cooldown = auto_flush_cooldown
+        self._events = deque(maxlen=capacity)
+        self._thread_names = {}
+        self._epoch = time.perf_counter()
+        self._pid = os.getpid()
+        self._last_auto_flush = 0.0
+        self._flush_lock = threading.Lock()
+
+    def configure(self, enabled: bool = None, capacity: int = None, slow_tick_ms: float = None):
+        if capacity is not None and capacity != self._events.maxlen:
+            self._events = deque(self._events, maxlen=capacity)
+        if slow_tick_ms is not None:
+            self.slow_tick_ms = slow_tick_ms
+        if enabled is not None:
+            self.enabled = enabled
+
+    def _thread_id(self) -> int:
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def complete(self, name: str, category: str, start: float, end: float, args: dict = None):
+        if not self.enabled:
+            return
+        self._events.append(('X', name, category, start, end - start, self._thread_id(), args))
+
+    def instant(self, name: str, category: str, args: dict = None):
+        if not self.enabled:
+            return
+        self._events.append(('i', name, category, time.perf_counter(), 0.0, self._thread_id(), args))
+
+    def span(self, name: str, category: str, args: dict = None) -> "_Span":
+        return _Span(self, name, category, args)
+
+    def end_tick(self, start: float, end: float):
+        if not self.enabled:
+            return
+
+        self._events.append(('X', "tick", "bot", start, end - start, self._thread_id(), None))
+
+        if self.slow_tick_ms > 0 and (end - start) * 1000 >= self.slow_tick_ms:
+            if end - self._last_auto_flush >= self.auto_flush_cooldown:
+                self._last_auto_flush = end
+                self.instant("slow_tick", "bot", {'ms': round((end - start) * 1000, 2)})
+                self.flush(reason="slowtick", background=True)
+
+    def clear(self):
+        self._events.clear()
+
+    def flush(self, path: str = None, reason: str = "manual", background: bool = False) -> Optional[str]:
+        events = list(self._events)
+        if not events:
+            log("[TRACE] No trace events recorded")
+            return None
+
+        if path is None:
+            trace_dir = os.path.join(get_log_dir(), "traces")
+            stamp = time.strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(trace_dir, f"trace_{stamp}_{reason}.json")
+
+        thread_names = dict(self._thread_names)
+
+        if background:
+            threading.Thread(
+                target=self._write, args=(path, events, thread_names), name="TraceWriter", daemon=True
+            ).start()
+            return path
+
+        return self._write(path, events, thread_names)
+
+    def _write(self, path: str, events: list, thread_names: dict) -> Optional[str]:
+        trace_events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in thread_names.items()
+        ]
+
+        for phase, name, category, start, duration, tid, args in events:
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': phase,
+                'ts': round((start - self._epoch) * 1e6, 1),
+                'pid': self._pid,
+                'tid': tid
+            }
+            if phase == 'X':
+                event['dur'] = round(duration * 1e6, 1)
+            else:
+                event['s'] = 't'
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+
+        try:
+            with self._flush_lock:
+                parent_dir = os.path.dirname(path)
+                if parent_dir:
+                    os.makedirs(parent_dir, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+            log(f"[TRACE] 💾 Wrote {len(events)} events to {path}")
+            return path
+        except Exception as e:
+            log(f"[TRACE] Failed to write trace: {e}")
+            return None
+
+
+class _Span:
+    __slots__ = ('_tracer', '_name', '_category', '_args', '_start')
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict = None):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._tracer.complete(self._name, self._category, self._start, time.perf_counter(), self._args)
+        return False
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer